@@ -1,9 +1,19 @@
 """RESPOND API Main Application."""
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from config.settings import settings
+from src.qdrant.client import is_embedded_mode
+from src.qdrant.collections import setup_all_collections
+from src.embeddings.cache import flush_embedding_cache
+from src.ingestion.dedup_index import get_dedup_index
+from src.qdrant.write_buffer import flush_payload_writes
+from src.search.geo_search import get_geo_index
+from src.search.temporal_search import get_temporal_index
 from api.routes.setup import router as setup_router
 from api.routes.ingest import router as ingest_router
 from api.routes.search import router as search_router
@@ -13,11 +23,31 @@ from api.routes.images import router as images_router
 from api.routes.image_search import router as image_search_router
 from api.routes.audio import router as audio_router
 from api.routes.deployments import router as deployments_router
+from api.routes.stream import router as stream_router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks."""
+    # Embedded Qdrant starts empty (memory) or on a fresh path (local)
+    if is_embedded_mode():
+        setup_all_collections()
+    # Build the in-memory indexes up front so the first query doesn't pay for it
+    await asyncio.to_thread(get_geo_index)
+    await asyncio.to_thread(get_temporal_index)
+    await asyncio.to_thread(get_dedup_index)
+    yield
+    # Write out buffered payload updates before the process exits
+    await asyncio.to_thread(flush_payload_writes)
+    # Persist embeddings written to the disk tier since the last writeback
+    await asyncio.to_thread(flush_embedding_cache)
+
 
 app = FastAPI(
     title=settings.APP_NAME,
     description="Real-time Emergency System for Priority-Ordered Neighborhood Dispatch",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # CORS middleware for frontend
@@ -47,6 +77,7 @@ app.include_router(images_router)
 app.include_router(image_search_router)
 app.include_router(audio_router)
 app.include_router(deployments_router)
+app.include_router(stream_router)
 
 
 @app.get("/health")
@@ -9,6 +9,7 @@ from pydantic import BaseModel
 from config.qdrant_config import INCIDENT_IMAGES
 from src.embeddings.image_embedder import ImageEmbedder
 from src.qdrant.client import get_qdrant_client
+from src.search.filters import build_search_filter
 from src.utils.logger import get_logger
 
 router = APIRouter(prefix="/search", tags=["images"])
@@ -63,25 +64,10 @@ async def search_images(request: ImageSearchRequest):
         client = get_qdrant_client()
         
         # Build filter if specified
-        filter_conditions = []
-        
-        if request.zone_id:
-            from qdrant_client.models import FieldCondition, MatchValue
-            filter_conditions.append(
-                FieldCondition(key="zone_id", match=MatchValue(value=request.zone_id))
-            )
-        
-        if request.image_type:
-            from qdrant_client.models import FieldCondition, MatchValue
-            filter_conditions.append(
-                FieldCondition(key="image_type", match=MatchValue(value=request.image_type))
-            )
-        
-        # Build Qdrant filter
-        qdrant_filter = None
-        if filter_conditions:
-            from qdrant_client.models import Filter
-            qdrant_filter = Filter(must=filter_conditions)
+        qdrant_filter = build_search_filter(
+            zone_id=request.zone_id or None,
+            image_type=request.image_type or None,
+        )
         
         # Search
         results_obj = client.query_points(
@@ -158,18 +144,12 @@ async def get_incident_images(incident_id: str):
         List of images for this incident.
     """
     try:
-        from qdrant_client.models import Filter, FieldCondition, MatchValue
-        
         client = get_qdrant_client()
         
         # Filter by incident_id
         results = client.scroll(
             collection_name=INCIDENT_IMAGES,
-            scroll_filter=Filter(
-                must=[
-                    FieldCondition(key="incident_id", match=MatchValue(value=incident_id))
-                ]
-            ),
+            scroll_filter=build_search_filter(incident_id=incident_id),
             limit=50,
             with_payload=True,
             with_vectors=False,
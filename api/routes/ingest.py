@@ -1,10 +1,20 @@
 """Ingest routes for RESPOND API."""
 
-from fastapi import APIRouter, HTTPException
+import json
 
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+
+from config.settings import settings
 from api.schemas.request_models import IncidentIngestRequest
-from api.schemas.response_models import IngestResponse
-from src.ingestion import SmartIncidentIngester
+from api.schemas.response_models import (
+    IngestResponse,
+    BulkIngestItemResult,
+    BulkIngestResponse,
+)
+from src.ingestion import IncidentIngester, SmartIncidentIngester, get_dedup_index
+from src.ingestion.smart_ingester import get_dedup_batcher
 from src.utils.logger import get_logger
 
 router = APIRouter(prefix="/ingest", tags=["ingest"])
@@ -32,8 +42,8 @@ async def ingest_incident(request: IncidentIngestRequest):
         # Convert request to dict
         data = request.model_dump(exclude_none=True)
         
-        # Smart ingest with auto-deduplication
-        result = ingester.ingest(data)
+        # Smart ingest with auto-deduplication (off the event loop)
+        result = await run_in_threadpool(ingester.ingest, data)
         
         _logger.info(
             f"API ingested incident {result['incident_id'][:8]}... "
@@ -52,3 +62,137 @@ async def ingest_incident(request: IncidentIngestRequest):
         _logger.error(f"Ingest error: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+
+def _parse_bulk_body(body: bytes, content_type: str) -> list[tuple[object, str | None]]:
+    """Parse a bulk ingestion body as a JSON array or NDJSON.
+    
+    Args:
+        body: Raw request body.
+        content_type: Request Content-Type header.
+    
+    Returns:
+        List of (item, parse_error) tuples; malformed NDJSON lines are kept
+        as per-item errors instead of failing the whole request.
+    
+    Raises:
+        ValueError: If a JSON array body is malformed.
+    """
+    text = body.decode("utf-8")
+    is_ndjson = "ndjson" in content_type or "jsonlines" in content_type
+    
+    if not is_ndjson:
+        stripped = text.lstrip()
+        if stripped.startswith("["):
+            try:
+                items = json.loads(stripped)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON array: {e}")
+            return [(item, None) for item in items]
+    
+    parsed = []
+    for line_no, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            parsed.append((json.loads(line), None))
+        except json.JSONDecodeError as e:
+            parsed.append((None, f"line {line_no}: invalid JSON: {e}"))
+    return parsed
+
+
+@router.post("/incidents/bulk", response_model=BulkIngestResponse)
+async def ingest_incidents_bulk(request: Request, dedup: bool = False):
+    """Ingest many incident reports in one request.
+    
+    Accepts either a JSON array of incidents or NDJSON (one incident per
+    line, Content-Type: application/x-ndjson). Each item is validated on its
+    own, texts are embedded in batches, and points are written with batched
+    parallel upserts. Intended for backlog replay, so no deduplication is
+    done unless dedup=true; then items are deduplicated against recent
+    incidents and each other, per zone, like single ingests.
+    
+    Args:
+        request: Raw request with a JSON array or NDJSON body.
+        dedup: Deduplicate items instead of creating one incident each.
+    
+    Returns:
+        BulkIngestResponse with per-item results in input order.
+    """
+    try:
+        body = await request.body()
+        parsed = _parse_bulk_body(body, request.headers.get("content-type", ""))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if not parsed:
+        raise HTTPException(status_code=400, detail="No incidents provided")
+    
+    if len(parsed) > settings.BULK_INGEST_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many incidents: {len(parsed)} > {settings.BULK_INGEST_MAX_ITEMS}",
+        )
+    
+    try:
+        results: list[dict | None] = [None] * len(parsed)
+        valid_indexes = []
+        valid_items = []
+        
+        # Validate each item against the single-incident schema
+        for index, (item, parse_error) in enumerate(parsed):
+            if parse_error:
+                results[index] = {"index": index, "status": "error", "error": parse_error}
+                continue
+            try:
+                model = IncidentIngestRequest.model_validate(item)
+            except ValidationError as e:
+                error = "; ".join(
+                    f"{'.'.join(str(part) for part in err['loc']) or 'item'}: {err['msg']}"
+                    for err in e.errors()
+                )
+                results[index] = {"index": index, "status": "error", "error": error}
+                continue
+            valid_indexes.append(index)
+            valid_items.append(model.model_dump(exclude_none=True))
+        
+        # Batched embedding + upsert (per-zone dedup batches if requested)
+        ingester = SmartIncidentIngester() if dedup else IncidentIngester()
+        ingested = await run_in_threadpool(ingester.ingest_many, valid_items)
+        for index, result in zip(valid_indexes, ingested):
+            results[index] = {**result, "index": index}
+        
+        items = [BulkIngestItemResult(**r) for r in results]
+        created = sum(1 for r in items if r.status == "created")
+        deduplicated = sum(1 for r in items if r.status == "deduplicated")
+        
+        _logger.info(
+            f"API bulk ingested {created}/{len(items)} incidents "
+            f"({deduplicated} deduplicated)"
+        )
+        
+        return BulkIngestResponse(
+            total=len(items),
+            created=created,
+            deduplicated=deduplicated,
+            failed=len(items) - created - deduplicated,
+            results=items,
+        )
+    
+    except Exception as e:
+        _logger.error(f"Bulk ingest error: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/stats")
+async def ingest_stats():
+    """Get dedup index and dedup batching statistics.
+    
+    Returns:
+        Dict with lookups, hits per stage (exact, minhash, vector, batch),
+        misses, fallback hits, hit_rate, indexed incidents and 'batching'
+        (dedup batches and reports per batch).
+    """
+    index = await run_in_threadpool(get_dedup_index)
+    if index is None:
+        raise HTTPException(status_code=503, detail="Dedup index is disabled")
+    return {**index.stats(), "batching": get_dedup_batcher().stats()}
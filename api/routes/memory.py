@@ -1,11 +1,14 @@
 """Memory routes for RESPOND API."""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
 from config.qdrant_config import SUPPORTED_SOURCE_TYPES
-from src.memory import MemoryManager
+from src.memory import MemoryManager, get_reinforcement_stats
 from src.memory.evolution import is_valid_transition, ALLOWED_STATUS_TRANSITIONS
+from src.qdrant.points import VersionConflictError
+from src.qdrant.write_buffer import get_payload_buffer
 from src.utils.logger import get_logger
 
 router = APIRouter(prefix="/memory", tags=["memory"])
@@ -42,6 +45,39 @@ class ReinforceResponse(BaseModel):
     reinforced_count: int
 
 
+class BatchReinforceRequest(BaseModel):
+    """Request model for batch reinforcement."""
+    evidence: list[ReinforceRequest]
+
+
+class BatchReinforceItem(BaseModel):
+    """Result for a single piece of evidence in a batch."""
+    source_type: str
+    similarity: float
+    accepted: bool
+    new_confidence: float
+
+
+class BatchReinforceResponse(BaseModel):
+    """Response model for batch reinforcement."""
+    incident_id: str
+    old_confidence: float
+    new_confidence: float
+    reinforced_count: int
+    results: list[BatchReinforceItem]
+
+
+class EvidencePageResponse(BaseModel):
+    """Response model for a page of an incident's evidence chain."""
+    incident_id: str
+    total: int
+    offset: int
+    limit: int
+    newest_first: bool
+    summary: dict
+    items: list[dict]
+
+
 @router.patch("/incident/{incident_id}/status", response_model=StatusUpdateResponse)
 async def update_incident_status(incident_id: str, request: StatusUpdateRequest):
     """Update incident status with evolution rules.
@@ -56,7 +92,7 @@ async def update_incident_status(incident_id: str, request: StatusUpdateRequest)
     manager = MemoryManager()
     
     # Get existing incident
-    incident = manager.get_incident(incident_id)
+    incident = await run_in_threadpool(manager.get_incident, incident_id)
     if not incident:
         _logger.warning(f"Incident {incident_id} not found")
         raise HTTPException(status_code=404, detail="Incident not found")
@@ -74,7 +110,12 @@ async def update_incident_status(incident_id: str, request: StatusUpdateRequest)
         )
     
     # Update status
-    success = manager.update_incident_payload(incident_id, {"status": new_status})
+    success = await run_in_threadpool(
+        manager.update_incident_payload,
+        incident_id,
+        {"status": new_status},
+        incident["payload"].get("zone_id"),
+    )
     if not success:
         raise HTTPException(status_code=500, detail="Failed to update status")
     
@@ -112,7 +153,8 @@ async def reinforce_incident(incident_id: str, request: ReinforceRequest):
     manager = MemoryManager()
     
     try:
-        result = manager.reinforce(
+        result = await run_in_threadpool(
+            manager.reinforce,
             incident_id=incident_id,
             new_source_type=request.source_type,
             new_text=request.text,
@@ -126,6 +168,115 @@ async def reinforce_incident(incident_id: str, request: ReinforceRequest):
         if "not found" in str(e):
             raise HTTPException(status_code=404, detail="Incident not found")
         raise HTTPException(status_code=400, detail=str(e))
+    except VersionConflictError as e:
+        _logger.warning(str(e))
+        raise HTTPException(status_code=409, detail="Incident is being updated concurrently, retry")
     except Exception as e:
         _logger.error(f"Reinforcement error: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.post("/incident/{incident_id}/reinforce/batch", response_model=BatchReinforceResponse)
+async def reinforce_incident_batch(incident_id: str, request: BatchReinforceRequest):
+    """Reinforce incident with several pieces of evidence in one call.
+    
+    Args:
+        incident_id: Incident UUID.
+        request: List of evidence items.
+    
+    Returns:
+        BatchReinforceResponse with per-evidence similarity and final confidence.
+    """
+    # Validate input
+    if not request.evidence:
+        raise HTTPException(status_code=400, detail="evidence cannot be empty")
+    
+    for item in request.evidence:
+        if not item.text or not item.text.strip():
+            raise HTTPException(status_code=400, detail="text cannot be empty")
+        if item.source_type not in SUPPORTED_SOURCE_TYPES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"source_type must be one of {SUPPORTED_SOURCE_TYPES}",
+            )
+    
+    manager = MemoryManager()
+    
+    try:
+        result = await run_in_threadpool(
+            manager.reinforce_batch,
+            incident_id=incident_id,
+            evidence=[item.model_dump() for item in request.evidence],
+        )
+        
+        _logger.info(f"Batch reinforcement for {incident_id}: {len(result['results'])} items")
+        
+        return BatchReinforceResponse(**result)
+    
+    except ValueError as e:
+        if "not found" in str(e):
+            raise HTTPException(status_code=404, detail="Incident not found")
+        raise HTTPException(status_code=400, detail=str(e))
+    except VersionConflictError as e:
+        _logger.warning(str(e))
+        raise HTTPException(status_code=409, detail="Incident is being updated concurrently, retry")
+    except Exception as e:
+        _logger.error(f"Batch reinforcement error: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/incident/{incident_id}/evidence", response_model=EvidencePageResponse)
+async def get_incident_evidence(
+    incident_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1),
+    newest_first: bool = True,
+):
+    """Get a page of an incident's full evidence chain.
+    
+    Search results only carry the most recent evidence; this pages through
+    all of it.
+    
+    Args:
+        incident_id: Incident UUID.
+        offset: Entries to skip (from the newest if newest_first).
+        limit: Page size (up to EVIDENCE_PAGE_MAX).
+        newest_first: Page from the newest entry backwards.
+    
+    Returns:
+        EvidencePageResponse with the page and evidence summary.
+    """
+    manager = MemoryManager()
+    
+    try:
+        result = await run_in_threadpool(
+            manager.get_evidence,
+            incident_id,
+            offset=offset,
+            limit=limit,
+            newest_first=newest_first,
+        )
+        return EvidencePageResponse(**result)
+    
+    except ValueError as e:
+        if "not found" in str(e):
+            raise HTTPException(status_code=404, detail="Incident not found")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        _logger.error(f"Evidence retrieval error: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/stats")
+async def memory_stats():
+    """Get reinforcement and buffered payload write statistics.
+    
+    Returns:
+        Dict with write combining stats, version conflict count and
+        write buffer stats (None if disabled).
+    """
+    buffer = get_payload_buffer()
+    return {
+        **get_reinforcement_stats(),
+        "write_buffer": buffer.stats() if buffer is not None else None,
+    }
@@ -1,6 +1,7 @@
 """Recommendation routes for RESPOND API."""
 
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
 from src.recommendation import ActionRecommender
@@ -30,7 +31,8 @@ async def recommend_actions(request: RecommendActionsRequest):
     try:
         recommender = ActionRecommender()
         
-        result = recommender.recommend_actions(
+        result = await run_in_threadpool(
+            recommender.recommend_actions,
             query=request.query,
             limit=request.limit,
             zone_id=request.zone_id,
@@ -1,16 +1,39 @@
 """Search routes for RESPOND API."""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 
-from api.schemas.request_models import IncidentSearchRequest
-from api.schemas.response_models import SearchResponse, SearchResultItem
-from src.search import HybridSearcher
+from api.schemas.request_models import IncidentBatchSearchRequest, IncidentSearchRequest
+from api.schemas.response_models import BatchSearchResponse, SearchResponse, SearchResultItem
+from config.qdrant_config import SITUATION_REPORTS
+from config.settings import settings
+from src.qdrant.points import retrieve_async
+from src.search import HybridSearcher, get_geo_index, get_rerank_stats, get_temporal_index
+from src.search.filters import get_filter_plan_stats
+from src.search.result_cache import get_search_cache
 from src.utils.logger import get_logger
 
 router = APIRouter(prefix="/search", tags=["search"])
 _logger = get_logger("api.search")
 
 
+def _to_search_response(results: list[dict]) -> SearchResponse:
+    """Convert reranked search results to the response model."""
+    result_items = [
+        SearchResultItem(
+            id=str(r["id"]),
+            score=float(r["score"]),
+            payload=r["payload"],
+            final_score=float(r["final_score"]),
+            decay_factor=float(r["decay_factor"]),
+            age_seconds=int(r["age_seconds"]),
+            evidence=r["evidence"],
+        )
+        for r in results
+    ]
+    return SearchResponse(count=len(result_items), results=result_items)
+
+
 @router.post("/incidents", response_model=SearchResponse)
 async def search_incidents(request: IncidentSearchRequest):
     """Search incidents with semantic similarity, filters, decay, and evidence.
@@ -25,7 +48,7 @@ async def search_incidents(request: IncidentSearchRequest):
         searcher = HybridSearcher()
         
         # Execute search (includes decay reranking and evidence)
-        results = searcher.search_incidents(
+        results = await searcher.search_incidents_async(
             query=request.query,
             limit=request.limit,
             zone_id=request.zone_id,
@@ -36,26 +59,11 @@ async def search_incidents(request: IncidentSearchRequest):
             radius_km=request.radius_km,
         )
         
-        # Convert to response model
-        result_items = [
-            SearchResultItem(
-                id=str(r["id"]),
-                score=float(r["score"]),
-                payload=r["payload"],
-                final_score=float(r["final_score"]),
-                decay_factor=float(r["decay_factor"]),
-                age_seconds=int(r["age_seconds"]),
-                evidence=r["evidence"],
-            )
-            for r in results
-        ]
+        response = _to_search_response(results)
         
-        _logger.info(f"API search returned {len(result_items)} results")
+        _logger.info(f"API search returned {response.count} results")
         
-        return SearchResponse(
-            count=len(result_items),
-            results=result_items,
-        )
+        return response
     
     except ValueError as e:
         _logger.error(f"Search validation error: {e}")
@@ -63,3 +71,291 @@ async def search_incidents(request: IncidentSearchRequest):
     except Exception as e:
         _logger.error(f"Search error: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.post("/incidents/batch", response_model=BatchSearchResponse)
+async def search_incidents_batch(request: IncidentBatchSearchRequest):
+    """Run several incident searches at once (e.g. a dashboard's canned queries).
+    
+    All query texts are embedded in one batch and the searches go to Qdrant
+    as one batch request; each search keeps its own filters and limit.
+    
+    Args:
+        request: List of search parameters.
+    
+    Returns:
+        BatchSearchResponse with one SearchResponse per search, in order.
+    """
+    if not request.searches:
+        raise HTTPException(status_code=400, detail="No searches provided")
+    if len(request.searches) > settings.SEARCH_BATCH_MAX_QUERIES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many searches (max {settings.SEARCH_BATCH_MAX_QUERIES})",
+        )
+    
+    try:
+        searcher = HybridSearcher()
+        
+        batch_results = await searcher.search_incidents_batch_async(
+            [search.model_dump() for search in request.searches]
+        )
+        
+        responses = [_to_search_response(results) for results in batch_results]
+        
+        _logger.info(f"API batch search ran {len(responses)} queries")
+        
+        return BatchSearchResponse(count=len(responses), results=responses)
+    
+    except ValueError as e:
+        _logger.error(f"Batch search validation error: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        _logger.error(f"Batch search error: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/stats")
+async def search_stats():
+    """Get over-fetch/rerank and result cache statistics.
+    
+    Returns:
+        Dict with 'rerank' (query counts, how often decay reranking changed
+        the top-k, how often the candidate set was widened, and average
+        candidates fetched per query), 'cache' (result cache hit rate and
+        invalidations, None if disabled) and 'filters' (filter plan reuse).
+    """
+    cache = get_search_cache()
+    return {
+        "rerank": get_rerank_stats(),
+        "cache": cache.stats() if cache is not None else None,
+        "filters": get_filter_plan_stats(),
+    }
+
+
+async def _require_geo_index():
+    """Get the geo index (built off the event loop on first use)."""
+    index = await run_in_threadpool(get_geo_index)
+    if index is None:
+        raise HTTPException(status_code=503, detail="Geo index is disabled")
+    return index
+
+
+@router.get("/geo/nearest")
+async def geo_nearest(
+    lat: float,
+    lon: float,
+    k: int = Query(10, ge=1, le=1000),
+    max_radius_km: float | None = Query(None, gt=0),
+    zone_id: str | None = None,
+    urgency: str | None = None,
+    status: str | None = None,
+    last_hours: int | None = Query(None, ge=1),
+    with_payload: bool = False,
+):
+    """Find the incidents closest to a point, without a vector query.
+    
+    Args:
+        lat: Query latitude.
+        lon: Query longitude.
+        k: Number of incidents to return.
+        max_radius_km: Optional maximum distance.
+        zone_id: Filter by zone ID.
+        urgency: Filter by urgency level.
+        status: Filter by status.
+        last_hours: Filter to incidents within last N hours.
+        with_payload: Also fetch each incident's full payload.
+    
+    Returns:
+        Dict with count and results (id, lat, lon, distance_km, zone_id,
+        urgency, status, timestamp_unix, and payload if requested).
+    """
+    index = await _require_geo_index()
+    try:
+        results = index.nearest(
+            lat, lon, k,
+            max_radius_km=max_radius_km,
+            zone_id=zone_id,
+            urgency=urgency,
+            status=status,
+            last_hours=last_hours,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if with_payload and results:
+        records = await retrieve_async(SITUATION_REPORTS, [r["id"] for r in results])
+        payloads = {record["id"]: record["payload"] for record in records}
+        for result in results:
+            result["payload"] = payloads.get(result["id"])
+    
+    return {"count": len(results), "results": results}
+
+
+@router.get("/geo/count")
+async def geo_count(
+    min_lat: float,
+    min_lon: float,
+    max_lat: float,
+    max_lon: float,
+    zone_id: str | None = None,
+    urgency: str | None = None,
+    status: str | None = None,
+    last_hours: int | None = Query(None, ge=1),
+):
+    """Count incidents inside a bounding box (min_lon > max_lon crosses the antimeridian).
+    
+    Returns:
+        Dict with count, by_urgency and by_status.
+    """
+    index = await _require_geo_index()
+    try:
+        return index.count_bbox(
+            min_lat, min_lon, max_lat, max_lon,
+            zone_id=zone_id,
+            urgency=urgency,
+            status=status,
+            last_hours=last_hours,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/geo/density")
+async def geo_density(
+    min_lat: float,
+    min_lon: float,
+    max_lat: float,
+    max_lon: float,
+    precision_deg: float | None = Query(None, gt=0, le=45),
+    zone_id: str | None = None,
+    urgency: str | None = None,
+    status: str | None = None,
+    last_hours: int | None = Query(None, ge=1),
+):
+    """Aggregate incidents in a bounding box into heatmap cells for the map view.
+    
+    Returns:
+        Dict with count (incidents), precision_deg and cells (center,
+        bounds, count, max_urgency, centroid).
+    """
+    index = await _require_geo_index()
+    try:
+        cells = index.density(
+            min_lat, min_lon, max_lat, max_lon,
+            precision_deg=precision_deg,
+            zone_id=zone_id,
+            urgency=urgency,
+            status=status,
+            last_hours=last_hours,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        "count": sum(cell["count"] for cell in cells),
+        "precision_deg": max(precision_deg or 0.0, index.stats()["cell_deg"]),
+        "cells": cells,
+    }
+
+
+@router.get("/geo/stats")
+async def geo_stats():
+    """Get geo index statistics.
+    
+    Returns:
+        Dict with indexed incidents, occupied cells, cell size and build time.
+    """
+    index = await _require_geo_index()
+    return index.stats()
+
+
+async def _require_temporal_index():
+    """Get the temporal index (built off the event loop on first use)."""
+    index = await run_in_threadpool(get_temporal_index)
+    if index is None:
+        raise HTTPException(status_code=503, detail="Temporal index is disabled")
+    return index
+
+
+@router.get("/temporal/histogram")
+async def temporal_histogram(
+    interval_seconds: int = Query(300, ge=1),
+    last_hours: float = Query(6.0, gt=0),
+    zone_id: str | None = None,
+    urgency: str | None = None,
+    status: str | None = None,
+    end_unix: float | None = None,
+):
+    """Count incidents per time interval (e.g. per 5 minutes over the last 6 hours).
+    
+    Returns:
+        Dict with interval_seconds, total and intervals (start, end, count,
+        by_urgency), oldest first.
+    """
+    index = await _require_temporal_index()
+    try:
+        return index.histogram(
+            interval_seconds=interval_seconds,
+            last_hours=last_hours,
+            zone_id=zone_id,
+            urgency=urgency,
+            status=status,
+            end_unix=end_unix,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/temporal/changes")
+async def temporal_changes(
+    since_unix: float,
+    zone_id: str | None = None,
+    urgency: str | None = None,
+    limit: int = Query(500, ge=1, le=5000),
+):
+    """List incident writes recorded after `since_unix`, oldest first.
+    
+    Poll with the returned `next_since` to follow changes incrementally.
+    
+    Returns:
+        Dict with changes, next_since, truncated and complete.
+    """
+    index = await _require_temporal_index()
+    return index.changes_since(since_unix, zone_id=zone_id, urgency=urgency, limit=limit)
+
+
+@router.get("/temporal/surges")
+async def temporal_surges(
+    window_minutes: float = Query(30.0, gt=0),
+    baseline_hours: float = Query(6.0, gt=0),
+    min_count: int = Query(3, ge=1),
+    min_ratio: float = Query(2.0, gt=0),
+    urgency: str | None = None,
+):
+    """Find zones whose recent report rate is well above their baseline.
+    
+    Returns:
+        Dict with count and zones (zone_id, recent/baseline counts and
+        rates, ratio), highest ratio first.
+    """
+    index = await _require_temporal_index()
+    zones = index.surges(
+        window_minutes=window_minutes,
+        baseline_hours=baseline_hours,
+        min_count=min_count,
+        min_ratio=min_ratio,
+        urgency=urgency,
+    )
+    return {"count": len(zones), "zones": zones}
+
+
+@router.get("/temporal/stats")
+async def temporal_stats():
+    """Get temporal index statistics.
+    
+    Returns:
+        Dict with indexed incidents, series, buckets, journal size and build time.
+    """
+    index = await _require_temporal_index()
+    return index.stats()
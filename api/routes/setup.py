@@ -2,13 +2,18 @@
 
 from fastapi import APIRouter
 
+from src.ingestion.dedup_index import reset_dedup_index
 from src.qdrant.collections import setup_all_collections
 from src.qdrant.client import get_qdrant_client
+from src.search.geo_search import reset_geo_index
+from src.search.result_cache import invalidate_search_cache
+from src.search.temporal_search import reset_temporal_index
 from config.qdrant_config import (
     SITUATION_REPORTS,
     DISASTER_EVENTS,
     RESOURCE_DEPLOYMENTS,
     HISTORICAL_PATTERNS,
+    INCIDENT_EVIDENCE,
 )
 
 router = APIRouter(tags=["setup"])
@@ -44,6 +49,7 @@ async def reset_collections():
         DISASTER_EVENTS,
         RESOURCE_DEPLOYMENTS,
         HISTORICAL_PATTERNS,
+        INCIDENT_EVIDENCE,
     ]
     
     deleted = []
@@ -56,6 +62,10 @@ async def reset_collections():
     
     # Recreate collections
     result = setup_all_collections()
+    invalidate_search_cache()
+    reset_geo_index()
+    reset_temporal_index()
+    reset_dedup_index()
     
     return {
         "status": "ok",
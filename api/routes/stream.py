@@ -0,0 +1,129 @@
+"""Live stream routes for RESPOND API."""
+
+import json
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from config.settings import settings
+from src.embeddings.text_embedder import TextEmbedder
+from src.stream import StreamFilter, get_incident_bus
+from src.utils.geo_utils import is_valid_lat_lon
+from src.utils.logger import get_logger
+
+router = APIRouter(prefix="/stream", tags=["stream"])
+_logger = get_logger("api.stream")
+
+
+def _format_sse(event: dict) -> str:
+    """Serialize a bus event as a server-sent event (vector omitted)."""
+    data = {k: v for k, v in event.items() if k != "vector"}
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.get("/incidents")
+async def stream_incidents(
+    request: Request,
+    zone_id: str | None = None,
+    urgency: str | None = None,
+    status: str | None = None,
+    last_hours: int | None = None,
+    lat: float | None = None,
+    lon: float | None = None,
+    radius_km: float | None = None,
+    query: str | None = None,
+    min_score: float = Query(0.5, ge=-1.0, le=1.0),
+):
+    """Stream incident changes as server-sent events.
+
+    Takes the same filters as /search/incidents (geo center as lat/lon).
+    With `query`, new incidents are only sent if their similarity to the
+    query is at least `min_score`. Once an incident has been sent, all
+    later changes to it (reinforcement, status, event assignment) are sent
+    too. Reconnecting clients resume via the Last-Event-ID header; a
+    `resync` event means some events were missed and the client should
+    re-run its search.
+
+    Args:
+        request: Incoming request (for disconnect detection and Last-Event-ID).
+        zone_id: Filter by zone ID.
+        urgency: Filter by urgency level.
+        status: Filter by status.
+        last_hours: Filter to incidents within last N hours.
+        lat: Geo center latitude.
+        lon: Geo center longitude.
+        radius_km: Radius in kilometers for geo filtering.
+        query: Optional semantic query.
+        min_score: Minimum similarity to `query`.
+
+    Returns:
+        text/event-stream response.
+    """
+    center = None
+    if lat is not None and lon is not None:
+        if not is_valid_lat_lon(lat, lon):
+            raise HTTPException(status_code=400, detail="Invalid lat/lon")
+        center = {"lat": lat, "lon": lon}
+
+    query_vector = None
+    if query:
+        try:
+            query_vector = await TextEmbedder().embed_text_async(query)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    last_event_id = request.headers.get("last-event-id")
+    try:
+        last_event_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        last_event_id = None
+
+    stream_filter = StreamFilter(
+        zone_id=zone_id,
+        urgency=urgency,
+        status=status,
+        last_hours=last_hours,
+        center=center,
+        radius_km=radius_km,
+        query_vector=query_vector,
+        min_score=min_score,
+    )
+    subscription = get_incident_bus().subscribe(stream_filter, last_event_id=last_event_id)
+
+    async def event_source():
+        try:
+            # Tell the client how long to wait before reconnecting
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                if subscription.overflowed:
+                    subscription.overflowed = False
+                    yield f"event: resync\ndata: {json.dumps({'dropped': subscription.dropped})}\n\n"
+
+                event = await subscription.get(timeout=settings.STREAM_HEARTBEAT_SECONDS)
+                if event is None:
+                    # Heartbeat keeps proxies from closing an idle stream
+                    yield ": keep-alive\n\n"
+                    continue
+                yield _format_sse(event)
+        finally:
+            subscription.close()
+            _logger.debug("Stream subscriber disconnected")
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+@router.get("/stats")
+async def stream_stats():
+    """Get live stream bus statistics.
+
+    Returns:
+        Dict with last_event_id, listeners, subscribers and replay_size.
+    """
+    return get_incident_bus().stats()
@@ -1,12 +1,20 @@
 """RESPOND API Schemas Package."""
 
 from api.schemas.request_models import IncidentIngestRequest, IncidentSearchRequest
-from api.schemas.response_models import IngestResponse, SearchResultItem, SearchResponse
+from api.schemas.response_models import (
+    IngestResponse,
+    BulkIngestItemResult,
+    BulkIngestResponse,
+    SearchResultItem,
+    SearchResponse,
+)
 
 __all__ = [
     "IncidentIngestRequest",
     "IncidentSearchRequest",
     "IngestResponse",
+    "BulkIngestItemResult",
+    "BulkIngestResponse",
     "SearchResultItem",
     "SearchResponse",
 ]
@@ -21,9 +21,15 @@ class IncidentSearchRequest(BaseModel):
     
     query: str
     limit: int = 10
-    zone_id: str | None = None
-    urgency: str | None = None
-    status: str | None = None
+    zone_id: str | list[str] | None = None  # list = any of these zones
+    urgency: str | list[str] | None = None
+    status: str | list[str] | None = None
     last_hours: int | None = None
     center: dict | None = None  # {"lat": float, "lon": float}
     radius_km: float | None = None
+
+
+class IncidentBatchSearchRequest(BaseModel):
+    """Request model for running several incident searches at once."""
+    
+    searches: list[IncidentSearchRequest]
@@ -10,6 +10,25 @@ class IngestResponse(BaseModel):
     message: str
 
 
+class BulkIngestItemResult(BaseModel):
+    """Per-item result of a bulk ingestion request."""
+    
+    index: int
+    status: str  # "created", "deduplicated" or "error"
+    incident_id: str | None = None
+    error: str | None = None
+
+
+class BulkIngestResponse(BaseModel):
+    """Response model for bulk ingestion."""
+    
+    total: int
+    created: int
+    deduplicated: int = 0
+    failed: int
+    results: list[BulkIngestItemResult]
+
+
 class SearchResultItem(BaseModel):
     """Single search result item with decay and evidence info."""
     
@@ -27,3 +46,10 @@ class SearchResponse(BaseModel):
     
     count: int
     results: list[SearchResultItem]
+
+
+class BatchSearchResponse(BaseModel):
+    """Response model for batch search (one SearchResponse per query, in order)."""
+    
+    count: int
+    results: list[SearchResponse]
@@ -0,0 +1,4 @@
+"""End-to-end benchmark suite for RESPOND.
+
+Run with `python -m benchmarks.run --help`.
+"""
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Compare two RESPOND benchmark result files.
+
+Usage:
+    python -m benchmarks.compare benchmarks/results/base.json benchmarks/results/new.json
+
+Prints p50/p99 latency and throughput for every (scenario, corpus size,
+concurrency) present in both files, with the relative change.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+def _key(result: dict) -> tuple:
+    return result["scenario"], result["corpus_size"], result["concurrency"]
+
+
+def _change(old: float | None, new: float | None) -> str:
+    if not old or new is None:
+        return "     n/a"
+    return f"{(new - old) / old * 100:+7.1f}%"
+
+
+def compare(base: dict, new: dict) -> list[str]:
+    """Build comparison lines for results present in both reports."""
+    base_results = {_key(r): r for r in base["results"]}
+    lines = [
+        f"{'scenario':13} {'size':>8} {'c':>3} "
+        f"{'p50 ms':>10} {'Δp50':>8} {'p99 ms':>10} {'Δp99':>8} {'ops/s':>9} {'Δops/s':>8}"
+    ]
+
+    for result in new["results"]:
+        old = base_results.get(_key(result))
+        if old is None:
+            continue
+        lat, old_lat = result["latency_ms"], old["latency_ms"]
+        lines.append(
+            f"{result['scenario']:13} {result['corpus_size']:>8} {result['concurrency']:>3} "
+            f"{lat['p50'] or 0:>10.2f} {_change(old_lat['p50'], lat['p50'])} "
+            f"{lat['p99'] or 0:>10.2f} {_change(old_lat['p99'], lat['p99'])} "
+            f"{result['throughput_ops_s']:>9.1f} "
+            f"{_change(old['throughput_ops_s'], result['throughput_ops_s'])}"
+        )
+    return lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Compare two result files."""
+    parser = argparse.ArgumentParser(description="Compare RESPOND benchmark results")
+    parser.add_argument("base", type=Path)
+    parser.add_argument("new", type=Path)
+    args = parser.parse_args(argv)
+
+    base = json.loads(args.base.read_text())
+    new = json.loads(args.new.read_text())
+
+    print(f"base: {base['meta'].get('git_commit')}  new: {new['meta'].get('git_commit')}")
+    for line in compare(base, new):
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
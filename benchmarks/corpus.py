@@ -0,0 +1,142 @@
+"""Synthetic incident corpus for RESPOND benchmarks.
+
+Generates varied, reproducible incident reports so that embeddings (and
+therefore search and dedup behaviour) are not dominated by a handful of
+identical template strings.
+"""
+
+import random
+import time
+
+from config.qdrant_config import SUPPORTED_SOURCE_TYPES
+
+# Incident templates: {place} and {detail} are filled per report
+TEMPLATES = {
+    "fire": [
+        "Fire spotted near {place}, {detail}",
+        "Major fire outbreak at {place}, flames spreading, {detail}",
+        "Smoke visible from {place}, fire brigade requested, {detail}",
+    ],
+    "flood": [
+        "Flooding reported at {place}, roads submerged, {detail}",
+        "Water rising rapidly near {place}, {detail}",
+        "River overflow affecting {place}, {detail}",
+    ],
+    "collapse": [
+        "Building collapse at {place}, people trapped, {detail}",
+        "Partial structure collapse near {place}, {detail}",
+        "Bridge collapse reported at {place}, vehicles stuck, {detail}",
+    ],
+    "earthquake": [
+        "Earthquake aftershock felt at {place}, {detail}",
+        "Tremors reported around {place}, cracks in walls, {detail}",
+    ],
+    "medical": [
+        "Multiple injuries reported at {place}, ambulances needed, {detail}",
+        "Mass casualty situation near {place}, {detail}",
+    ],
+}
+
+PLACES = [
+    "the central market", "sector {n} school", "the old town bazaar",
+    "metro station {n}", "city hospital gate {n}", "warehouse block {n}",
+    "the river crossing", "residential tower {n}", "ring road exit {n}",
+    "the industrial estate", "community hall {n}", "bus depot {n}",
+]
+
+DETAILS = [
+    "residents evacuating", "roads blocked", "power lines down",
+    "children present", "elderly residents stranded", "rescue teams on site",
+    "situation worsening", "crowd gathering", "no casualties confirmed yet",
+    "several people missing", "gas leak suspected", "visibility very low",
+]
+
+URGENCY_WEIGHTS = [("critical", 0.25), ("high", 0.30), ("medium", 0.30), ("low", 0.15)]
+
+QUERIES = [
+    "fire with people trapped",
+    "flooding near school",
+    "building collapse rescue needed",
+    "earthquake damage residential",
+    "injuries need ambulance",
+    "gas leak evacuation",
+    "bridge collapse vehicles",
+    "smoke near hospital",
+]
+
+
+class CorpusGenerator:
+    """Reproducible generator of incident payloads, queries and evidence."""
+
+    def __init__(self, seed: int = 42, zones: int = 20, span_hours: float = 48.0):
+        self._rng = random.Random(seed)
+        self.zones = [f"zone-{i}" for i in range(1, zones + 1)]
+        self._span_seconds = int(span_hours * 3600)
+        self._recent: list[dict] = []
+
+    def text(self) -> str:
+        """Generate a random incident report text."""
+        kind = self._rng.choice(list(TEMPLATES))
+        place = self._rng.choice(PLACES).format(n=self._rng.randint(1, 60))
+        detail = self._rng.choice(DETAILS)
+        return self._rng.choice(TEMPLATES[kind]).format(place=place, detail=detail)
+
+    def incident(self, duplicate_ratio: float = 0.0, recent: bool = False) -> dict:
+        """Generate an incident ingestion payload.
+
+        Args:
+            duplicate_ratio: Probability of re-reporting a previous incident
+                (same text and zone) instead of a new one.
+            recent: Timestamp "now" instead of spreading over the corpus span.
+
+        Returns:
+            Incident dict accepted by IncidentIngester.
+        """
+        if self._recent and self._rng.random() < duplicate_ratio:
+            original = self._rng.choice(self._recent)
+            return {
+                **original,
+                "source_type": self._rng.choice(SUPPORTED_SOURCE_TYPES),
+            }
+
+        choices, weights = zip(*URGENCY_WEIGHTS)
+        data = {
+            "text": self.text(),
+            "source_type": self._rng.choice(SUPPORTED_SOURCE_TYPES),
+            "urgency": self._rng.choices(choices, weights=weights, k=1)[0],
+            "zone_id": self._rng.choice(self.zones),
+            "location": {
+                "lat": round(self._rng.uniform(28.55, 28.75), 5),
+                "lon": round(self._rng.uniform(77.05, 77.35), 5),
+            },
+        }
+        if not recent:
+            offset = self._rng.randint(0, self._span_seconds)
+            data["timestamp"] = time.strftime(
+                "%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() - offset)
+            )
+
+        self._recent.append(data)
+        if len(self._recent) > 1000:
+            self._recent = self._recent[-500:]
+        return data
+
+    def incidents(self, count: int) -> list[dict]:
+        """Generate a list of corpus incidents."""
+        return [self.incident() for _ in range(count)]
+
+    def query(self) -> str:
+        """Generate a search query."""
+        return self._rng.choice(QUERIES)
+
+    def zone(self) -> str:
+        """Pick a random zone."""
+        return self._rng.choice(self.zones)
+
+    def source_type(self) -> str:
+        """Pick a random source type."""
+        return self._rng.choice(SUPPORTED_SOURCE_TYPES)
+
+    def choice(self, items: list):
+        """Pick a random item using the generator's seed."""
+        return self._rng.choice(items)
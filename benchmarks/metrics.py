@@ -0,0 +1,87 @@
+"""Latency, throughput and memory measurement for RESPOND benchmarks."""
+
+import os
+import resource
+import sys
+import threading
+
+import numpy as np
+
+
+class LatencyRecorder:
+    """Thread-safe collector of per-operation latencies."""
+
+    def __init__(self):
+        self._latencies: list[float] = []
+        self._errors = 0
+        self._last_error: str | None = None
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        """Record a successful operation."""
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def record_error(self, error: Exception) -> None:
+        """Record a failed operation."""
+        with self._lock:
+            self._errors += 1
+            self._last_error = f"{type(error).__name__}: {error}"
+
+    def summary(self, wall_seconds: float) -> dict:
+        """Summarize the recorded operations.
+
+        Args:
+            wall_seconds: Wall-clock duration of the measured run.
+
+        Returns:
+            Dict with ops, errors, throughput and latency percentiles (ms).
+        """
+        with self._lock:
+            latencies = np.asarray(self._latencies, dtype=np.float64) * 1000.0
+            errors = self._errors
+            last_error = self._last_error
+
+        summary = {
+            "ops": int(latencies.size),
+            "errors": errors,
+            "wall_s": round(wall_seconds, 3),
+            "throughput_ops_s": round(latencies.size / wall_seconds, 2) if wall_seconds else 0.0,
+            "latency_ms": latency_percentiles(latencies),
+        }
+        if last_error:
+            summary["last_error"] = last_error
+        return summary
+
+
+def latency_percentiles(latencies_ms: np.ndarray) -> dict:
+    """Compute mean/p50/p95/p99/max of latencies in milliseconds."""
+    if latencies_ms.size == 0:
+        return {"mean": None, "p50": None, "p95": None, "p99": None, "max": None}
+
+    p50, p95, p99 = np.percentile(latencies_ms, [50, 95, 99])
+    return {
+        "mean": round(float(latencies_ms.mean()), 3),
+        "p50": round(float(p50), 3),
+        "p95": round(float(p95), 3),
+        "p99": round(float(p99), 3),
+        "max": round(float(latencies_ms.max()), 3),
+    }
+
+
+def rss_mb() -> float | None:
+    """Current resident set size in MB (Linux only, None elsewhere)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return round(pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024), 1)
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark runner for RESPOND.
+
+Loads a synthetic corpus at each requested size, then drives ingestion,
+smart (dedup) ingestion, search, reinforcement and recommendation at each
+concurrency level. Reports p50/p95/p99 latency, throughput and RSS, and
+writes everything to a JSON file for comparing commits.
+
+Usage:
+    python -m benchmarks.run --sizes 10000 100000 --concurrency 1 8
+    python -m benchmarks.run --mode server --prefix bench_ --ops 2000
+    python -m benchmarks.compare results/old.json results/new.json
+
+By default Qdrant runs embedded in memory (QDRANT_MODE=memory), so no
+server is needed. Benchmark collections use their own prefix and are
+dropped at start unless --keep is given.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# Max incident ids kept for reinforcement targets
+ID_SAMPLE_SIZE = 10000
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="RESPOND end-to-end benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000],
+                        help="Corpus sizes to benchmark (incidents), e.g. 10000 100000 1000000")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8],
+                        help="Concurrent callers per scenario")
+    parser.add_argument("--scenarios", nargs="+", default=None,
+                        help="Scenarios to run (default: all)")
+    parser.add_argument("--ops", type=int, default=500,
+                        help="Measured operations per scenario/concurrency")
+    parser.add_argument("--warmup", type=int, default=20,
+                        help="Unmeasured operations before each run")
+    parser.add_argument("--duplicate-ratio", type=float, default=0.3,
+                        help="Share of smart_ingest reports that repeat an earlier one")
+    parser.add_argument("--mode", choices=["memory", "local", "server"], default="memory",
+                        help="Qdrant mode (sets QDRANT_MODE)")
+    parser.add_argument("--prefix", default="bench_",
+                        help="Collection prefix (sets QDRANT_PREFIX)")
+    parser.add_argument("--load-batch", type=int, default=5000,
+                        help="Incidents per bulk-ingest call while loading the corpus")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--keep", action="store_true",
+                        help="Reuse existing benchmark collections instead of dropping them")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="Result file (default: benchmarks/results/<time>-<commit>.json)")
+    parser.add_argument("--log-level", default="WARNING")
+    return parser.parse_args(argv)
+
+
+def git_info() -> dict:
+    """Current commit and dirty flag, if run inside a git checkout."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        dirty = bool(subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+    return {"commit": commit, "dirty": dirty}
+
+
+def reset_collections(keep: bool) -> None:
+    """Drop (unless keep) and create the benchmark collections."""
+    from src.qdrant import get_qdrant_client, setup_all_collections
+    from src.qdrant.collections import ALL_COLLECTIONS, collection_exists
+
+    if not keep:
+        client = get_qdrant_client()
+        for name in ALL_COLLECTIONS:
+            if collection_exists(name):
+                client.delete_collection(name)
+    setup_all_collections()
+
+
+def corpus_count() -> int:
+    """Number of incidents currently stored."""
+    from config.qdrant_config import SITUATION_REPORTS
+    from src.qdrant import get_qdrant_client
+
+    return get_qdrant_client().count(SITUATION_REPORTS, exact=True).count
+
+
+def load_corpus(ctx, target: int, batch_size: int) -> dict:
+    """Top the incident collection up to `target` points via bulk ingestion.
+
+    Returns:
+        Dict with corpus_size, loaded, seconds and throughput.
+    """
+    from benchmarks.metrics import peak_rss_mb
+
+    current = corpus_count()
+    missing = max(0, target - current)
+    started = time.perf_counter()
+    loaded = 0
+
+    while loaded < missing:
+        count = min(batch_size, missing - loaded)
+        results = ctx.ingester.ingest_many(ctx.generator.incidents(count))
+        for result in results:
+            if result["status"] == "created" and len(ctx.incident_ids) < ID_SAMPLE_SIZE:
+                ctx.incident_ids.append(result["incident_id"])
+        loaded += count
+        print(f"  loaded {current + loaded}/{target}", end="\r", flush=True)
+
+    seconds = time.perf_counter() - started
+    print(f"  corpus ready: {corpus_count()} incidents ({loaded} loaded in {seconds:.1f}s)")
+
+    if not ctx.incident_ids:
+        ctx.incident_ids.extend(_sample_ids(ID_SAMPLE_SIZE))
+
+    return {
+        "corpus_size": target,
+        "loaded": loaded,
+        "seconds": round(seconds, 3),
+        "throughput_ops_s": round(loaded / seconds, 2) if seconds and loaded else None,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def _sample_ids(limit: int) -> list[str]:
+    """Read incident ids from an existing (--keep) corpus."""
+    from config.qdrant_config import SITUATION_REPORTS
+    from src.qdrant import get_qdrant_client
+
+    points, _ = get_qdrant_client().scroll(
+        SITUATION_REPORTS, limit=limit, with_payload=False, with_vectors=False,
+    )
+    return [str(point.id) for point in points]
+
+
+def run_scenario(ctx, factory, ops: int, concurrency: int, warmup: int) -> dict:
+    """Run one scenario at a concurrency level and summarize it."""
+    from benchmarks.metrics import LatencyRecorder, peak_rss_mb, rss_mb
+
+    for _ in range(warmup):
+        factory(ctx)()
+
+    recorder = LatencyRecorder()
+
+    def worker(count: int) -> None:
+        for _ in range(count):
+            op = factory(ctx)
+            started = time.perf_counter()
+            try:
+                op()
+            except Exception as e:
+                recorder.record_error(e)
+                continue
+            recorder.record(time.perf_counter() - started)
+
+    shares = [ops // concurrency + (1 if i < ops % concurrency else 0) for i in range(concurrency)]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(worker, shares))
+    wall = time.perf_counter() - started
+
+    summary = recorder.summary(wall)
+    summary["rss_mb"] = rss_mb()
+    summary["peak_rss_mb"] = peak_rss_mb()
+    return summary
+
+
+def print_row(result: dict) -> None:
+    """Print one result line."""
+    latency = result["latency_ms"]
+    fmt = lambda v: f"{v:9.2f}" if v is not None else "        -"
+    print(
+        f"  {result['scenario']:13} c={result['concurrency']:<3} "
+        f"p50={fmt(latency['p50'])} p95={fmt(latency['p95'])} p99={fmt(latency['p99'])} ms  "
+        f"{result['throughput_ops_s']:9.1f} ops/s  errors={result['errors']}  "
+        f"rss={result['rss_mb']}MB"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark suite."""
+    args = parse_args(argv)
+
+    # Settings are read at import time, so configure the environment first
+    os.environ["QDRANT_MODE"] = args.mode
+    os.environ["QDRANT_PREFIX"] = args.prefix
+    os.environ["LOG_LEVEL"] = args.log_level
+
+    from benchmarks.corpus import CorpusGenerator
+    from benchmarks.scenarios import SCENARIOS, BenchContext
+    from config.settings import settings
+    from src.embeddings import text_embedder
+
+    scenarios = args.scenarios or list(SCENARIOS)
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        print(f"Unknown scenarios: {unknown}. Available: {list(SCENARIOS)}")
+        return 2
+
+    text_embedder._load_model()
+    git = git_info()
+    report = {
+        "meta": {
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "git_commit": git["commit"],
+            "git_dirty": git["dirty"],
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "qdrant_mode": settings.QDRANT_MODE,
+            "qdrant_url": settings.QDRANT_URL if args.mode == "server" else None,
+            "embedder_fallback": text_embedder._fallback_mode,
+            "args": {k: str(v) if isinstance(v, Path) else v for k, v in vars(args).items()},
+        },
+        "load": [],
+        "results": [],
+    }
+
+    print("=" * 60)
+    print("RESPOND Benchmarks")
+    print("=" * 60)
+    print(f"Qdrant mode: {settings.QDRANT_MODE}, prefix: {settings.QDRANT_PREFIX}")
+    if text_embedder._fallback_mode:
+        print("WARNING: sentence-transformers unavailable, using hash embeddings")
+
+    reset_collections(args.keep)
+    ctx = BenchContext(CorpusGenerator(seed=args.seed), duplicate_ratio=args.duplicate_ratio)
+
+    for size in sorted(args.sizes):
+        print("-" * 60)
+        print(f"Corpus size {size}")
+        report["load"].append(load_corpus(ctx, size, args.load_batch))
+
+        for name in scenarios:
+            for concurrency in args.concurrency:
+                result = {
+                    "scenario": name,
+                    "corpus_size": size,
+                    "corpus_points": corpus_count(),
+                    "concurrency": concurrency,
+                    **run_scenario(ctx, SCENARIOS[name], args.ops, concurrency, args.warmup),
+                }
+                report["results"].append(result)
+                print_row(result)
+
+    output = args.output
+    if output is None:
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        output = RESULTS_DIR / f"{stamp}-{git['commit'] or 'nogit'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+
+    print("=" * 60)
+    print(f"Results written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
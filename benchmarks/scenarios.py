@@ -0,0 +1,77 @@
+"""Benchmark scenarios for RESPOND.
+
+Each scenario is a factory returning a zero-argument callable for one
+operation. Inputs are generated by the factory, outside the timed call.
+"""
+
+from typing import Callable
+
+from benchmarks.corpus import CorpusGenerator
+from src.ingestion.incident_ingester import IncidentIngester
+from src.ingestion.smart_ingester import SmartIncidentIngester
+from src.memory.memory_manager import MemoryManager
+from src.recommendation.action_recommender import ActionRecommender
+from src.search.hybrid_search import HybridSearcher
+
+
+class BenchContext:
+    """Shared state for scenarios: corpus generator, sample ids and components."""
+
+    def __init__(self, generator: CorpusGenerator, duplicate_ratio: float = 0.3):
+        self.generator = generator
+        self.duplicate_ratio = duplicate_ratio
+        self.incident_ids: list[str] = []
+        self.ingester = IncidentIngester()
+        self.smart_ingester = SmartIncidentIngester()
+        self.searcher = HybridSearcher()
+        self.memory_manager = MemoryManager()
+        self.recommender = ActionRecommender()
+
+
+def ingest_op(ctx: BenchContext) -> Callable[[], object]:
+    """Plain single-incident ingestion."""
+    data = ctx.generator.incident(recent=True)
+    return lambda: ctx.ingester.ingest(data)
+
+
+def smart_ingest_op(ctx: BenchContext) -> Callable[[], object]:
+    """Ingestion with dedup search (and reinforcement on a duplicate)."""
+    data = ctx.generator.incident(duplicate_ratio=ctx.duplicate_ratio, recent=True)
+    return lambda: ctx.smart_ingester.ingest(data)
+
+
+def search_op(ctx: BenchContext) -> Callable[[], object]:
+    """Semantic search with zone and time filters, decay and evidence."""
+    query = ctx.generator.query()
+    zone_id = ctx.generator.zone()
+    return lambda: ctx.searcher.search_incidents(
+        query=query,
+        limit=10,
+        zone_id=zone_id,
+        last_hours=24,
+    )
+
+
+def reinforce_op(ctx: BenchContext) -> Callable[[], object]:
+    """Reinforcement of a random existing incident."""
+    incident_id = ctx.generator.choice(ctx.incident_ids)
+    text = ctx.generator.text()
+    source_type = ctx.generator.source_type()
+    return lambda: ctx.memory_manager.reinforce(incident_id, source_type, text)
+
+
+def recommend_op(ctx: BenchContext) -> Callable[[], object]:
+    """Action recommendation for a query within a zone."""
+    query = ctx.generator.query()
+    zone_id = ctx.generator.zone()
+    return lambda: ctx.recommender.recommend_actions(query=query, limit=5, zone_id=zone_id)
+
+
+# Read-only scenarios first so write scenarios don't change the corpus under them
+SCENARIOS: dict[str, Callable[[BenchContext], Callable[[], object]]] = {
+    "search": search_op,
+    "recommend": recommend_op,
+    "reinforce": reinforce_op,
+    "smart_ingest": smart_ingest_op,
+    "ingest": ingest_op,
+}
@@ -15,6 +15,63 @@ DISASTER_EVENTS = f"{settings.QDRANT_PREFIX}disaster_events"
 RESOURCE_DEPLOYMENTS = f"{settings.QDRANT_PREFIX}resource_deployments"
 HISTORICAL_PATTERNS = f"{settings.QDRANT_PREFIX}historical_patterns"
 INCIDENT_IMAGES = f"{settings.QDRANT_PREFIX}incident_images"  # Phase 12.2
+INCIDENT_EVIDENCE = f"{settings.QDRANT_PREFIX}incident_evidence"
+
+
+def get_collection_profile_name(collection: str) -> str:
+    """Profile configured for a collection.
+    
+    QDRANT_COLLECTION_PROFILES maps unprefixed collection names (e.g.
+    "situation_reports") to profiles; other collections use
+    QDRANT_COLLECTION_PROFILE.
+    
+    Args:
+        collection: Full (prefixed) collection name.
+    
+    Returns:
+        Profile name.
+    """
+    base = collection
+    if settings.QDRANT_PREFIX and collection.startswith(settings.QDRANT_PREFIX):
+        base = collection[len(settings.QDRANT_PREFIX):]
+    return settings.QDRANT_COLLECTION_PROFILES.get(base, settings.QDRANT_COLLECTION_PROFILE)
+
+# Collection profiles: storage, index and quantization presets.
+# "default" keeps Qdrant's defaults (everything in RAM, no quantization).
+# Quantized profiles search the compressed vectors (kept in RAM) and rescore
+# the oversampled candidates with the original vectors.
+COLLECTION_PROFILES = {
+    "default": {},
+    # Everything in RAM, int8 vectors for fast scoring, denser HNSW graph
+    "low_latency": {
+        "quantization": {"type": "scalar", "quantile": 0.99, "always_ram": True},
+        "hnsw": {"m": 32, "ef_construct": 256},
+        "on_disk": False,
+        "on_disk_payload": False,
+        "optimizers": {"indexing_threshold": 10000, "default_segment_number": 4},
+        "search": {"hnsw_ef": 128, "rescore": True, "oversampling": 1.5},
+    },
+    # Original vectors and payload on disk, int8 copy + HNSW graph in RAM
+    "large_corpus": {
+        "quantization": {"type": "scalar", "quantile": 0.99, "always_ram": True},
+        "hnsw": {"m": 16, "ef_construct": 128, "on_disk": False},
+        "on_disk": True,
+        "on_disk_payload": True,
+        "optimizers": {"indexing_threshold": 20000, "default_segment_number": 2},
+        "search": {"hnsw_ef": 96, "rescore": True, "oversampling": 2.0},
+    },
+    # Minimal RAM: 1-bit vectors in RAM, everything else on disk. Binary
+    # quantization loses more recall on 384-dim MiniLM vectors than on
+    # larger models, hence the higher oversampling.
+    "memory_constrained": {
+        "quantization": {"type": "binary", "always_ram": True},
+        "hnsw": {"m": 8, "ef_construct": 64, "on_disk": True},
+        "on_disk": True,
+        "on_disk_payload": True,
+        "optimizers": {"indexing_threshold": 20000, "default_segment_number": 2},
+        "search": {"hnsw_ef": 64, "rescore": True, "oversampling": 3.0},
+    },
+}
 
 # Supported source types for incident data
 SUPPORTED_SOURCE_TYPES = ["social", "satellite", "call", "sensor", "report"]
@@ -25,11 +25,91 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
 
     # Qdrant
+    QDRANT_MODE: str = "server"  # server | local | memory
+    QDRANT_LOCAL_PATH: str = "qdrant_data"
     QDRANT_URL: str = "http://localhost:6333"
     QDRANT_API_KEY: str | None = None
     QDRANT_PREFIX: str = "respond_"
+    QDRANT_PREFER_GRPC: bool = False
+    QDRANT_GRPC_PORT: int = 6334
+    QDRANT_TIMEOUT: int | None = None
+    QDRANT_POOL_SIZE: int = 10
+    QDRANT_KEEPALIVE_SECONDS: float = 30.0
     DEFAULT_VECTOR_SIZE: int = 384
     DEFAULT_DISTANCE: str = "Cosine"
+    QDRANT_UPSERT_BATCH_SIZE: int = 256
+    QDRANT_UPSERT_MAX_BATCH_BYTES: int = 4 * 1024 * 1024
+    QDRANT_UPSERT_PARALLEL: int = 4
+    # default | low_latency | large_corpus | memory_constrained
+    QDRANT_COLLECTION_PROFILE: str = "default"
+    QDRANT_COLLECTION_PROFILES: dict[str, str] = {}  # e.g. {"situation_reports": "large_corpus"}
+    PAYLOAD_WRITE_BUFFER_ENABLED: bool = False
+    PAYLOAD_WRITE_BUFFER_FLUSH_MS: float = 50.0
+    PAYLOAD_WRITE_BUFFER_MAX_POINTS: int = 500
+
+    # Embeddings
+    EMBED_BATCH_SIZE: int = 64
+    EMBED_MICRO_BATCHING: bool = True
+    EMBED_MICRO_BATCH_MAX_SIZE: int = 32
+    EMBED_MICRO_BATCH_MAX_WAIT_MS: float = 2.0
+    EMBED_EXECUTOR_WORKERS: int = 4
+    EMBED_CACHE_ENABLED: bool = True
+    EMBED_CACHE_MAX_ENTRIES: int = 20000
+    EMBED_CACHE_DISK_DIR: str | None = None
+    EMBED_CACHE_DISK_SLOTS: int = 65536
+
+    # Ingestion
+    BULK_INGEST_MAX_ITEMS: int = 10000
+    BULK_INGEST_CHUNK_SIZE: int = 512
+
+    # Search ranking
+    SEARCH_CANDIDATE_MULTIPLIER: int = 3
+    SEARCH_MAX_CANDIDATES: int = 200
+    SEARCH_BATCH_MAX_QUERIES: int = 50
+    FILTER_TIME_QUANTUM_SECONDS: int = 60
+    SEARCH_CACHE_ENABLED: bool = True
+    SEARCH_CACHE_TTL_SECONDS: float = 5.0
+    SEARCH_CACHE_MAX_ENTRIES: int = 1024
+    DECAY_CURVE: str = "step"  # step | exponential | urgency
+    DECAY_HALF_LIFE_HOURS: float = 6.0
+    DECAY_URGENCY_HALF_LIFE_HOURS: dict[str, float] = {
+        "critical": 24.0,
+        "high": 12.0,
+        "medium": 6.0,
+        "low": 3.0,
+    }
+    DECAY_SERVER_SIDE: bool = False
+    DECAY_PREFETCH_LIMIT: int = 100
+
+    # Geo index
+    GEO_INDEX_ENABLED: bool = True
+    GEO_INDEX_CELL_DEG: float = 0.05
+
+    # Temporal index
+    TEMPORAL_INDEX_ENABLED: bool = True
+    TEMPORAL_BUCKET_SECONDS: int = 60
+    TEMPORAL_RETENTION_HOURS: float = 48.0
+    TEMPORAL_JOURNAL_MAX_ENTRIES: int = 100_000
+
+    # Dedup index
+    DEDUP_INDEX_ENABLED: bool = True
+    DEDUP_INDEX_AUTHORITATIVE: bool = False
+    DEDUP_COALESCE_MS: float = 5.0
+
+    # Reinforcement writes
+    REINFORCE_COMBINING: bool = True
+    REINFORCE_MAX_ATTEMPTS: int = 10
+    REINFORCE_RETRY_BACKOFF_MS: float = 2.0
+
+    # Evidence
+    EVIDENCE_RECENT_LIMIT: int = 5
+    EVIDENCE_PREVIEW_CHARS: int = 200
+    EVIDENCE_PAGE_MAX: int = 200
+
+    # Live stream
+    STREAM_QUEUE_SIZE: int = 1000
+    STREAM_REPLAY_SIZE: int = 1000
+    STREAM_HEARTBEAT_SECONDS: float = 15.0
 
 
 # Singleton instance
@@ -17,6 +17,9 @@ const API_BASE = window.API_BASE || (
 let currentResults = [];
 let recentIncidents = []; // Store recent incident IDs for easy access
 let lastIncidentId = null; // Most recent incident ID
+let lastSearchParams = null; // Filters of the search shown in the results
+let liveStream = null; // EventSource for /stream/incidents
+let liveRefreshTimer = null;
 
 // DOM Elements
 const ingestForm = document.getElementById('ingestForm');
@@ -215,7 +218,9 @@ function renderIncidentCard(result) {
           </div>
           <p>${e.text}</p>
         </div>
-      `).join('')
+      `).join('') + (evidence.evidence_truncated
+        ? `<p style="color: var(--muted); font-size: 12px;">Latest ${evidence.evidence_chain.length} of ${evidence.evidence_count} shown</p>`
+        : '')
     : '<p style="color: var(--muted); font-size: 12px;">No evidence chain</p>';
 
   return `
@@ -339,6 +344,52 @@ function sortResults(sortBy) {
   resultsContainer.innerHTML = sorted.map(renderIncidentCard).join('');
 }
 
+// =====================
+// Live Updates
+// =====================
+
+// Re-run the current search at most once per second while incidents stream in
+function scheduleLiveRefresh() {
+  if (liveRefreshTimer) return;
+  liveRefreshTimer = setTimeout(async () => {
+    liveRefreshTimer = null;
+    if (!lastSearchParams) return;
+    try {
+      renderResults(await searchIncidents(lastSearchParams));
+      sortResults(sortSelect.value);
+    } catch (error) {
+      console.warn('Live refresh failed:', error.message);
+    }
+  }, 1000);
+}
+
+function applyLiveChange(event) {
+  const data = JSON.parse(event.data);
+  const result = currentResults.find(r => r.id === data.incident_id);
+  if (!result) return;
+  result.payload = { ...result.payload, ...(data.changes || {}) };
+  sortResults(sortSelect.value);
+}
+
+function openLiveStream(params) {
+  if (liveStream) liveStream.close();
+  if (!window.EventSource) return;
+
+  const query = new URLSearchParams();
+  for (const key of ['query', 'last_hours', 'urgency', 'status', 'zone_id']) {
+    if (params[key] !== undefined && params[key] !== null && params[key] !== '') {
+      query.set(key, params[key]);
+    }
+  }
+
+  liveStream = new EventSource(`${API_BASE}/stream/incidents?${query}`);
+  liveStream.addEventListener('incident.created', scheduleLiveRefresh);
+  liveStream.addEventListener('incident.reinforced', scheduleLiveRefresh);
+  liveStream.addEventListener('resync', scheduleLiveRefresh);
+  liveStream.addEventListener('incident.status', applyLiveChange);
+  liveStream.addEventListener('incident.updated', applyLiveChange);
+}
+
 // =====================
 // Global Functions
 // =====================
@@ -509,6 +560,8 @@ searchForm.addEventListener('submit', async (e) => {
   try {
     const result = await searchIncidents(params);
     renderResults(result);
+    lastSearchParams = params;
+    openLiveStream(params);
   } catch (error) {
     resultsHeader.style.display = 'none';
     resultsContainer.innerHTML = `
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Collection setup and profile migration for RESPOND.
+
+Creates missing collections with their configured profile (see
+COLLECTION_PROFILES in config/qdrant_config.py) and, with --apply, migrates
+existing collections to it. Qdrant re-indexes and quantizes in the
+background; check progress with --status.
+
+Usage:
+    python -m scripts.setup_collections
+    python -m scripts.setup_collections --apply --profile large_corpus \\
+        --collection situation_reports
+    python -m scripts.setup_collections --status
+"""
+
+import argparse
+import json
+
+from config.qdrant_config import COLLECTION_PROFILES
+from config.settings import settings
+from src.qdrant.collections import (
+    ALL_COLLECTIONS,
+    apply_collection_profile,
+    collection_exists,
+    create_collection,
+    describe_collection,
+    get_collection_profile,
+)
+
+
+def resolve_collections(names: list[str] | None) -> list[str]:
+    """Full collection names for --collection values (all if none given)."""
+    if not names:
+        return list(ALL_COLLECTIONS)
+
+    collections = []
+    for name in names:
+        full_name = name if name in ALL_COLLECTIONS else f"{settings.QDRANT_PREFIX}{name}"
+        if full_name not in ALL_COLLECTIONS:
+            raise SystemExit(f"Unknown collection: {name}")
+        collections.append(full_name)
+    return collections
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="RESPOND collection setup")
+    parser.add_argument("--collection", action="append",
+                        help="Collection to process (repeatable, default: all)")
+    parser.add_argument("--profile", choices=sorted(COLLECTION_PROFILES),
+                        help="Profile to use instead of the configured one")
+    parser.add_argument("--apply", action="store_true",
+                        help="Migrate existing collections to the profile")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Print what would be done without changing anything")
+    parser.add_argument("--status", action="store_true",
+                        help="Print current collection settings and exit")
+    return parser.parse_args()
+
+
+def main():
+    """Create, migrate or describe collections."""
+    args = parse_args()
+    collections = resolve_collections(args.collection)
+
+    if args.status:
+        for name in collections:
+            if collection_exists(name):
+                print(json.dumps(describe_collection(name), indent=2))
+            else:
+                print(f"{name}: missing")
+        return
+
+    for name in collections:
+        profile, _ = get_collection_profile(name, args.profile)
+        exists = collection_exists(name)
+
+        if not exists:
+            action = "create"
+        elif args.apply:
+            action = "apply"
+        else:
+            print(f"{name}: exists (profile {profile}, use --apply to migrate)")
+            continue
+
+        if args.dry_run:
+            print(f"{name}: would {action} with profile {profile}")
+        elif action == "create":
+            create_collection(name, profile=profile)
+            print(f"{name}: created with profile {profile}")
+        else:
+            result = apply_collection_profile(name, profile)
+            if result["applied"]:
+                print(f"{name}: applying profile {profile}")
+            else:
+                print(f"{name}: skipped (embedded Qdrant ignores profiles)")
+
+
+if __name__ == "__main__":
+    main()
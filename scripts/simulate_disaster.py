@@ -6,18 +6,32 @@ Continuously generates and ingests simulated disaster incidents
 through the API for testing and demonstration.
 
 Usage:
-    python scripts/simulate_disaster.py
+    python scripts/simulate_disaster.py [--url http://127.0.0.1:8000]
+
+Load mode drives the API at a fixed request rate (open loop: requests are
+sent on schedule whether or not earlier ones have completed), mixing
+ingestion (with a share of duplicate reports), search, reinforcement and
+recommendation traffic, and prints live latency histograms:
+
+    python scripts/simulate_disaster.py --load --rate 500 --duration 60 \\
+        --duplicate-ratio 0.4 --mix ingest=0.7,search=0.15,reinforce=0.1,recommend=0.05
 
 Press CTRL+C to stop.
 """
 
+import argparse
+import asyncio
+import bisect
+import itertools
 import random
 import time
+from collections import defaultdict
 from datetime import datetime
 
 import requests
 
-API_URL = "http://127.0.0.1:8000/ingest/incident"
+API_BASE = "http://127.0.0.1:8000"
+INGEST_PATH = "/ingest/incident"
 
 # Incident types with realistic text templates
 INCIDENT_TYPES = {
@@ -58,6 +72,22 @@ INCIDENT_TYPES = {
     ],
 }
 
+# Place details that make every generated report text unique
+STREETS = [
+    "Ring Road", "Janpath", "Lodhi Road", "Rajpath", "Ashoka Road",
+    "Mathura Road", "Aurobindo Marg", "Tilak Marg", "Outer Ring Road", "MG Road",
+    "Nehru Place", "Chandni Chowk", "Karol Bagh Main Road", "Vikas Marg", "Rohtak Road",
+]
+LANDMARKS = [
+    "the metro station", "the bus depot", "the central market", "the district hospital",
+    "the community centre", "the water tower", "the old temple", "the stadium",
+    "the power substation", "the primary school", "the fuel station", "the flyover",
+]
+
+# Sequence numbers for report references (unique per run)
+_report_numbers = itertools.count(1)
+_run_tag = f"{random.getrandbits(24):06x}"
+
 # Source types
 SOURCE_TYPES = ["social", "sensor", "call", "report"]
 
@@ -86,15 +116,30 @@ def generate_location() -> dict:
     return {"lat": lat, "lon": lon}
 
 
+def generate_report_text(incident_type: str) -> str:
+    """Build a unique report text for an incident type.
+    
+    A template is combined with a random street, landmark and head count,
+    plus a reference number, so fresh reports never repeat an earlier text
+    (exact repeats are only sent deliberately as duplicates).
+    """
+    template = random.choice(INCIDENT_TYPES[incident_type])
+    return (
+        f"{template} on {random.choice(STREETS)} near {random.choice(LANDMARKS)}, "
+        f"about {random.randint(2, 200)} people affected "
+        f"(ref {_run_tag}-{next(_report_numbers)})"
+    )
+
+
 def generate_incident() -> tuple[str, dict]:
-    """Generate a random incident.
+    """Generate a random incident with a unique report text.
     
     Returns:
         Tuple of (incident_type, incident_data).
     """
     # Select incident type
     incident_type = random.choice(list(INCIDENT_TYPES.keys()))
-    text = random.choice(INCIDENT_TYPES[incident_type])
+    text = generate_report_text(incident_type)
     
     # Generate metadata
     incident = {
@@ -109,11 +154,12 @@ def generate_incident() -> tuple[str, dict]:
     return incident_type, incident
 
 
-def send_incident(incident: dict, max_retries: int = 5) -> str | None:
+def send_incident(incident: dict, api_url: str, max_retries: int = 5) -> str | None:
     """Send incident to API with exponential backoff.
     
     Args:
         incident: Incident data.
+        api_url: Ingest endpoint URL.
         max_retries: Maximum retry attempts.
     
     Returns:
@@ -123,7 +169,7 @@ def send_incident(incident: dict, max_retries: int = 5) -> str | None:
     
     for attempt in range(max_retries):
         try:
-            response = requests.post(API_URL, json=incident, timeout=10)
+            response = requests.post(api_url, json=incident, timeout=10)
             response.raise_for_status()
             return response.json().get("incident_id")
         except requests.exceptions.RequestException as e:
@@ -136,12 +182,18 @@ def send_incident(incident: dict, max_retries: int = 5) -> str | None:
                 return None
 
 
-def main():
-    """Run disaster simulation loop."""
+def run_demo(base_url: str = API_BASE):
+    """Run disaster simulation loop.
+    
+    Args:
+        base_url: API base URL.
+    """
+    api_url = base_url.rstrip("/") + INGEST_PATH
+    
     print("=" * 60)
     print("RESPOND Disaster Simulation")
     print("=" * 60)
-    print(f"API endpoint: {API_URL}")
+    print(f"API endpoint: {api_url}")
     print("Press CTRL+C to stop")
     print("-" * 60)
     
@@ -153,7 +205,7 @@ def main():
             incident_type, incident = generate_incident()
             
             # Send to API
-            incident_id = send_incident(incident)
+            incident_id = send_incident(incident, api_url)
             
             if incident_id:
                 count += 1
@@ -175,5 +227,318 @@ def main():
         print("=" * 60)
 
 
+# =============================================================================
+# Load mode
+# =============================================================================
+
+# Search queries used for search/recommend traffic
+SEARCH_QUERIES = [
+    "fire with people trapped",
+    "flooding in residential area",
+    "building collapse rescue",
+    "bridge collapse vehicles stuck",
+    "earthquake aftershock damage",
+    "smoke near hospital",
+]
+
+DEFAULT_MIX = "ingest=0.7,search=0.15,reinforce=0.1,recommend=0.05"
+
+# Latency histogram bucket upper bounds (ms)
+HISTOGRAM_BOUNDS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+# Incident texts/ids remembered for duplicates and reinforcement
+RECENT_LIMIT = 500
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    """Parse a traffic mix like "ingest=0.7,search=0.3" into weights.
+
+    Raises:
+        ValueError: If an operation is unknown or no weight is positive.
+    """
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ("ingest", "search", "reinforce", "recommend"):
+            raise ValueError(f"Unknown operation in mix: {name}")
+        mix[name] = float(weight)
+    if not any(weight > 0 for weight in mix.values()):
+        raise ValueError("Traffic mix needs at least one positive weight")
+    return mix
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class LoadStats:
+    """Per-operation latencies, errors and drops for one reporting window."""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.dropped = 0
+        self.duplicates_sent = 0
+
+    def record(self, op: str, latency_ms: float, ok: bool) -> None:
+        """Record one completed request."""
+        self.latencies[op].append(latency_ms)
+        if not ok:
+            self.errors[op] += 1
+
+    def merge(self, other: "LoadStats") -> None:
+        """Accumulate another window into this one."""
+        for op, values in other.latencies.items():
+            self.latencies[op].extend(values)
+        for op, count in other.errors.items():
+            self.errors[op] += count
+        self.dropped += other.dropped
+        self.duplicates_sent += other.duplicates_sent
+
+
+def format_histogram(latencies: list[float], width: int = 40) -> list[str]:
+    """Render an ASCII latency histogram."""
+    counts = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+    for latency in latencies:
+        counts[bisect.bisect_left(HISTOGRAM_BOUNDS_MS, latency)] += 1
+
+    peak = max(counts) or 1
+    labels = [f"<= {b} ms" for b in HISTOGRAM_BOUNDS_MS] + [f" > {HISTOGRAM_BOUNDS_MS[-1]} ms"]
+    return [
+        f"    {label:>11} | {'#' * round(count / peak * width):<{width}} {count}"
+        for label, count in zip(labels, counts)
+        if count
+    ]
+
+
+def print_window(stats: LoadStats, seconds: float, title: str, in_flight: int | None = None) -> None:
+    """Print per-operation rates and percentiles plus a latency histogram."""
+    total = sum(len(v) for v in stats.latencies.values())
+    header = f"{title}: {total} done in {seconds:.1f}s ({total / seconds:.1f} req/s)"
+    if in_flight is not None:
+        header += f", in flight {in_flight}"
+    header += f", dropped {stats.dropped}, duplicates sent {stats.duplicates_sent}"
+    print(header)
+
+    for op in sorted(stats.latencies):
+        values = sorted(stats.latencies[op])
+        print(
+            f"  {op:10} n={len(values):<6} err={stats.errors[op]:<5} "
+            f"p50={percentile(values, 50):8.1f} p95={percentile(values, 95):8.1f} "
+            f"p99={percentile(values, 99):8.1f} max={values[-1]:8.1f} ms"
+        )
+
+    all_latencies = [v for values in stats.latencies.values() for v in values]
+    for line in format_histogram(all_latencies):
+        print(line)
+
+
+class LoadGenerator:
+    """Open-loop request generator for the RESPOND API."""
+
+    def __init__(self, args: argparse.Namespace):
+        self._args = args
+        self._mix = parse_mix(args.mix)
+        self._ops = list(self._mix)
+        self._weights = [self._mix[op] for op in self._ops]
+        self._recent_incidents: list[dict] = []
+        self._incident_ids: list[str] = []
+        self._window = LoadStats()
+        self._total = LoadStats()
+        self._in_flight = 0
+        self.elapsed = 0.0
+
+    def totals(self) -> LoadStats:
+        """Statistics for the whole run so far."""
+        self._total.merge(self._window)
+        self._window = LoadStats()
+        return self._total
+
+    def _next_request(self) -> tuple[str, str, dict]:
+        """Pick the next operation and build its (op, path, body)."""
+        op = random.choices(self._ops, weights=self._weights, k=1)[0]
+        if op == "reinforce" and not self._incident_ids:
+            op = "ingest"
+
+        if op == "ingest":
+            if self._recent_incidents and random.random() < self._args.duplicate_ratio:
+                # Re-report a recent incident from another source
+                incident = dict(random.choice(self._recent_incidents))
+                incident["source_type"] = random.choice(SOURCE_TYPES)
+                self._window.duplicates_sent += 1
+            else:
+                _, incident = generate_incident()
+                self._recent_incidents.append(incident)
+                del self._recent_incidents[:-RECENT_LIMIT]
+            return op, INGEST_PATH, incident
+
+        if op == "search":
+            return op, "/search/incidents", {
+                "query": random.choice(SEARCH_QUERIES),
+                "limit": 10,
+                "zone_id": random.choice(ZONES),
+                "last_hours": 2,
+            }
+
+        if op == "reinforce":
+            incident_id = random.choice(self._incident_ids)
+            _, incident = generate_incident()
+            return op, f"/memory/incident/{incident_id}/reinforce", {
+                "source_type": incident["source_type"],
+                "text": incident["text"],
+            }
+
+        return op, "/recommend/actions", {
+            "query": random.choice(SEARCH_QUERIES),
+            "limit": 5,
+            "zone_id": random.choice(ZONES),
+        }
+
+    async def _send(self, client, op: str, path: str, body: dict, scheduled: float) -> None:
+        """Send one request; latency is measured from its scheduled send time."""
+        self._in_flight += 1
+        ok = False
+        try:
+            response = await client.post(path, json=body)
+            ok = response.status_code < 400
+            if ok and op == "ingest":
+                incident_id = response.json().get("incident_id")
+                if incident_id:
+                    self._incident_ids.append(incident_id)
+                    del self._incident_ids[:-RECENT_LIMIT]
+        except Exception:
+            ok = False
+        finally:
+            self._in_flight -= 1
+            self._window.record(op, (time.perf_counter() - scheduled) * 1000, ok)
+
+    async def _report(self, started: float) -> None:
+        """Print the live window every report interval."""
+        window_started = started
+        while True:
+            await asyncio.sleep(self._args.report_interval)
+            now = time.perf_counter()
+            window, self._window = self._window, LoadStats()
+            self._total.merge(window)
+            print_window(
+                window,
+                now - window_started,
+                f"[{now - started:6.1f}s]",
+                in_flight=self._in_flight,
+            )
+            window_started = now
+
+    async def run(self) -> LoadStats:
+        """Send requests at the target rate until the duration elapses."""
+        import httpx
+
+        args = self._args
+        limits = httpx.Limits(
+            max_connections=args.connections,
+            max_keepalive_connections=args.connections,
+        )
+        interval = 1.0 / args.rate
+        tasks: set[asyncio.Task] = set()
+
+        async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=args.timeout) as client:
+            started = time.perf_counter()
+            reporter = asyncio.create_task(self._report(started))
+            sent = 0
+
+            try:
+                while args.duration <= 0 or time.perf_counter() - started < args.duration:
+                    scheduled = started + sent * interval
+                    delay = scheduled - time.perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    sent += 1
+
+                    # Open loop: never wait on earlier requests, but shed load
+                    # instead of queueing without bound when the API falls behind
+                    if self._in_flight >= args.max_in_flight:
+                        self._window.dropped += 1
+                        continue
+
+                    op, path, body = self._next_request()
+                    task = asyncio.create_task(self._send(client, op, path, body, scheduled))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+
+                if tasks:
+                    await asyncio.wait(tasks, timeout=args.timeout)
+            finally:
+                reporter.cancel()
+                self.elapsed = time.perf_counter() - started
+
+        return self.totals()
+
+
+def run_load(args: argparse.Namespace) -> None:
+    """Run load mode and print the final summary."""
+    print("=" * 60)
+    print("RESPOND Load Generator")
+    print("=" * 60)
+    print(f"API: {args.url}  rate: {args.rate}/s  duration: {args.duration}s")
+    print(f"Mix: {args.mix}  duplicate ratio: {args.duplicate_ratio}")
+    print("Press CTRL+C to stop")
+    print("-" * 60)
+
+    generator = LoadGenerator(args)
+    try:
+        total = asyncio.run(generator.run())
+    except KeyboardInterrupt:
+        total = generator.totals()
+
+    print("=" * 60)
+    print_window(total, generator.elapsed or 1.0, "Total")
+    print("=" * 60)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="RESPOND disaster simulation")
+    parser.add_argument("--load", action="store_true",
+                        help="High-rate load mode instead of the demo loop")
+    parser.add_argument("--url", default=API_BASE, help="API base URL")
+    parser.add_argument("--rate", type=float, default=100.0,
+                        help="Target requests per second (load mode)")
+    parser.add_argument("--duration", type=float, default=60.0,
+                        help="Seconds to run, 0 for until CTRL+C (load mode)")
+    parser.add_argument("--duplicate-ratio", type=float, default=0.3,
+                        help="Share of ingested reports that repeat a recent incident")
+    parser.add_argument("--mix", default=DEFAULT_MIX,
+                        help=f"Traffic mix weights (default: {DEFAULT_MIX})")
+    parser.add_argument("--connections", type=int, default=100,
+                        help="Pooled HTTP connections")
+    parser.add_argument("--max-in-flight", type=int, default=2000,
+                        help="Requests in flight before new ones are dropped")
+    parser.add_argument("--timeout", type=float, default=10.0,
+                        help="Per-request timeout in seconds")
+    parser.add_argument("--report-interval", type=float, default=2.0,
+                        help="Seconds between live reports")
+    return parser.parse_args()
+
+
+def main():
+    """Run the demo loop or load mode."""
+    args = parse_args()
+
+    if args.load:
+        if args.rate <= 0:
+            raise SystemExit("--rate must be positive")
+        try:
+            parse_mix(args.mix)
+        except ValueError as e:
+            raise SystemExit(str(e))
+        run_load(args)
+    else:
+        run_demo(args.url)
+
+
 if __name__ == "__main__":
     main()
@@ -1,8 +1,18 @@
 """RESPOND Embeddings Package."""
 
 from src.embeddings.base import BaseEmbedder
+from src.embeddings.batcher import MicroBatcher
+from src.embeddings.cache import EmbeddingCache, flush_embedding_cache, get_embedding_cache
 from src.embeddings.text_embedder import TextEmbedder
 from src.embeddings.image_embedder import ImageEmbedder
 
-__all__ = ["BaseEmbedder", "TextEmbedder", "ImageEmbedder"]
+__all__ = [
+    "BaseEmbedder",
+    "MicroBatcher",
+    "EmbeddingCache",
+    "flush_embedding_cache",
+    "get_embedding_cache",
+    "TextEmbedder",
+    "ImageEmbedder",
+]
 
@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 
 from config.settings import settings
+from src.embeddings.executor import run_embedding
 
 
 class BaseEmbedder(ABC):
@@ -34,6 +35,51 @@ class BaseEmbedder(ABC):
         """
         pass
 
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for a batch of texts.
+
+        The default implementation embeds one text at a time. Embedders
+        backed by a batching model should override this.
+
+        Args:
+            texts: Input texts to embed.
+
+        Returns:
+            List of embedding vectors, in input order.
+
+        Raises:
+            ValueError: If any text is empty.
+        """
+        return [self.embed_text(text) for text in texts]
+
+    async def embed_text_async(self, text: str) -> list[float]:
+        """Generate embedding for text on the bounded embedding executor.
+        
+        Args:
+            text: Input text to embed.
+        
+        Returns:
+            Embedding vector as list of floats.
+        
+        Raises:
+            ValueError: If text is empty.
+        """
+        return await run_embedding(self.embed_text, text)
+
+    async def embed_texts_async(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for a batch of texts on the embedding executor.
+        
+        Args:
+            texts: Input texts to embed.
+        
+        Returns:
+            List of embedding vectors, in input order.
+        
+        Raises:
+            ValueError: If any text is empty.
+        """
+        return await run_embedding(self.embed_texts, texts)
+
     def embed_image(self, image_path: str) -> list[float]:
         """Generate embedding for image input.
         
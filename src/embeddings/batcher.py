@@ -0,0 +1,132 @@
+"""Micro-batching queue for RESPOND embeddings.
+
+Coalesces concurrent single-text embedding calls into one batched
+model forward pass within a small time/size window.
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable
+
+from src.utils.logger import get_logger
+
+_logger = get_logger("embeddings.batcher")
+
+
+class MicroBatcher:
+    """Collects texts from many callers and embeds them in one call.
+
+    The first queued text opens a window of `max_wait_ms`. Every text that
+    arrives before the window closes (up to `max_batch_size`) is embedded
+    together by a single background worker thread.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[list[str]], list[list[float]]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 2.0,
+        name: str = "embed",
+    ):
+        self._embed_fn = embed_fn
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_wait = max(0.0, max_wait_ms) / 1000.0
+        self._name = name
+        self._queue: list[tuple[str, Future]] = []
+        self._cond = threading.Condition()
+        self._worker: threading.Thread | None = None
+        self._stats = {"batches": 0, "items": 0, "max_batch": 0}
+
+    def submit(self, text: str) -> Future:
+        """Queue a text for embedding.
+
+        Args:
+            text: Input text to embed.
+
+        Returns:
+            Future resolving to the embedding vector.
+        """
+        future: Future = Future()
+        with self._cond:
+            self._ensure_worker()
+            self._queue.append((text, future))
+            self._cond.notify()
+        return future
+
+    def embed(self, text: str) -> list[float]:
+        """Embed a text through the batching queue and wait for the result.
+
+        Args:
+            text: Input text to embed.
+
+        Returns:
+            Embedding vector as list of floats.
+        """
+        return self.submit(text).result()
+
+    def stats(self) -> dict:
+        """Get batching statistics.
+
+        Returns:
+            Dict with batches, items, max_batch and avg_batch.
+        """
+        with self._cond:
+            stats = dict(self._stats)
+        stats["avg_batch"] = stats["items"] / stats["batches"] if stats["batches"] else 0.0
+        return stats
+
+    def _ensure_worker(self) -> None:
+        """Start the worker thread (again after a fork). Caller holds the lock."""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._worker = threading.Thread(
+            target=self._run,
+            name=f"respond-{self._name}-batcher",
+            daemon=True,
+        )
+        self._worker.start()
+
+    def _next_batch(self) -> list[tuple[str, Future]]:
+        """Block until a batch is ready and pop it from the queue."""
+        with self._cond:
+            while not self._queue:
+                self._cond.wait()
+
+            # Hold the window open for more callers
+            deadline = time.monotonic() + self._max_wait
+            while len(self._queue) < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            batch = self._queue[:self._max_batch_size]
+            del self._queue[:self._max_batch_size]
+
+            self._stats["batches"] += 1
+            self._stats["items"] += len(batch)
+            self._stats["max_batch"] = max(self._stats["max_batch"], len(batch))
+        return batch
+
+    def _run(self) -> None:
+        """Worker loop: embed each batch and resolve its futures."""
+        while True:
+            batch = self._next_batch()
+            texts = [text for text, _ in batch]
+
+            try:
+                vectors = self._embed_fn(texts)
+                if len(vectors) != len(texts):
+                    # zip() would leave the extra futures unresolved forever
+                    raise RuntimeError(
+                        f"embed_fn returned {len(vectors)} vectors for {len(texts)} texts"
+                    )
+            except Exception as e:
+                _logger.error(f"Batch embedding of {len(texts)} texts failed: {e}")
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), vector in zip(batch, vectors):
+                future.set_result(vector)
@@ -0,0 +1,292 @@
+"""Content-addressed embedding cache for RESPOND.
+
+Vectors are keyed by (model name, hash of whitespace-normalized text), so the
+same report text is only run through the model once per process. An optional
+memory-mapped disk tier keeps vectors across restarts; it is flushed on
+application shutdown and at interpreter exit.
+
+Vectors are stored as float32, and callers always get the stored float32
+values back (also for the call that computed them), so a text embeds to the
+same vector whether or not it was cached.
+"""
+
+import atexit
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from config.settings import settings
+from src.utils.logger import get_logger
+
+_logger = get_logger("embeddings.cache")
+
+_KEY_SIZE = 32  # sha256 digest
+
+_cache: "EmbeddingCache | None" = None
+_cache_lock = threading.Lock()
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache keying (trim and collapse whitespace)."""
+    return " ".join(text.split())
+
+
+def cache_key(model_name: str, text: str) -> bytes:
+    """Compute the content address for a (model, text) pair.
+
+    Args:
+        model_name: Embedder identifier.
+        text: Input text.
+
+    Returns:
+        32-byte sha256 digest.
+    """
+    return hashlib.sha256(f"{model_name}\0{normalize_text(text)}".encode()).digest()
+
+
+class DiskEmbeddingTier:
+    """Direct-mapped vector store backed by a memory-mapped file.
+
+    Each key maps to exactly one slot; a newer entry simply overwrites the
+    slot. Rows are written key-last and read key-check-twice, so a reader in
+    another process never pairs a key with a half-written vector.
+    """
+
+    def __init__(self, path: Path, dim: int, slots: int):
+        self._path = path
+        self._slots = slots
+        self._dtype = np.dtype([
+            ("key", np.uint8, (_KEY_SIZE,)),
+            ("vec", "<f4", (dim,)),
+        ])
+
+        expected_bytes = self._dtype.itemsize * slots
+        mode = "r+" if path.exists() and path.stat().st_size == expected_bytes else "w+"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._data = np.memmap(path, dtype=self._dtype, mode=mode, shape=(slots,))
+
+        _logger.info(f"Opened embedding disk tier {path} ({slots} slots, mode={mode})")
+
+    def _slot(self, key: bytes) -> int:
+        return int.from_bytes(key[:8], "little") % self._slots
+
+    def get(self, key: bytes) -> np.ndarray | None:
+        """Fetch a vector by key, or None if the slot holds another key."""
+        slot = self._slot(key)
+        if self._data["key"][slot].tobytes() != key:
+            return None
+        vector = np.array(self._data["vec"][slot], dtype=np.float32)
+        if self._data["key"][slot].tobytes() != key:
+            return None
+        return vector
+
+    def put(self, key: bytes, vector: np.ndarray) -> None:
+        """Store a vector, evicting whatever occupied its slot."""
+        slot = self._slot(key)
+        self._data["key"][slot] = 0
+        self._data["vec"][slot] = vector
+        self._data["key"][slot] = np.frombuffer(key, dtype=np.uint8)
+
+    def flush(self) -> None:
+        """Flush dirty pages to disk."""
+        self._data.flush()
+
+
+class EmbeddingCache:
+    """Bounded LRU embedding cache with an optional on-disk tier."""
+
+    def __init__(
+        self,
+        max_entries: int = 20000,
+        disk_dir: str | None = None,
+        disk_slots: int = 65536,
+    ):
+        self._max_entries = max(1, max_entries)
+        self._disk_dir = Path(disk_dir) if disk_dir else None
+        self._disk_slots = disk_slots
+        self._entries: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._disk_tiers: dict[tuple[str, int], DiskEmbeddingTier] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, model_name: str, vector_size: int, text: str) -> list[float] | None:
+        """Look up a cached embedding.
+
+        Args:
+            model_name: Embedder identifier.
+            vector_size: Embedder output dimension.
+            text: Input text.
+
+        Returns:
+            Embedding vector, or None on a miss.
+        """
+        vector = self._lookup(model_name, vector_size, cache_key(model_name, text))
+        return vector.tolist() if vector is not None else None
+
+    def put(self, model_name: str, vector_size: int, text: str, vector: list[float]) -> list[float]:
+        """Store an embedding in memory (and on disk if enabled).
+
+        Args:
+            model_name: Embedder identifier.
+            vector_size: Embedder output dimension.
+            text: Input text.
+            vector: Embedding vector.
+
+        Returns:
+            The vector as stored (float32 precision), as later get() calls
+            will return it.
+        """
+        return self._store(model_name, vector_size, cache_key(model_name, text), vector).tolist()
+
+    def get_or_compute_many(
+        self,
+        model_name: str,
+        vector_size: int,
+        texts: list[str],
+        compute_fn: Callable[[list[str]], list[list[float]]],
+    ) -> list[list[float]]:
+        """Resolve a batch of texts, computing only the misses in one call.
+
+        Args:
+            model_name: Embedder identifier.
+            vector_size: Embedder output dimension.
+            texts: Input texts.
+            compute_fn: Batch embedding function for cache misses.
+
+        Returns:
+            List of embedding vectors, in input order.
+        """
+        keys = [cache_key(model_name, text) for text in texts]
+        results: list[list[float] | None] = [None] * len(texts)
+        missing: dict[bytes, list[int]] = {}
+
+        for i, key in enumerate(keys):
+            vector = self._lookup(model_name, vector_size, key)
+            if vector is not None:
+                results[i] = vector.tolist()
+            else:
+                missing.setdefault(key, []).append(i)
+
+        if missing:
+            miss_keys = list(missing)
+            vectors = compute_fn([texts[missing[key][0]] for key in miss_keys])
+            for key, vector in zip(miss_keys, vectors):
+                stored = self._store(model_name, vector_size, key, vector).tolist()
+                for i in missing[key]:
+                    results[i] = list(stored)
+
+        return results
+
+    def stats(self) -> dict:
+        """Get cache statistics.
+
+        Returns:
+            Dict with hits, disk_hits, misses, evictions, size and hit_rate.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+        lookups = stats["hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        return stats
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (the disk tier is kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def flush(self) -> None:
+        """Flush all disk tiers."""
+        with self._lock:
+            for tier in self._disk_tiers.values():
+                tier.flush()
+
+    def _lookup(self, model_name: str, vector_size: int, key: bytes) -> np.ndarray | None:
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return vector
+
+            tier = self._disk_tier(model_name, vector_size)
+            if tier is not None:
+                vector = tier.get(key)
+                if vector is not None:
+                    self._insert(key, vector)
+                    self._stats["disk_hits"] += 1
+                    return vector
+
+            self._stats["misses"] += 1
+            return None
+
+    def _store(self, model_name: str, vector_size: int, key: bytes, vector: list[float]) -> np.ndarray:
+        """Store a vector as float32 and return the stored array."""
+        array = np.asarray(vector, dtype=np.float32)
+        with self._lock:
+            self._insert(key, array)
+            tier = self._disk_tier(model_name, vector_size)
+            if tier is not None:
+                tier.put(key, array)
+        return array
+
+    def _insert(self, key: bytes, vector: np.ndarray) -> None:
+        """Insert into the LRU, evicting the oldest entries (caller holds the lock)."""
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _disk_tier(self, model_name: str, vector_size: int) -> DiskEmbeddingTier | None:
+        """Open (once) the disk tier for a model (caller holds the lock)."""
+        if self._disk_dir is None:
+            return None
+
+        tier_key = (model_name, vector_size)
+        tier = self._disk_tiers.get(tier_key)
+        if tier is None:
+            safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", model_name)
+            path = self._disk_dir / f"{safe_name}.{vector_size}.mmap"
+            tier = DiskEmbeddingTier(path, vector_size, self._disk_slots)
+            self._disk_tiers[tier_key] = tier
+        return tier
+
+
+def get_embedding_cache() -> EmbeddingCache | None:
+    """Get the process-wide embedding cache.
+
+    Returns:
+        Shared EmbeddingCache, or None if caching is disabled.
+    """
+    global _cache
+
+    if not settings.EMBED_CACHE_ENABLED:
+        return None
+
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = EmbeddingCache(
+                    max_entries=settings.EMBED_CACHE_MAX_ENTRIES,
+                    disk_dir=settings.EMBED_CACHE_DISK_DIR,
+                    disk_slots=settings.EMBED_CACHE_DISK_SLOTS,
+                )
+                atexit.register(flush_embedding_cache)
+
+    return _cache
+
+
+def flush_embedding_cache() -> None:
+    """Flush the disk tier of the embedding cache (no-op if never used)."""
+    if _cache is None:
+        return
+    try:
+        _cache.flush()
+    except Exception as e:
+        _logger.error(f"Embedding cache flush failed: {e}")
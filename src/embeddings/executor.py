@@ -0,0 +1,59 @@
+"""Bounded thread pool for running embeddings off the event loop."""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from config.settings import settings
+
+T = TypeVar("T")
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _reset_after_fork() -> None:
+    """Forget the parent's pool; its threads do not exist in a forked child."""
+    global _executor, _executor_lock
+    
+    _executor = None
+    _executor_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_embedding_executor() -> ThreadPoolExecutor:
+    """Get the process-wide embedding executor.
+    
+    Returns:
+        ThreadPoolExecutor with EMBED_EXECUTOR_WORKERS threads.
+    """
+    global _executor
+    
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.EMBED_EXECUTOR_WORKERS,
+                    thread_name_prefix="respond-embed",
+                )
+    
+    return _executor
+
+
+async def run_embedding(fn: Callable[..., T], *args) -> T:
+    """Run a CPU-bound embedding call on the embedding executor.
+    
+    Args:
+        fn: Blocking embedding function.
+        *args: Positional arguments for fn.
+    
+    Returns:
+        Result of fn(*args).
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_embedding_executor(), fn, *args)
@@ -89,6 +89,33 @@ class ImageEmbedder(BaseEmbedder):
         embedding = model.encode(text, convert_to_numpy=True)
         return embedding.tolist()
 
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Generate CLIP text embeddings for a batch in one forward pass.
+
+        Args:
+            texts: Input texts to embed.
+
+        Returns:
+            List of embedding vectors (512 dims each), in input order.
+
+        Raises:
+            ValueError: If any text is empty.
+            RuntimeError: If CLIP model not available.
+        """
+        for text in texts:
+            self._validate_text(text)
+
+        if not texts:
+            return []
+
+        model = _load_clip_model()
+
+        if _fallback_mode or model is None:
+            raise RuntimeError("CLIP model not available for text embedding")
+
+        embeddings = model.encode(list(texts), convert_to_numpy=True)
+        return embeddings.tolist()
+
     def embed_image(self, image_path: str) -> list[float]:
         """Generate CLIP image embedding.
         
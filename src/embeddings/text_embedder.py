@@ -1,9 +1,12 @@
 """Text embedder using sentence-transformers for RESPOND."""
 
 import hashlib
+import threading
 
 from config.settings import settings
 from src.embeddings.base import BaseEmbedder
+from src.embeddings.batcher import MicroBatcher
+from src.embeddings.cache import get_embedding_cache
 from src.utils.logger import get_logger
 
 _logger = get_logger("embeddings.text")
@@ -11,15 +14,31 @@ _logger = get_logger("embeddings.text")
 # Singleton model instance
 _model = None
 _fallback_mode = False
+_model_lock = threading.Lock()
+
+# Process-wide micro-batcher shared by all TextEmbedder instances
+_batcher: MicroBatcher | None = None
 
 
 def _load_model():
     """Load sentence-transformers model with fallback."""
     global _model, _fallback_mode
     
-    if _model is not None:
+    if _model is not None or _fallback_mode:
         return _model
     
+    with _model_lock:
+        if _model is not None or _fallback_mode:
+            return _model
+        _init_model()
+    
+    return _model
+
+
+def _init_model() -> None:
+    """Instantiate the sentence-transformers model (caller holds the lock)."""
+    global _model, _fallback_mode
+    
     try:
         from sentence_transformers import SentenceTransformer
         _model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
@@ -30,8 +49,45 @@ def _load_model():
         _logger.warning("Using fallback hash-based embedding mode")
         _fallback_mode = True
         _model = None
+
+
+def _encode_batch(texts: list[str]) -> list[list[float]]:
+    """Run one model forward pass over a batch of texts.
     
-    return _model
+    Args:
+        texts: Validated input texts.
+    
+    Returns:
+        List of embedding vectors, in input order.
+    """
+    model = _load_model()
+    embeddings = model.encode(
+        texts,
+        batch_size=settings.EMBED_BATCH_SIZE,
+        convert_to_numpy=True,
+    )
+    return embeddings.tolist()
+
+
+def get_text_batcher() -> MicroBatcher:
+    """Get the process-wide micro-batcher for text embeddings.
+    
+    Returns:
+        Shared MicroBatcher instance.
+    """
+    global _batcher
+    
+    if _batcher is None:
+        with _model_lock:
+            if _batcher is None:
+                _batcher = MicroBatcher(
+                    _encode_batch,
+                    max_batch_size=settings.EMBED_MICRO_BATCH_MAX_SIZE,
+                    max_wait_ms=settings.EMBED_MICRO_BATCH_MAX_WAIT_MS,
+                    name="text",
+                )
+    
+    return _batcher
 
 
 def _hash_to_vector(text: str, size: int) -> list[float]:
@@ -94,6 +150,54 @@ class TextEmbedder(BaseEmbedder):
             _logger.debug("Using fallback hash embedding")
             return _hash_to_vector(text, self.vector_size)
         
-        # Generate embedding using sentence-transformers
-        embedding = model.encode(text, convert_to_numpy=True)
-        return embedding.tolist()
+        # Reuse vectors for text we have already embedded
+        cache = get_embedding_cache()
+        if cache is not None:
+            cached = cache.get(self.name, self.vector_size, text)
+            if cached is not None:
+                return cached
+        
+        # Coalesce with concurrent callers into one forward pass
+        if settings.EMBED_MICRO_BATCHING:
+            vector = get_text_batcher().embed(text)
+        else:
+            # Generate embedding using sentence-transformers
+            vector = model.encode(text, convert_to_numpy=True).tolist()
+        
+        if cache is not None:
+            # Return the stored (float32) values, as a later cache hit would
+            vector = cache.put(self.name, self.vector_size, text, vector)
+        
+        return vector
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for a batch of texts in one forward pass.
+        
+        Args:
+            texts: Input texts to embed.
+        
+        Returns:
+            List of embedding vectors, in input order.
+        
+        Raises:
+            ValueError: If any text is empty.
+        """
+        for text in texts:
+            self._validate_text(text)
+        
+        if not texts:
+            return []
+        
+        model = _load_model()
+        
+        if _fallback_mode or model is None:
+            _logger.debug(f"Using fallback hash embedding for {len(texts)} texts")
+            return [_hash_to_vector(text, self.vector_size) for text in texts]
+        
+        cache = get_embedding_cache()
+        if cache is not None:
+            return cache.get_or_compute_many(
+                self.name, self.vector_size, list(texts), _encode_batch
+            )
+        
+        return _encode_batch(list(texts))
@@ -7,11 +7,20 @@ Groups multiple incidents into disaster event clusters based on semantic similar
 from datetime import datetime, timezone
 
 from config.qdrant_config import DISASTER_EVENTS, SITUATION_REPORTS
+from config.settings import settings
 from src.embeddings.text_embedder import TextEmbedder
 from src.qdrant.client import get_qdrant_client
-from src.qdrant.indexer import upsert_point
+from src.qdrant.indexer import upsert_points
+from src.qdrant.points import (
+    VERSION_KEY,
+    VersionConflictError,
+    backoff_retry,
+    compare_and_set_payload,
+    record_version_conflict,
+)
 from src.qdrant.searcher import search
-from src.search.filters import build_zone_filter
+from src.search.filters import build_search_filter
+from src.stream.bus import EVENT_ASSIGNED, EVENT_CREATED, publish_incident_event
 from src.utils.ids import generate_uuid
 from src.utils.time_utils import utc_now_iso
 from src.utils.logger import get_logger
@@ -69,15 +78,18 @@ class EventManager:
             "created_at": now,
             "updated_at": now,
             "timestamp_unix": now_unix,
+            VERSION_KEY: 0,
         }
         
         # Generate event ID and store
         event_id = generate_uuid()
-        upsert_point(
-            collection=self._collection,
-            point_id=event_id,
-            vector=vector,
-            payload=payload,
+        upsert_points(self._collection, [(event_id, vector, payload)])
+        publish_incident_event(
+            EVENT_CREATED,
+            incident_id=incident_id,
+            zone_id=zone_id,
+            changes={"event_id": event_id, "title": title},
+            event_id=event_id,
         )
         
         _logger.info(f"Created event {event_id[:8]}... with incident {incident_id[:8]}...")
@@ -110,7 +122,7 @@ class EventManager:
         vector = self._embedder.embed_text(text)
         
         # Build filter for same zone
-        zone_filter = build_zone_filter(zone_id) if zone_id else None
+        zone_filter = build_search_filter(zone_id=zone_id) if zone_id else None
         
         results = search(
             collection=self._collection,
@@ -166,14 +178,62 @@ class EventManager:
     ) -> None:
         """Add an incident to an existing event.
         
+        The update is a compare-and-set on the event's version; if another
+        incident was attached in the meantime, the event is re-read and the
+        update re-applied.
+        
         Args:
             event_id: Event UUID.
             incident_id: Incident UUID to add.
             incident_urgency: Urgency of the incident.
             existing_payload: Current event payload.
+        
+        Raises:
+            VersionConflictError: If all attempts lost to other writers.
+        """
+        payload = existing_payload
+        attempts = max(1, settings.REINFORCE_MAX_ATTEMPTS)
+        for attempt in range(attempts):
+            if attempt:
+                record_version_conflict()
+                backoff_retry(attempt)
+                event = self.get_event(event_id)
+                if not event:
+                    _logger.warning(f"Event {event_id} disappeared while adding {incident_id}")
+                    return
+                payload = event["payload"]
+            
+            updates = self._event_updates(payload, incident_id, incident_urgency)
+            version = compare_and_set_payload(self._collection, event_id, updates, payload)
+            if version is not None:
+                break
+            _logger.debug(f"Event {event_id[:8]}... changed, retrying ({attempt + 1})")
+        else:
+            raise VersionConflictError(
+                f"Event {event_id} changed during {attempts} update attempts"
+            )
+        
+        publish_incident_event(
+            EVENT_ASSIGNED,
+            incident_id=incident_id,
+            zone_id=payload.get("zone_id"),
+            changes={"event_id": event_id, **updates, VERSION_KEY: version},
+            event_id=event_id,
+        )
+
+    def _event_updates(self, payload: dict, incident_id: str, incident_urgency: str) -> dict:
+        """Compute event payload updates for a newly attached incident.
+        
+        Args:
+            payload: Current event payload.
+            incident_id: Incident UUID to add.
+            incident_urgency: Urgency of the incident.
+        
+        Returns:
+            Dict of updated fields.
         """
-        # Get current incident list
-        incident_ids = existing_payload.get("incident_ids", [])
+        # Get current incident list (copied: the payload may be shared)
+        incident_ids = list(payload.get("incident_ids", []))
         
         # Avoid duplicates
         if incident_id not in incident_ids:
@@ -181,25 +241,18 @@ class EventManager:
         
         # Determine max urgency
         urgency_order = {"critical": 4, "high": 3, "medium": 2, "low": 1}
-        current_max = existing_payload.get("urgency_max", "low")
+        current_max = payload.get("urgency_max", "low")
         new_max = current_max
         
         if urgency_order.get(incident_urgency, 0) > urgency_order.get(current_max, 0):
             new_max = incident_urgency
         
-        # Update payload
-        updates = {
+        return {
             "incident_ids": incident_ids,
             "incident_count": len(incident_ids),
             "urgency_max": new_max,
             "updated_at": utc_now_iso(),
         }
-        
-        self._client.set_payload(
-            collection_name=self._collection,
-            payload=updates,
-            points=[event_id],
-        )
 
     def get_event(self, event_id: str) -> dict | None:
         """Fetch event by ID.
@@ -1,5 +1,15 @@
 """RESPOND Evidence Package."""
 
+from src.evidence.store import (
+    append_evidence,
+    build_evidence_summary,
+    get_evidence_page,
+)
 from src.evidence.tracer import extract_evidence
 
-__all__ = ["extract_evidence"]
+__all__ = [
+    "append_evidence",
+    "build_evidence_summary",
+    "get_evidence_page",
+    "extract_evidence",
+]
@@ -0,0 +1,185 @@
+"""Out-of-line evidence storage for RESPOND incidents.
+
+Every piece of evidence is stored as its own point in the evidence collection
+(payload only, no vector), numbered per incident by `seq` (0, 1, 2, ...).
+The incident itself only keeps a bounded `evidence_summary`: counts, per-source
+tallies and the last few entries with shortened text. Pages of the full chain
+are read back by seq range.
+
+Incidents written before the evidence collection existed carry the whole
+chain in `evidence_chain`; they are migrated on their next reinforcement or
+evidence read (see MemoryManager).
+"""
+
+import uuid
+
+from qdrant_client.models import FieldCondition, Filter, MatchValue, PointStruct, Range
+
+from config.qdrant_config import INCIDENT_EVIDENCE
+from config.settings import settings
+from src.qdrant.client import get_qdrant_client
+from src.utils.logger import get_logger
+from src.utils.time_utils import parse_iso_datetime
+
+_logger = get_logger("evidence.store")
+
+# Namespace for deterministic evidence point IDs
+_EVIDENCE_NAMESPACE = uuid.UUID("5b0c2f57-1d6e-4a0e-9a52-2f1f4c7e9d31")
+
+
+def evidence_point_id(incident_id: str, seq: int) -> str:
+    """Deterministic point ID of an incident's seq-th piece of evidence."""
+    return str(uuid.uuid5(_EVIDENCE_NAMESPACE, f"{incident_id}:{seq}"))
+
+
+def empty_evidence_summary() -> dict:
+    """Summary of an incident without evidence."""
+    return {
+        "count": 0,
+        "accepted_count": 0,
+        "by_source": {},
+        "recent": [],
+        "first_timestamp": None,
+        "last_timestamp": None,
+    }
+
+
+def add_to_evidence_summary(summary: dict | None, entry: dict) -> dict:
+    """Fold one evidence entry into an incident's summary.
+
+    Args:
+        summary: Current summary (None for no evidence yet).
+        entry: Evidence entry (source_type, text, similarity, timestamp,
+            accepted), without seq.
+
+    Returns:
+        New summary dict; the entry is numbered with the next seq.
+    """
+    summary = summary or empty_evidence_summary()
+    seq = summary["count"]
+    accepted = bool(entry.get("accepted", False))
+
+    by_source = dict(summary["by_source"])
+    tally = by_source.get(entry["source_type"], {"count": 0, "accepted": 0})
+    by_source[entry["source_type"]] = {
+        "count": tally["count"] + 1,
+        "accepted": tally["accepted"] + int(accepted),
+    }
+
+    preview = {**entry, "seq": seq, "text": _preview(entry.get("text", ""))}
+    recent = (summary["recent"] + [preview])[-max(0, settings.EVIDENCE_RECENT_LIMIT):]
+
+    return {
+        "count": seq + 1,
+        "accepted_count": summary["accepted_count"] + int(accepted),
+        "by_source": by_source,
+        "recent": recent if settings.EVIDENCE_RECENT_LIMIT > 0 else [],
+        "first_timestamp": summary["first_timestamp"] or entry.get("timestamp"),
+        "last_timestamp": entry.get("timestamp"),
+    }
+
+
+def build_evidence_summary(entries: list[dict]) -> dict:
+    """Summarize a full evidence chain (e.g. a legacy `evidence_chain`).
+
+    Args:
+        entries: Evidence entries in chronological order.
+
+    Returns:
+        Summary dict.
+    """
+    summary = empty_evidence_summary()
+    for entry in entries:
+        summary = add_to_evidence_summary(summary, entry)
+    return summary
+
+
+def _preview(text: str) -> str:
+    """Shorten evidence text for the summary."""
+    limit = settings.EVIDENCE_PREVIEW_CHARS
+    if len(text) <= limit:
+        return text
+    return text[: max(0, limit - 3)].rstrip() + "..."
+
+
+def append_evidence(
+    incident_id: str,
+    entries: list[dict],
+    start_seq: int,
+    zone_id: str | None = None,
+) -> None:
+    """Store evidence entries for an incident.
+
+    Point IDs are derived from (incident_id, seq), so writing the same entries
+    again is idempotent.
+
+    Args:
+        incident_id: Incident UUID.
+        entries: Evidence entries in chronological order.
+        start_seq: Seq of the first entry.
+        zone_id: Zone of the incident.
+    """
+    if not entries:
+        return
+
+    points = []
+    for seq, entry in enumerate(entries, start=start_seq):
+        payload = {
+            **entry,
+            "incident_id": incident_id,
+            "zone_id": zone_id,
+            "seq": seq,
+        }
+        if entry.get("timestamp"):
+            payload["timestamp_unix"] = int(parse_iso_datetime(entry["timestamp"]).timestamp())
+        points.append(
+            PointStruct(id=evidence_point_id(incident_id, seq), vector={}, payload=payload)
+        )
+
+    get_qdrant_client().upsert(collection_name=INCIDENT_EVIDENCE, points=points)
+    _logger.debug(f"Stored {len(points)} evidence entries for incident {incident_id}")
+
+
+def get_evidence_page(
+    incident_id: str,
+    total: int,
+    offset: int = 0,
+    limit: int = 50,
+    newest_first: bool = True,
+) -> list[dict]:
+    """Read a page of an incident's evidence chain.
+
+    Args:
+        incident_id: Incident UUID.
+        total: Number of evidence entries (summary count).
+        offset: Entries to skip (from the newest if newest_first).
+        limit: Maximum entries to return.
+        newest_first: Page from the newest entry backwards.
+
+    Returns:
+        Evidence entries with seq, in page order.
+    """
+    if newest_first:
+        high = total - offset
+        low = max(0, high - limit)
+    else:
+        low = offset
+        high = min(total, offset + limit)
+    if high <= low:
+        return []
+
+    points, _ = get_qdrant_client().scroll(
+        collection_name=INCIDENT_EVIDENCE,
+        scroll_filter=Filter(must=[
+            FieldCondition(key="incident_id", match=MatchValue(value=incident_id)),
+            FieldCondition(key="seq", range=Range(gte=low, lt=high)),
+        ]),
+        limit=high - low,
+        with_payload=True,
+        with_vectors=False,
+    )
+
+    entries = sorted((point.payload for point in points), key=lambda e: e["seq"])
+    if newest_first:
+        entries.reverse()
+    return entries
@@ -1,5 +1,6 @@
 """Evidence tracer for RESPOND search results."""
 
+from src.evidence.store import build_evidence_summary
 from src.utils.logger import get_logger
 
 _logger = get_logger("evidence.tracer")
@@ -13,6 +14,8 @@ def extract_evidence(payload: dict) -> dict:
     
     Returns:
         Structured evidence object with all supporting information.
+        `evidence_chain` holds only the most recent entries (see
+        MemoryManager.get_evidence() for the full chain).
     """
     # Primary evidence from original report
     primary = {
@@ -26,19 +29,22 @@ def extract_evidence(payload: dict) -> dict:
         "zone_id": payload.get("zone_id", "unknown"),
     }
     
-    # Evidence chain from reinforcement
-    evidence_chain = payload.get("evidence_chain", [])
+    # Evidence summary from reinforcement (legacy incidents: inline chain)
+    summary = payload.get("evidence_summary")
+    if summary is None:
+        summary = build_evidence_summary(payload.get("evidence_chain", []))
     
-    # Count accepted evidence
-    accepted_count = sum(1 for e in evidence_chain if e.get("accepted", False))
+    accepted_count = summary["accepted_count"]
     
     # Build evidence summary
     evidence = {
         **primary,
-        "evidence_count": len(evidence_chain),
+        "evidence_count": summary["count"],
         "accepted_evidence_count": accepted_count,
         "is_multi_source_confirmed": accepted_count >= 1,
-        "evidence_chain": evidence_chain,
+        "evidence_by_source": summary["by_source"],
+        "evidence_chain": summary["recent"],
+        "evidence_truncated": summary["count"] > len(summary["recent"]),
     }
     
     return evidence
@@ -3,6 +3,7 @@
 from src.ingestion.base_ingester import BaseIngester
 from src.ingestion.incident_ingester import IncidentIngester
 from src.ingestion.smart_ingester import SmartIncidentIngester
+from src.ingestion.dedup_index import DedupIndex, get_dedup_index
 from src.ingestion.image_ingester import ImageIngester
 from src.ingestion.audio_ingester import AudioIngester
 
@@ -12,6 +13,8 @@ __all__ = [
     "SmartIncidentIngester",
     "ImageIngester",
     "AudioIngester",
+    "DedupIndex",
+    "get_dedup_index",
 ]
 
 
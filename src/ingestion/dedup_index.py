@@ -0,0 +1,460 @@
+"""Streaming near-duplicate index for RESPOND ingestion.
+
+Keeps the incidents of the dedup window (DEDUP_TIME_WINDOW_HOURS) in memory,
+per zone, so SmartIncidentIngester can resolve duplicates without a Qdrant
+search:
+
+1. Exact text: a hash of the case- and whitespace-normalized text (including
+   texts that already reinforced an incident) matches before any embedding.
+2. MinHash: word-shingle signatures banded into LSH buckets shortlist
+   textually near-identical incidents, which are checked by cosine first.
+3. Cosine scan: the report vector is scored against every incident vector of
+   the zone window with one matrix-vector product.
+
+Like the geo and temporal indexes, it is built from a scroll of the situation
+reports in the window, kept in sync through the incident bus, and per
+process. Entries older than the window are skipped and pruned lazily.
+"""
+
+import hashlib
+import math
+import threading
+import time
+
+import numpy as np
+
+from config.qdrant_config import SITUATION_REPORTS
+from config.settings import settings
+from src.embeddings.cache import normalize_text
+from src.memory.similarity import normalize_rows
+from src.qdrant.points import scroll_all
+from src.search.filters import build_search_filter
+from src.stream.bus import INCIDENT_CREATED, get_incident_bus
+from src.utils.logger import get_logger
+
+_logger = get_logger("ingestion.dedup_index")
+
+# MinHash signature size and LSH banding (bands * rows = permutations).
+# With 8 bands of 4 rows, texts with Jaccard 0.8 share a band ~96% of the
+# time, texts with Jaccard 0.3 ~6%.
+MINHASH_PERMUTATIONS = 32
+MINHASH_BANDS = 8
+MINHASH_ROWS = MINHASH_PERMUTATIONS // MINHASH_BANDS
+
+# Words per shingle
+SHINGLE_SIZE = 3
+
+_rng = np.random.default_rng(20240611)
+_HASH_A = _rng.integers(1, 2**63, size=MINHASH_PERMUTATIONS, dtype=np.uint64) | np.uint64(1)
+_HASH_B = _rng.integers(0, 2**63, size=MINHASH_PERMUTATIONS, dtype=np.uint64)
+
+_index: "DedupIndex | None" = None
+_index_lock = threading.Lock()
+
+
+def text_key(text: str) -> bytes:
+    """Exact-duplicate key of a report text (case and whitespace folded)."""
+    return hashlib.blake2b(normalize_text(text).lower().encode(), digest_size=16).digest()
+
+
+def minhash_signature(text: str) -> np.ndarray | None:
+    """MinHash signature of a text's word shingles.
+
+    Args:
+        text: Report text.
+
+    Returns:
+        uint64 array of MINHASH_PERMUTATIONS values, or None for empty text.
+    """
+    words = normalize_text(text).lower().split()
+    if not words:
+        return None
+    size = min(SHINGLE_SIZE, len(words))
+    shingles = {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+    base = np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "little")
+            for s in shingles
+        ),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+    # Multiply-shift universal hashing; uint64 arithmetic wraps around
+    hashed = (base[:, None] * _HASH_A[None, :] + _HASH_B[None, :]) >> np.uint64(32)
+    return hashed.min(axis=0)
+
+
+def _band_keys(signature: np.ndarray) -> list[bytes]:
+    """LSH bucket keys (one per band) of a signature."""
+    return [
+        bytes([band]) + signature[band * MINHASH_ROWS:(band + 1) * MINHASH_ROWS].tobytes()
+        for band in range(MINHASH_BANDS)
+    ]
+
+
+class _ZoneWindow:
+    """Incidents of one zone: vectors in a growable matrix, plus lookups."""
+
+    def __init__(self, dim: int):
+        self.ids: list[str] = []
+        self.times = np.zeros(64, dtype=np.int64)
+        self.vectors = np.zeros((64, dim), dtype=np.float32)
+        self.count = 0
+        self.rows: dict[str, int] = {}
+        # text key -> (incident id, timestamp_unix)
+        self.exact: dict[bytes, tuple[str, int]] = {}
+        # LSH bucket key -> incident ids
+        self.buckets: dict[bytes, set[str]] = {}
+        self.band_keys: dict[str, list[bytes]] = {}
+
+    def add(self, incident_id: str, timestamp_unix: int, vector: np.ndarray) -> None:
+        """Append (or replace) an incident's vector."""
+        row = self.rows.get(incident_id)
+        if row is None:
+            if self.count == len(self.times):
+                self.times = np.concatenate([self.times, np.zeros_like(self.times)])
+                self.vectors = np.concatenate([self.vectors, np.zeros_like(self.vectors)])
+            row = self.count
+            self.count += 1
+            self.ids.append(incident_id)
+            self.rows[incident_id] = row
+        self.times[row] = timestamp_unix
+        self.vectors[row] = vector
+
+    def add_text(self, incident_id: str, timestamp_unix: int, text: str) -> None:
+        """Register a text (report or reinforcement) for exact and MinHash lookups."""
+        if not text:
+            return
+        self.exact[text_key(text)] = (incident_id, timestamp_unix)
+        if incident_id in self.band_keys:
+            return
+        signature = minhash_signature(text)
+        if signature is None:
+            return
+        keys = _band_keys(signature)
+        self.band_keys[incident_id] = keys
+        for key in keys:
+            self.buckets.setdefault(key, set()).add(incident_id)
+
+    def prune(self, cutoff: int) -> int:
+        """Drop incidents reported before cutoff; returns the number dropped."""
+        if not self.count:
+            return 0
+        keep = np.flatnonzero(self.times[:self.count] >= cutoff)
+        dropped = self.count - len(keep)
+        if not dropped:
+            return 0
+
+        kept_ids = [self.ids[i] for i in keep]
+        removed = set(self.ids) - set(kept_ids)
+        self.times[:len(keep)] = self.times[keep]
+        self.vectors[:len(keep)] = self.vectors[keep]
+        self.ids = kept_ids
+        self.count = len(keep)
+        self.rows = {incident_id: row for row, incident_id in enumerate(kept_ids)}
+
+        self.exact = {k: v for k, v in self.exact.items() if v[1] >= cutoff}
+        for incident_id in removed:
+            for key in self.band_keys.pop(incident_id, []):
+                bucket = self.buckets.get(key)
+                if bucket is not None:
+                    bucket.discard(incident_id)
+                    if not bucket:
+                        del self.buckets[key]
+        return dropped
+
+
+class DedupIndex:
+    """Sliding-window duplicate lookup per zone."""
+
+    def __init__(self, window_hours: float, threshold: float, dim: int = 384):
+        self._window_seconds = int(window_hours * 3600)
+        self._threshold = threshold
+        self._dim = dim
+        self._zones: dict[str, _ZoneWindow] = {}
+        self._lock = threading.RLock()
+        self._touched: set[str] | None = None
+        self._pruned_at = 0.0
+        self._stats = {
+            "lookups": 0,
+            "exact_hits": 0,
+            "minhash_hits": 0,
+            "vector_hits": 0,
+            "batch_hits": 0,
+            "misses": 0,
+            "fallback_hits": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def add(self, incident_id: str, payload: dict, vector: list[float] | None) -> None:
+        """Index a new incident.
+
+        Args:
+            incident_id: Incident ID.
+            payload: Incident payload (zone_id, timestamp_unix, text).
+            vector: Incident embedding (text-only entry if None).
+        """
+        timestamp_unix = int(payload.get("timestamp_unix") or time.time())
+        if timestamp_unix < time.time() - self._window_seconds:
+            return
+        zone_id = payload.get("zone_id") or "unknown"
+        with self._lock:
+            if self._touched is not None:
+                self._touched.add(incident_id)
+            window = self._zones.get(zone_id)
+            if window is None:
+                window = self._zones[zone_id] = _ZoneWindow(self._dim)
+            if vector is not None and len(vector) == self._dim:
+                window.add(incident_id, timestamp_unix, normalize_rows(vector)[0])
+            window.add_text(incident_id, timestamp_unix, payload.get("text", ""))
+            self._maybe_prune()
+
+    def add_text(self, incident_id: str, zone_id: str | None, text: str) -> None:
+        """Map another text (e.g. a reinforcing report) to an indexed incident."""
+        with self._lock:
+            window = self._zones.get(zone_id or "unknown")
+            if window is None or incident_id not in window.rows:
+                return
+            timestamp_unix = int(window.times[window.rows[incident_id]])
+            window.exact[text_key(text)] = (incident_id, timestamp_unix)
+
+    def clear(self) -> None:
+        """Drop every indexed incident."""
+        with self._lock:
+            self._zones.clear()
+
+    def handle_event(self, event: dict) -> None:
+        """Incident bus listener keeping the index in sync."""
+        if event["type"] == INCIDENT_CREATED and event.get("payload"):
+            self.add(event["incident_id"], event["payload"], event.get("vector"))
+
+    def rebuild(self) -> int:
+        """Reload the window from the situation reports collection.
+
+        Incidents written through the bus while the scroll runs keep their
+        newer state.
+
+        Returns:
+            Number of indexed incidents.
+        """
+        started = time.perf_counter()
+        with self._lock:
+            self._touched = set()
+        try:
+            records = list(scroll_all(
+                SITUATION_REPORTS,
+                query_filter=build_search_filter(last_hours=math.ceil(self._window_seconds / 3600)),
+                with_payload=["zone_id", "timestamp_unix", "text"],
+                with_vectors=True,
+            ))
+        except Exception:
+            with self._lock:
+                self._touched = None
+            raise
+
+        with self._lock:
+            touched = self._touched
+            self._touched = None
+            for record in records:
+                if record["id"] in touched:
+                    continue
+                self.add(record["id"], record["payload"] or {}, record.get("vector"))
+            count = sum(window.count for window in self._zones.values())
+
+        _logger.info(
+            f"Dedup index rebuilt: {count} incidents in "
+            f"{(time.perf_counter() - started) * 1000:.1f}ms"
+        )
+        return count
+
+    def _maybe_prune(self) -> None:
+        """Prune expired incidents at most once a minute. Caller holds the lock."""
+        now = time.time()
+        if now - self._pruned_at < 60:
+            return
+        self._pruned_at = now
+        cutoff = int(now) - self._window_seconds
+        for zone_id in list(self._zones):
+            window = self._zones[zone_id]
+            window.prune(cutoff)
+            if not window.count and not window.exact:
+                del self._zones[zone_id]
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def find_exact(self, text: str, zone_id: str | None) -> dict | None:
+        """Look up an incident with the same normalized text.
+
+        Args:
+            text: Report text.
+            zone_id: Zone to search (all zones if None).
+
+        Returns:
+            Dict with incident_id, similarity (1.0) and match ("exact"), or None.
+        """
+        key = text_key(text)
+        cutoff = int(time.time()) - self._window_seconds
+        with self._lock:
+            for window in self._windows(zone_id):
+                match = window.exact.get(key)
+                if match is not None and match[1] >= cutoff:
+                    return {"incident_id": match[0], "similarity": 1.0, "match": "exact"}
+        return None
+
+    def find_similar(self, text: str, vector: list[float], zone_id: str | None) -> dict | None:
+        """Find the most similar incident at or above the dedup threshold.
+
+        MinHash candidates are scored first; if none qualifies, the whole
+        zone window is scanned.
+
+        Args:
+            text: Report text.
+            vector: Report embedding.
+            zone_id: Zone to search (all zones if None).
+
+        Returns:
+            Dict with incident_id, similarity and match ("minhash" or
+            "vector"), or None.
+        """
+        query = normalize_rows(vector)[0]
+        cutoff = int(time.time()) - self._window_seconds
+        signature = minhash_signature(text)
+        keys = _band_keys(signature) if signature is not None else []
+
+        best = None
+        with self._lock:
+            windows = self._windows(zone_id)
+
+            # Shortlist textually near-identical incidents
+            for window in windows:
+                candidates = set()
+                for key in keys:
+                    candidates |= window.buckets.get(key, set())
+                rows = [window.rows[c] for c in candidates if c in window.rows]
+                best = self._best(window, rows, query, cutoff, "minhash", best)
+            if best is not None:
+                return best
+
+            for window in windows:
+                best = self._best(window, None, query, cutoff, "vector", best)
+        return best
+
+    def record(self, match: str | None) -> None:
+        """Count a dedup decision.
+
+        Args:
+            match: "exact", "minhash", "vector", "batch" (a report of the
+                same ingestion batch), "fallback" (found by the Qdrant search
+                after an index miss) or None (new incident).
+        """
+        with self._lock:
+            self._stats["lookups"] += 1
+            if match == "fallback":
+                self._stats["misses"] += 1
+                self._stats["fallback_hits"] += 1
+            elif match is None:
+                self._stats["misses"] += 1
+            else:
+                self._stats[f"{match}_hits"] += 1
+
+    def stats(self) -> dict:
+        """Get index statistics.
+
+        Returns:
+            Dict with lookup counters, hit_rate (share of lookups resolved
+            without a Qdrant search), zones and incidents.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["zones"] = len(self._zones)
+            stats["incidents"] = sum(window.count for window in self._zones.values())
+        hits = (
+            stats["exact_hits"] + stats["minhash_hits"]
+            + stats["vector_hits"] + stats["batch_hits"]
+        )
+        stats["hit_rate"] = hits / stats["lookups"] if stats["lookups"] else 0.0
+        return stats
+
+    def _windows(self, zone_id: str | None) -> list[_ZoneWindow]:
+        """Zone windows to search. Caller holds the lock."""
+        if zone_id is None:
+            return list(self._zones.values())
+        window = self._zones.get(zone_id)
+        return [window] if window is not None else []
+
+    def _best(
+        self,
+        window: _ZoneWindow,
+        rows: list[int] | None,
+        query: np.ndarray,
+        cutoff: int,
+        match: str,
+        best: dict | None,
+    ) -> dict | None:
+        """Best in-window match among rows (all rows if None) above the threshold."""
+        if not window.count or (rows is not None and not rows):
+            return best
+        if rows is None:
+            scores = window.vectors[:window.count] @ query
+            scores[window.times[:window.count] < cutoff] = -np.inf
+            candidates = np.arange(window.count)
+        else:
+            candidates = np.asarray(rows)
+            scores = window.vectors[candidates] @ query
+            scores[window.times[candidates] < cutoff] = -np.inf
+
+        top = int(np.argmax(scores))
+        similarity = float(scores[top])
+        if similarity < self._threshold:
+            return best
+        if best is not None and best["similarity"] >= similarity:
+            return best
+        return {
+            "incident_id": window.ids[int(candidates[top])],
+            "similarity": similarity,
+            "match": match,
+        }
+
+
+def get_dedup_index() -> DedupIndex | None:
+    """Get the process-wide dedup index, building it on first use.
+
+    Returns:
+        Shared DedupIndex, or None if the dedup index is disabled.
+    """
+    global _index
+
+    if not settings.DEDUP_INDEX_ENABLED:
+        return None
+
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                from src.ingestion.smart_ingester import (
+                    DEDUP_SIMILARITY_THRESHOLD,
+                    DEDUP_TIME_WINDOW_HOURS,
+                )
+                index = DedupIndex(
+                    window_hours=DEDUP_TIME_WINDOW_HOURS,
+                    threshold=DEDUP_SIMILARITY_THRESHOLD,
+                )
+                # Listen before scrolling so no write falls between the two
+                get_incident_bus().add_listener(index.handle_event)
+                try:
+                    index.rebuild()
+                except Exception as e:
+                    _logger.warning(f"Dedup index rebuild failed, starting empty: {e}")
+                _index = index
+
+    return _index
+
+
+def reset_dedup_index() -> None:
+    """Empty the dedup index after its collection was dropped (no-op if unbuilt)."""
+    if _index is not None:
+        _index.clear()
@@ -10,7 +10,7 @@ from pathlib import Path
 
 from config.qdrant_config import INCIDENT_IMAGES, SUPPORTED_IMAGE_TYPES
 from src.embeddings.image_embedder import ImageEmbedder
-from src.qdrant.indexer import upsert_point
+from src.qdrant.indexer import upsert_points
 from src.utils.ids import generate_uuid
 from src.utils.time_utils import utc_now_iso
 from src.utils.logger import get_logger
@@ -84,12 +84,7 @@ class ImageIngester:
         
         # Generate ID and upsert to Qdrant
         image_point_id = generate_uuid()
-        upsert_point(
-            collection=INCIDENT_IMAGES,
-            point_id=image_point_id,
-            vector=vector,
-            payload=payload,
-        )
+        upsert_points(INCIDENT_IMAGES, [(image_point_id, vector, payload)])
         
         _logger.info(
             f"Ingested image {image_point_id[:8]}... "
@@ -1,7 +1,9 @@
 """Incident ingester for RESPOND."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
+from config.settings import settings
 from config.qdrant_config import (
     SITUATION_REPORTS,
     SUPPORTED_SOURCE_TYPES,
@@ -10,7 +12,10 @@ from config.qdrant_config import (
 )
 from src.ingestion.base_ingester import BaseIngester
 from src.embeddings.text_embedder import TextEmbedder
-from src.qdrant.indexer import upsert_point
+from src.qdrant.indexer import upsert_points
+from src.qdrant.points import VERSION_KEY
+from src.search.result_cache import invalidate_search_cache
+from src.stream.bus import INCIDENT_CREATED, publish_incident_event
 from src.utils.ids import generate_uuid
 from src.utils.time_utils import utc_now_iso, parse_iso_datetime
 from src.utils.geo_utils import is_valid_lat_lon
@@ -25,6 +30,16 @@ def _iso_to_unix(iso_str: str) -> int:
     return int(dt.timestamp())
 
 
+def _item_result(index: int, incident_id: str | None = None, error: str | None = None) -> dict:
+    """Build a per-item bulk ingestion result."""
+    return {
+        "index": index,
+        "status": "error" if error else "created",
+        "incident_id": incident_id,
+        "error": error,
+    }
+
+
 class IncidentIngester(BaseIngester):
     """Ingests incident reports into Qdrant SITUATION_REPORTS collection."""
 
@@ -51,6 +66,112 @@ class IncidentIngester(BaseIngester):
         # Validate required fields
         self._validate(data)
         
+        # Build payload
+        payload = self._build_payload(data)
+        
+        # Generate embedding
+        vector = self._embedder.embed_text(payload["text"])
+        
+        # Generate ID and upsert
+        incident_id = generate_uuid()
+        upsert_points(SITUATION_REPORTS, [(incident_id, vector, payload)])
+        invalidate_search_cache(payload["zone_id"])
+        publish_incident_event(
+            INCIDENT_CREATED,
+            incident_id=incident_id,
+            zone_id=payload["zone_id"],
+            payload=payload,
+            vector=vector,
+        )
+        
+        _logger.info(f"Ingested incident {incident_id} from {payload['source_type']}")
+        return incident_id
+
+    def ingest_many(self, items: list[dict]) -> list[dict]:
+        """Ingest many incident reports with batched embedding and upserts.
+        
+        Items are validated individually, embedded in chunks with one
+        forward pass per chunk, and written with batched upserts. Writing
+        chunk N overlaps with embedding chunk N+1. No deduplication is done
+        (see SmartIncidentIngester.ingest_many).
+        
+        Args:
+            items: List of incident data dicts (same keys as ingest()).
+        
+        Returns:
+            List of per-item dicts with index, status ("created" or "error"),
+            incident_id, and error, in input order.
+        """
+        results: list[dict | None] = [None] * len(items)
+        
+        # Validate and build payloads
+        valid = []
+        for index, data in enumerate(items):
+            try:
+                if not isinstance(data, dict):
+                    raise ValueError("item must be a JSON object")
+                self._validate(data)
+                valid.append((index, self._build_payload(data)))
+            except (ValueError, TypeError, KeyError, AttributeError) as e:
+                results[index] = _item_result(index, error=str(e))
+        
+        chunk_size = settings.BULK_INGEST_CHUNK_SIZE
+        pending = []
+        
+        # Embed chunk by chunk while the previous chunk is being written
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            for start in range(0, len(valid), chunk_size):
+                chunk = valid[start:start + chunk_size]
+                try:
+                    vectors = self._embedder.embed_texts([p["text"] for _, p in chunk])
+                except Exception as e:
+                    _logger.error(f"Bulk embedding failed for {len(chunk)} items: {e}")
+                    for index, _ in chunk:
+                        results[index] = _item_result(index, error=f"embedding failed: {e}")
+                    continue
+                
+                points = [
+                    (generate_uuid(), vector, payload)
+                    for (_, payload), vector in zip(chunk, vectors)
+                ]
+                future = writer.submit(upsert_points, SITUATION_REPORTS, points)
+                pending.append((chunk, points, future))
+            
+            for chunk, points, future in pending:
+                try:
+                    future.result()
+                except Exception as e:
+                    _logger.error(f"Bulk upsert failed for {len(chunk)} items: {e}")
+                    for index, _ in chunk:
+                        results[index] = _item_result(index, error=f"write failed: {e}")
+                    continue
+                
+                for (index, _), (incident_id, vector, payload) in zip(chunk, points):
+                    results[index] = _item_result(index, incident_id=incident_id)
+                    publish_incident_event(
+                        INCIDENT_CREATED,
+                        incident_id=incident_id,
+                        zone_id=payload["zone_id"],
+                        payload=payload,
+                        vector=vector,
+                    )
+                
+                for zone_id in {payload["zone_id"] for _, payload in chunk}:
+                    invalidate_search_cache(zone_id)
+        
+        created = sum(1 for r in results if r["status"] == "created")
+        _logger.info(f"Bulk ingested {created}/{len(items)} incidents")
+        return results
+
+    def _build_payload(self, data: dict) -> dict:
+        """Build the stored payload for validated incident data.
+        
+        Args:
+            data: Validated incident data.
+        
+        Returns:
+            Payload dict.
+        """
         # Extract and normalize fields
         text = data["text"]
         source_type = data["source_type"]
@@ -66,9 +187,6 @@ class IncidentIngester(BaseIngester):
         confidence_score = data.get("confidence_score", 0.5)
         location = data.get("location")
         
-        # Generate embedding
-        vector = self._embedder.embed_text(text)
-        
         # Build payload
         payload = {
             "text": text,
@@ -81,6 +199,7 @@ class IncidentIngester(BaseIngester):
             "confidence_score": float(confidence_score),
             "created_at": now,
             "updated_at": now,
+            VERSION_KEY: 0,
         }
         
         # Add location if provided
@@ -90,17 +209,7 @@ class IncidentIngester(BaseIngester):
                 "lon": float(location["lon"]),
             }
         
-        # Generate ID and upsert
-        incident_id = generate_uuid()
-        upsert_point(
-            collection=SITUATION_REPORTS,
-            point_id=incident_id,
-            vector=vector,
-            payload=payload,
-        )
-        
-        _logger.info(f"Ingested incident {incident_id} from {source_type}")
-        return incident_id
+        return payload
 
     def _validate(self, data: dict) -> None:
         """Validate incident data.
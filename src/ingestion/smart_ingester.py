@@ -4,11 +4,31 @@ This module implements Phase 11.1: Auto Deduplication + Auto Reinforcement.
 Before inserting a new incident, it searches for similar incidents and either:
 - Reinforces an existing incident if similarity >= 0.80
 - Creates a new incident otherwise
+
+Duplicates are looked up in the in-memory dedup index first (see
+dedup_index.py); Qdrant is only searched when the index has no match.
+
+Reports are deduplicated in per-zone batches: concurrent reports for a zone
+are collected for DEDUP_COALESCE_MS and handled together by one caller,
+while later reports wait for the batch to be written. Reports of a batch are
+compared with each other as well, so simultaneous duplicates become one new
+incident. Index misses of a batch are searched in Qdrant with one batched
+search, new incidents are created with one batched write, and all
+reinforcements of an incident are one batched write.
 """
 
+import threading
+
+import numpy as np
+
+from config.settings import settings
+from src.embeddings.text_embedder import TextEmbedder
+from src.ingestion.dedup_index import get_dedup_index, text_key
 from src.ingestion.incident_ingester import IncidentIngester
 from src.search.hybrid_search import HybridSearcher
+from src.memory.combiner import WriteCombiner
 from src.memory.memory_manager import MemoryManager
+from src.memory.similarity import cosine_matrix
 from src.utils.logger import get_logger
 
 _logger = get_logger("ingestion.smart")
@@ -19,19 +39,37 @@ DEDUP_SIMILARITY_THRESHOLD = 0.70
 # Time window for deduplication (in hours)
 DEDUP_TIME_WINDOW_HOURS = 2
 
+_batcher: WriteCombiner | None = None
+_batcher_lock = threading.Lock()
+
+
+def get_dedup_batcher() -> WriteCombiner:
+    """Get the shared per-zone batcher for deduplicating ingestion."""
+    global _batcher
+    if _batcher is None:
+        with _batcher_lock:
+            if _batcher is None:
+                _batcher = WriteCombiner(window_ms=settings.DEDUP_COALESCE_MS)
+    return _batcher
+
 
 class SmartIncidentIngester:
     """Smart ingester that auto-deduplicates similar incidents.
     
     Behavior:
-    1. Embed incoming incident text
-    2. Search for similar incidents in last 2 hours (same zone if provided)
-    3. If top result similarity >= 0.80: reinforce existing incident
-    4. Otherwise: insert as new incident
+    1. Look up the exact text in the dedup index
+    2. Embed incoming incident text and look it up in the dedup index
+    3. Compare it with earlier reports of the same batch
+    4. On a miss, search for similar incidents in last 2 hours
+       (same zone if provided, batched per zone), unless
+       DEDUP_INDEX_AUTHORITATIVE is set
+    5. If top result similarity >= 0.80: reinforce existing incident
+    6. Otherwise: insert as new incident
     """
 
     def __init__(self):
         self._basic_ingester = IncidentIngester()
+        self._embedder = TextEmbedder()
         self._searcher = HybridSearcher()
         self._memory_manager = MemoryManager()
 
@@ -51,60 +89,278 @@ class SmartIncidentIngester:
         Raises:
             ValueError: If validation fails.
         """
-        text = data.get("text", "")
-        source_type = data.get("source_type", "")
+        # Validate input (reuse validation from basic ingester)
+        self._basic_ingester._validate(data)
+        
         zone_id = data.get("zone_id")
+        _logger.info(f"Searching for duplicates: zone={zone_id}, text='{data['text'][:50]}...'")
         
-        # Step 1: Validate input (reuse validation from basic ingester)
-        self._basic_ingester._validate(data)
+        result = get_dedup_batcher().submit(zone_id or "", [data], self._ingest_batch)
+        outcome = result["results"][0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def ingest_many(self, items: list[dict]) -> list[dict]:
+        """Ingest many incident reports with auto-deduplication.
         
-        # Step 2: Search for similar incidents in last 2 hours
-        _logger.info(f"Searching for duplicates: zone={zone_id}, text='{text[:50]}...'")
+        Items are validated individually and deduplicated zone by zone in
+        chunks of BULK_INGEST_CHUNK_SIZE, against recent incidents and
+        against each other.
         
-        similar_incidents = self._searcher.search_incidents(
-            query=text,
-            limit=3,
-            last_hours=DEDUP_TIME_WINDOW_HOURS,
-            zone_id=zone_id,
-        )
+        Args:
+            items: List of incident data dicts (same keys as ingest()).
         
-        # Step 3: Check if top result is above threshold
-        if similar_incidents:
-            top_result = similar_incidents[0]
-            similarity = top_result["score"]
-            
-            _logger.info(f"Top match: id={top_result['id'][:8]}..., similarity={similarity:.3f}")
-            
-            if similarity >= DEDUP_SIMILARITY_THRESHOLD:
-                # Reinforce existing incident instead of creating new
-                existing_id = top_result["id"]
-                
-                _logger.info(
-                    f"DEDUP: Similarity {similarity:.3f} >= {DEDUP_SIMILARITY_THRESHOLD}, "
-                    f"reinforcing incident {existing_id[:8]}..."
-                )
+        Returns:
+            List of per-item dicts with index, status ("created",
+            "deduplicated" or "error"), incident_id, and error, in input order.
+        """
+        results: list[dict | None] = [None] * len(items)
+        
+        by_zone: dict[str, list[tuple[int, dict]]] = {}
+        for index, data in enumerate(items):
+            try:
+                if not isinstance(data, dict):
+                    raise ValueError("item must be a JSON object")
+                self._basic_ingester._validate(data)
+            except (ValueError, TypeError, KeyError, AttributeError) as e:
+                results[index] = {"index": index, "status": "error", "incident_id": None, "error": str(e)}
+                continue
+            by_zone.setdefault(data.get("zone_id") or "", []).append((index, data))
+        
+        chunk_size = settings.BULK_INGEST_CHUNK_SIZE
+        batcher = get_dedup_batcher()
+        for zone_key, zone_items in by_zone.items():
+            for start in range(0, len(zone_items), chunk_size):
+                chunk = zone_items[start:start + chunk_size]
+                try:
+                    outcomes = batcher.submit(
+                        zone_key, [data for _, data in chunk], self._ingest_batch
+                    )["results"]
+                except Exception as e:
+                    outcomes = [e] * len(chunk)
                 
-                # Call reinforce on the existing incident
-                reinforce_result = self._memory_manager.reinforce(
-                    incident_id=existing_id,
-                    new_source_type=source_type,
-                    new_text=text,
+                for (index, _), outcome in zip(chunk, outcomes):
+                    if isinstance(outcome, Exception):
+                        results[index] = {
+                            "index": index, "status": "error",
+                            "incident_id": None, "error": str(outcome),
+                        }
+                    else:
+                        results[index] = {
+                            "index": index,
+                            "status": "deduplicated" if outcome["deduplicated"] else "created",
+                            "incident_id": outcome["incident_id"],
+                            "error": None,
+                        }
+        
+        created = sum(1 for r in results if r["status"] == "created")
+        deduplicated = sum(1 for r in results if r["status"] == "deduplicated")
+        _logger.info(
+            f"Bulk ingested {len(items)} incidents with dedup: "
+            f"{created} created, {deduplicated} deduplicated"
+        )
+        return results
+
+    def _ingest_batch(self, zone_key: str, items: list[dict]) -> dict:
+        """Deduplicate and write a batch of validated reports for one zone.
+        
+        Called by the batcher; no other batch of this zone runs concurrently.
+        
+        Args:
+            zone_key: Zone ID ("" for reports without a zone).
+            items: Incident data dicts in arrival order.
+        
+        Returns:
+            Dict whose "results" list has one ingest() result (or the
+            exception that failed it) per item.
+        """
+        zone_id = zone_key or None
+        index = get_dedup_index()
+        keys = [text_key(data["text"]) for data in items]
+        
+        # Exact duplicates of indexed incidents need no embedding
+        matches: list[dict | None] = [
+            index.find_exact(data["text"], zone_id) if index is not None else None
+            for data in items
+        ]
+        to_embed = [i for i, match in enumerate(matches) if match is None]
+        vectors: dict[int, list[float]] = {}
+        if to_embed:
+            embedded = self._embedder.embed_texts([items[i]["text"] for i in to_embed])
+            vectors = dict(zip(to_embed, embedded))
+        similarities = cosine_matrix([vectors[i] for i in to_embed]) if to_embed else None
+        position = {i: p for p, i in enumerate(to_embed)}
+        
+        # Look the index misses up in Qdrant with one batched search
+        if index is not None:
+            for i, data in enumerate(items):
+                if matches[i] is None:
+                    matches[i] = index.find_similar(data["text"], vectors[i], zone_id)
+        found = self._search_duplicates(
+            {i: items[i]["text"] for i, match in enumerate(matches) if match is None},
+            zone_id,
+            index,
+        )
+        
+        # Assign each report to an existing incident, an earlier report of
+        # the batch (a "leader" that becomes a new incident), or itself
+        leaders: list[int] = []
+        leader_of: dict[int, int] = {}
+        for i in range(len(items)):
+            if matches[i] is None:
+                leader, similarity = self._match_in_batch(
+                    i, leaders, keys, position, similarities
                 )
-                
-                return {
-                    "incident_id": existing_id,
-                    "message": "Incident reinforced (deduplicated)",
-                    "deduplicated": True,
-                    "similarity": round(similarity, 4),
-                    "new_confidence": reinforce_result["new_confidence"],
+                if leader is not None:
+                    leader_of[i] = leader
+                    matches[i] = {"incident_id": None, "similarity": similarity, "match": "batch"}
+            if matches[i] is None:
+                matches[i] = found.get(i)
+            if matches[i] is None:
+                leaders.append(i)
+            if index is not None:
+                index.record(matches[i]["match"] if matches[i] else None)
+        
+        results: list[dict | Exception | None] = [None] * len(items)
+        
+        # Create the leaders' incidents with one batched write
+        if leaders:
+            created = self._basic_ingester.ingest_many([items[i] for i in leaders])
+            for i, outcome in zip(leaders, created):
+                if outcome["status"] == "error":
+                    _logger.error(f"Ingest failed: {outcome['error']}")
+                    results[i] = RuntimeError(outcome["error"])
+                    continue
+                results[i] = {
+                    "incident_id": outcome["incident_id"],
+                    "message": "Incident ingested successfully",
+                    "deduplicated": False,
                 }
         
-        # Step 4: No similar incident found, insert normally
-        _logger.info("No duplicate found, creating new incident")
-        incident_id = self._basic_ingester.ingest(data)
+        # Reinforce each matched incident with one batched write
+        groups: dict[str, list[int]] = {}
+        for i, match in enumerate(matches):
+            if match is None:
+                continue
+            if i in leader_of:
+                leader_result = results[leader_of[i]]
+                if isinstance(leader_result, Exception):
+                    results[i] = leader_result
+                    continue
+                match["incident_id"] = leader_result["incident_id"]
+            groups.setdefault(match["incident_id"], []).append(i)
+        
+        for incident_id, members in groups.items():
+            self._reinforce_group(incident_id, members, items, matches, results, zone_id)
+        
+        return {"results": results}
+
+    def _match_in_batch(
+        self,
+        i: int,
+        leaders: list[int],
+        keys: list[bytes],
+        position: dict[int, int],
+        similarities: np.ndarray | None,
+    ) -> tuple[int | None, float]:
+        """Find the earlier report of the batch that report i duplicates.
+        
+        Returns:
+            (leader index, similarity), or (None, 0.0).
+        """
+        best, best_similarity = None, 0.0
+        for leader in leaders:
+            if keys[leader] == keys[i]:
+                return leader, 1.0
+            if i in position and leader in position:
+                similarity = float(similarities[position[i], position[leader]])
+                if similarity >= DEDUP_SIMILARITY_THRESHOLD and similarity > best_similarity:
+                    best, best_similarity = leader, similarity
+        return best, best_similarity
+
+    def _search_duplicates(
+        self,
+        texts: dict[int, str],
+        zone_id: str | None,
+        index,
+    ) -> dict[int, dict]:
+        """Search Qdrant for incidents that reports duplicate, in one batch.
+        
+        Skipped (no matches) when the dedup index is authoritative.
+        
+        Args:
+            texts: Report texts by position in the batch.
+            zone_id: Zone of the reports.
+            index: Dedup index, or None if disabled.
+        
+        Returns:
+            Dict mapping positions to a dict with incident_id, similarity and
+            match ("fallback"); positions without a duplicate are left out.
+        """
+        if not texts or (index is not None and settings.DEDUP_INDEX_AUTHORITATIVE):
+            return {}
+        
+        searches = self._searcher.search_incidents_batch([
+            {
+                "query": text,
+                "limit": 3,
+                "last_hours": DEDUP_TIME_WINDOW_HOURS,
+                "zone_id": zone_id,
+            }
+            for text in texts.values()
+        ])
+        
+        found = {}
+        for i, similar_incidents in zip(texts, searches):
+            if not similar_incidents:
+                continue
+            top_result = similar_incidents[0]
+            _logger.info(f"Top match: id={top_result['id'][:8]}..., similarity={top_result['score']:.3f}")
+            if top_result["score"] >= DEDUP_SIMILARITY_THRESHOLD:
+                found[i] = {
+                    "incident_id": top_result["id"],
+                    "similarity": top_result["score"],
+                    "match": "fallback",
+                }
+        return found
+
+    def _reinforce_group(
+        self,
+        incident_id: str,
+        members: list[int],
+        items: list[dict],
+        matches: list[dict | None],
+        results: list,
+        zone_id: str | None,
+    ) -> None:
+        """Reinforce an incident with the reports matched to it, in one write."""
+        _logger.info(
+            f"DEDUP: {len(members)} report(s) >= {DEDUP_SIMILARITY_THRESHOLD}, "
+            f"reinforcing incident {incident_id[:8]}..."
+        )
+        try:
+            reinforce_result = self._memory_manager.reinforce_batch(
+                incident_id,
+                [
+                    {"source_type": items[i]["source_type"], "text": items[i]["text"]}
+                    for i in members
+                ],
+            )
+        except Exception as e:
+            _logger.error(f"Reinforcing incident {incident_id} failed: {e}")
+            for i in members:
+                results[i] = e
+            return
         
-        return {
-            "incident_id": incident_id,
-            "message": "Incident ingested successfully",
-            "deduplicated": False,
-        }
+        index = get_dedup_index()
+        for i, evidence in zip(members, reinforce_result["results"]):
+            if index is not None:
+                index.add_text(incident_id, zone_id, items[i]["text"])
+            results[i] = {
+                "incident_id": incident_id,
+                "message": "Incident reinforced (deduplicated)",
+                "deduplicated": True,
+                "similarity": round(matches[i]["similarity"], 4),
+                "new_confidence": evidence["new_confidence"],
+            }
@@ -1,5 +1,5 @@
 """RESPOND Memory Package."""
 
-from src.memory.memory_manager import MemoryManager
+from src.memory.memory_manager import MemoryManager, get_reinforcement_stats
 
-__all__ = ["MemoryManager"]
+__all__ = ["MemoryManager", "get_reinforcement_stats"]
@@ -0,0 +1,152 @@
+"""Per-incident write combining for RESPOND reinforcement.
+
+Concurrent reinforcements of the same incident are queued and applied by one
+caller at a time (the leader) as a single batched write. Callers that arrive
+while a write is in flight wait and are applied together in the next write,
+whose leader is the first of them. Different incidents never wait on each
+other.
+
+The same mechanism serializes and batches deduplicating ingestion per zone
+(see SmartIncidentIngester); there the leader first waits a short coalescing
+window so that a burst of reports is handled as one batch.
+"""
+
+import threading
+import time
+from typing import Callable
+
+from src.utils.logger import get_logger
+
+_logger = get_logger("memory.combiner")
+
+_combiner: "WriteCombiner | None" = None
+_combiner_lock = threading.Lock()
+
+
+class _Request:
+    """One caller's items waiting to be written."""
+
+    def __init__(self, items: list[dict], lock: threading.Lock):
+        self.items = items
+        self.cond = threading.Condition(lock)
+        self.done = False
+        self.lead = False
+        self.result: dict | None = None
+        self.error: Exception | None = None
+
+
+class WriteCombiner:
+    """Leader/follower write combining keyed by incident ID (or zone)."""
+
+    def __init__(self, window_ms: float = 0.0):
+        """Initialize the combiner.
+
+        Args:
+            window_ms: How long a leader waits for more callers before
+                applying the queued items.
+        """
+        self._window = max(0.0, window_ms) / 1000.0
+        self._lock = threading.Lock()
+        self._pending: dict[str, list[_Request]] = {}
+        self._active: set[str] = set()
+        self._stats = {"writes": 0, "requests": 0, "items": 0, "max_requests": 0}
+
+    def submit(
+        self,
+        key: str,
+        items: list[dict],
+        apply_fn: Callable[[str, list[dict]], dict],
+    ) -> dict:
+        """Write items for a key, combined with concurrent callers.
+
+        Args:
+            key: Incident ID (or other key writes are combined by).
+            items: Items to apply (e.g. evidence dicts).
+            apply_fn: Applies a flat list of items in one write. Returns a dict
+                whose "results" list has one entry per item; the other keys
+                are shared by all combined callers.
+
+        Returns:
+            The write's dict with "results" narrowed to this caller's items.
+
+        Raises:
+            Exception: Whatever apply_fn raised for the combined write.
+        """
+        with self._lock:
+            request = _Request(items, self._lock)
+            self._pending.setdefault(key, []).append(request)
+            if key not in self._active:
+                self._active.add(key)
+                request.lead = True
+            while not request.lead and not request.done:
+                request.cond.wait()
+
+        if not request.done:
+            self._lead(key, apply_fn)
+
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def stats(self) -> dict:
+        """Get combining statistics.
+
+        Returns:
+            Dict with writes, requests, items, max_requests and
+            avg_requests (callers per write).
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats["avg_requests"] = stats["requests"] / stats["writes"] if stats["writes"] else 0.0
+        return stats
+
+    def _lead(self, key: str, apply_fn: Callable[[str, list[dict]], dict]) -> None:
+        """Apply everything queued for a key, then hand leadership on."""
+        if self._window:
+            time.sleep(self._window)
+        with self._lock:
+            batch = self._pending.pop(key, [])
+            self._stats["writes"] += 1
+            self._stats["requests"] += len(batch)
+            self._stats["items"] += sum(len(r.items) for r in batch)
+            self._stats["max_requests"] = max(self._stats["max_requests"], len(batch))
+
+        items = [item for request in batch for item in request.items]
+        result = error = None
+        try:
+            result = apply_fn(key, items)
+        except Exception as e:
+            error = e
+
+        if len(batch) > 1:
+            _logger.debug(f"Combined {len(batch)} writes ({len(items)} items) for {key}")
+
+        with self._lock:
+            start = 0
+            for request in batch:
+                if error is not None:
+                    request.error = error
+                else:
+                    end = start + len(request.items)
+                    request.result = {**result, "results": result["results"][start:end]}
+                    start = end
+                request.done = True
+                request.cond.notify()
+
+            # Callers queued during the write: promote the first to leader
+            waiting = self._pending.get(key)
+            if waiting:
+                waiting[0].lead = True
+                waiting[0].cond.notify()
+            else:
+                self._active.discard(key)
+
+
+def get_write_combiner() -> WriteCombiner:
+    """Get the shared reinforcement write combiner."""
+    global _combiner
+    if _combiner is None:
+        with _combiner_lock:
+            if _combiner is None:
+                _combiner = WriteCombiner()
+    return _combiner
@@ -1,11 +1,42 @@
-"""Time-decay utilities for RESPOND incident ranking."""
+"""Time-decay utilities for RESPOND incident ranking.
 
-from datetime import datetime, timezone
+Decay curves map incident age (and optionally urgency) to a factor in
+[0, 1] that multiplies the similarity score:
 
+- step: the original piecewise schedule (1h / 6h / 24h)
+- exponential: halves every DECAY_HALF_LIFE_HOURS
+- urgency: exponential with a half-life per urgency level
+
+Curves work on numpy arrays so a whole result page is decayed at once
+against a single `now`. Each built-in curve can also be expressed as a
+Qdrant formula query, so the server ranks by decayed score directly.
+"""
+
+import time
+from typing import Callable, Sequence
+
+import numpy as np
+from qdrant_client import models
+
+from config.settings import settings
 from src.utils.logger import get_logger
 
 _logger = get_logger("memory.decay")
 
+# Step schedule: (max age in seconds, decay factor), oldest bucket last
+STEP_SCHEDULE = [
+    (3600, 1.0),  # <= 1 hour
+    (21600, 0.8),  # <= 6 hours
+    (86400, 0.5),  # <= 24 hours
+]
+STEP_FLOOR = 0.2
+
+# Ages at which decay_horizon() evaluates the curves (0, then 1 min to 30 days)
+_HORIZON_GRID = np.unique(np.ceil(np.concatenate([[0.0], np.geomspace(60, 30 * 86400, 160)])))
+
+DecayCurve = Callable[[np.ndarray, Sequence[str | None] | None], np.ndarray]
+FormulaBuilder = Callable[[int], models.Expression]
+
 
 def compute_decay_factor(age_seconds: int) -> float:
     """Compute decay factor based on age.
@@ -26,12 +57,285 @@ def compute_decay_factor(age_seconds: int) -> float:
         return 0.2
 
 
-def apply_decay(similarity_score: float, timestamp_unix: int | None) -> dict:
+def step_decay(age_seconds: np.ndarray, urgencies: Sequence[str | None] | None = None) -> np.ndarray:
+    """Piecewise decay matching compute_decay_factor()."""
+    factors = np.full(age_seconds.shape, STEP_FLOOR, dtype=np.float64)
+    # Fill from the oldest bucket down so younger buckets win
+    for max_age, factor in reversed(STEP_SCHEDULE):
+        factors[age_seconds <= max_age] = factor
+    return factors
+
+
+def exponential_decay(
+    age_seconds: np.ndarray,
+    urgencies: Sequence[str | None] | None = None,
+) -> np.ndarray:
+    """Continuous decay halving every DECAY_HALF_LIFE_HOURS."""
+    half_life = settings.DECAY_HALF_LIFE_HOURS * 3600
+    return np.exp2(-age_seconds / half_life)
+
+
+def urgency_decay(
+    age_seconds: np.ndarray,
+    urgencies: Sequence[str | None] | None = None,
+) -> np.ndarray:
+    """Exponential decay with a per-urgency half-life.
+    
+    Urgencies missing from DECAY_URGENCY_HALF_LIFE_HOURS use
+    DECAY_HALF_LIFE_HOURS.
+    """
+    default = settings.DECAY_HALF_LIFE_HOURS
+    if urgencies is None:
+        half_lives = np.full(age_seconds.shape, default)
+    else:
+        table = settings.DECAY_URGENCY_HALF_LIFE_HOURS
+        half_lives = np.array([table.get(u, default) for u in urgencies], dtype=np.float64)
+    return np.exp2(-age_seconds / (half_lives * 3600))
+
+
+def _clamped_timestamp(now_unix: int) -> models.Expression:
+    """Server-side min(timestamp_unix, now), as (ts + now - |now - ts|) / 2.
+    
+    Qdrant's decay functions use the absolute distance to the target, so
+    without the clamp incidents stamped in the future (clock skew) would
+    decay instead of counting as brand new like apply_decay_batch() does.
+    """
+    distance = models.SumExpression(sum=[now_unix, models.NegExpression(neg="timestamp_unix")])
+    return models.MultExpression(mult=[
+        0.5,
+        models.SumExpression(sum=[
+            "timestamp_unix",
+            now_unix,
+            models.NegExpression(neg=models.AbsExpression(abs=distance)),
+        ]),
+    ])
+
+
+def _exp_decay_expression(now_unix: int, half_life_hours: float) -> models.ExpDecayExpression:
+    """Server-side 0.5 ** (age / half_life) on timestamp_unix (future = age 0)."""
+    return models.ExpDecayExpression(
+        exp_decay=models.DecayParamsExpression(
+            x=_clamped_timestamp(now_unix),
+            target=now_unix,
+            scale=half_life_hours * 3600,
+            midpoint=0.5,
+        )
+    )
+
+
+def _step_formula(now_unix: int) -> models.Expression:
+    """Server-side step decay: one range condition per bucket."""
+    terms = []
+    lower = None
+    for max_age, factor in STEP_SCHEDULE:
+        terms.append(models.MultExpression(mult=[
+            models.FieldCondition(
+                key="timestamp_unix",
+                range=models.Range(gte=now_unix - max_age, lt=lower),
+            ),
+            factor,
+        ]))
+        lower = now_unix - max_age
+    terms.append(models.MultExpression(mult=[
+        models.FieldCondition(key="timestamp_unix", range=models.Range(lt=lower)),
+        STEP_FLOOR,
+    ]))
+    # Incidents without a timestamp are not decayed
+    terms.append(models.MultExpression(mult=[
+        models.IsEmptyCondition(is_empty=models.PayloadField(key="timestamp_unix")),
+        1.0,
+    ]))
+    return models.SumExpression(sum=terms)
+
+
+def _exponential_formula(now_unix: int) -> models.Expression:
+    """Server-side exponential decay."""
+    return _exp_decay_expression(now_unix, settings.DECAY_HALF_LIFE_HOURS)
+
+
+def _urgency_formula(now_unix: int) -> models.Expression:
+    """Server-side exponential decay with per-urgency half-lives."""
+    table = settings.DECAY_URGENCY_HALF_LIFE_HOURS
+    terms = [
+        models.MultExpression(mult=[
+            models.FieldCondition(key="urgency", match=models.MatchValue(value=urgency)),
+            _exp_decay_expression(now_unix, half_life),
+        ])
+        for urgency, half_life in table.items()
+    ]
+    # Any other (or missing) urgency uses the default half-life
+    terms.append(models.MultExpression(mult=[
+        models.Filter(must_not=[
+            models.FieldCondition(key="urgency", match=models.MatchAny(any=list(table))),
+        ]),
+        _exp_decay_expression(now_unix, settings.DECAY_HALF_LIFE_HOURS),
+    ]))
+    return models.SumExpression(sum=terms)
+
+
+# Registered curves and their optional server-side formulas
+DECAY_CURVES: dict[str, DecayCurve] = {
+    "step": step_decay,
+    "exponential": exponential_decay,
+    "urgency": urgency_decay,
+}
+
+DECAY_FORMULAS: dict[str, FormulaBuilder] = {
+    "step": _step_formula,
+    "exponential": _exponential_formula,
+    "urgency": _urgency_formula,
+}
+
+
+def register_decay_curve(
+    name: str,
+    curve: DecayCurve,
+    formula_builder: FormulaBuilder | None = None,
+) -> None:
+    """Register a custom decay curve.
+    
+    Args:
+        name: Curve name (selected with DECAY_CURVE).
+        curve: Function mapping (age_seconds array, urgencies) to factors.
+        formula_builder: Optional function mapping now_unix to an equivalent
+            Qdrant expression (without the score term) for server-side decay.
+    """
+    DECAY_CURVES[name] = curve
+    if formula_builder is not None:
+        DECAY_FORMULAS[name] = formula_builder
+    else:
+        DECAY_FORMULAS.pop(name, None)
+
+
+def _get_curve(curve: str | None) -> str:
+    """Resolve and validate a curve name.
+    
+    Raises:
+        ValueError: If the curve is not registered.
+    """
+    name = curve or settings.DECAY_CURVE
+    if name not in DECAY_CURVES:
+        raise ValueError(f"Unknown decay curve '{name}', expected one of {list(DECAY_CURVES)}")
+    return name
+
+
+def compute_decay_factors(
+    age_seconds,
+    urgencies: Sequence[str | None] | None = None,
+    curve: str | None = None,
+) -> np.ndarray:
+    """Compute decay factors for many ages at once.
+    
+    Args:
+        age_seconds: Sequence or array of ages in seconds.
+        urgencies: Optional urgency per age (used by the urgency curve).
+        curve: Curve name (defaults to DECAY_CURVE).
+    
+    Returns:
+        Array of decay factors (0.0 to 1.0).
+    
+    Raises:
+        ValueError: If the curve is unknown.
+    """
+    ages = np.asarray(age_seconds, dtype=np.float64)
+    factors = DECAY_CURVES[_get_curve(curve)](ages, urgencies)
+    return np.array(factors, dtype=np.float64).reshape(ages.shape)
+
+
+def decay_horizon(max_factor: float, curve: str | None = None) -> int | None:
+    """Age from which no incident decays to more than max_factor.
+    
+    Curves are assumed not to increase with age. They are evaluated for
+    every configured urgency on a grid of ages, then the crossing is refined
+    by bisection to within a second (erring on the late, safe side).
+    
+    Args:
+        max_factor: Decay factor to fall to.
+        curve: Curve name (defaults to DECAY_CURVE).
+    
+    Returns:
+        Age in seconds, or None if the curve stays above max_factor for
+        30 days (e.g. the step curve's floor).
+    
+    Raises:
+        ValueError: If the curve is unknown.
+    """
+    urgencies = [None, *settings.DECAY_URGENCY_HALF_LIFE_HOURS]
+    
+    def highest(ages: np.ndarray) -> np.ndarray:
+        """Largest factor over all urgencies at each age."""
+        factors = compute_decay_factors(np.repeat(ages, len(urgencies)), urgencies * len(ages), curve)
+        return factors.reshape(len(ages), len(urgencies)).max(axis=1)
+    
+    below = np.flatnonzero(highest(_HORIZON_GRID) <= max_factor)
+    if not len(below):
+        return None
+    if below[0] == 0:
+        return 0
+    
+    low, high = _HORIZON_GRID[below[0] - 1], _HORIZON_GRID[below[0]]
+    while high - low > 1:
+        middle = (low + high) / 2
+        if highest(np.array([middle]))[0] <= max_factor:
+            high = middle
+        else:
+            low = middle
+    return int(np.ceil(high))
+
+
+def apply_decay_batch(
+    scores,
+    timestamps: Sequence[int | None],
+    urgencies: Sequence[str | None] | None = None,
+    now_unix: int | None = None,
+    curve: str | None = None,
+) -> dict[str, np.ndarray]:
+    """Apply time-based decay to a batch of similarity scores.
+    
+    Args:
+        scores: Sequence or array of similarity scores.
+        timestamps: Unix timestamp per score (None = not decayed).
+        urgencies: Optional urgency per score.
+        now_unix: Reference time (defaults to now), shared by the batch.
+        curve: Curve name (defaults to DECAY_CURVE).
+    
+    Returns:
+        Dict of arrays: final_scores, decay_factors, and age_seconds.
+    
+    Raises:
+        ValueError: If the curve is unknown.
+    """
+    if now_unix is None:
+        now_unix = int(time.time())
+
+    scores = np.asarray(scores, dtype=np.float64)
+    missing = np.array([t is None for t in timestamps], dtype=bool)
+    stamps = np.array([now_unix if t is None else t for t in timestamps], dtype=np.int64)
+    ages = np.maximum(0, now_unix - stamps)
+
+    factors = compute_decay_factors(ages, urgencies, curve)
+    factors[missing] = 1.0
+
+    return {
+        "final_scores": scores * factors,
+        "decay_factors": factors,
+        "age_seconds": ages,
+    }
+
+
+def apply_decay(
+    similarity_score: float,
+    timestamp_unix: int | None,
+    urgency: str | None = None,
+    now_unix: int | None = None,
+) -> dict:
     """Apply time-based decay to similarity score.
     
     Args:
         similarity_score: Original Qdrant similarity score.
         timestamp_unix: Unix epoch timestamp of incident.
+        urgency: Incident urgency (used by the urgency curve).
+        now_unix: Reference time (defaults to now).
     
     Returns:
         Dict with final_score, decay_factor, and age_seconds.
@@ -43,17 +347,36 @@ def apply_decay(similarity_score: float, timestamp_unix: int | None) -> dict:
             "decay_factor": 1.0,
             "age_seconds": 0,
         }
+
+    decayed = apply_decay_batch([similarity_score], [timestamp_unix], [urgency], now_unix)
+
+    return {
+        "final_score": float(decayed["final_scores"][0]),
+        "decay_factor": float(decayed["decay_factors"][0]),
+        "age_seconds": int(decayed["age_seconds"][0]),
+    }
+
+
+def build_decay_formula(now_unix: int, curve: str | None = None) -> models.FormulaQuery | None:
+    """Build a Qdrant formula query ranking by decayed similarity.
     
-    # Compute age
-    now_unix = int(datetime.now(timezone.utc).timestamp())
-    age_seconds = max(0, now_unix - timestamp_unix)
+    Args:
+        now_unix: Reference time for the decay.
+        curve: Curve name (defaults to DECAY_CURVE).
     
-    # Compute decay
-    decay_factor = compute_decay_factor(age_seconds)
-    final_score = similarity_score * decay_factor
+    Returns:
+        FormulaQuery computing $score * decay, or None if the curve has no
+        server-side form.
     
-    return {
-        "final_score": final_score,
-        "decay_factor": decay_factor,
-        "age_seconds": age_seconds,
-    }
+    Raises:
+        ValueError: If the curve is unknown.
+    """
+    builder = DECAY_FORMULAS.get(_get_curve(curve))
+    if builder is None:
+        return None
+
+    return models.FormulaQuery(
+        formula=models.MultExpression(mult=["$score", builder(now_unix)]),
+        # Incidents without a timestamp are treated as brand new
+        defaults={"timestamp_unix": now_unix},
+    )
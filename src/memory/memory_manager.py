@@ -1,15 +1,50 @@
 """Memory manager for RESPOND incident lifecycle."""
 
+from functools import partial
+
 from config.qdrant_config import SITUATION_REPORTS
+from config.settings import settings
 from src.qdrant.client import get_qdrant_client
+from src.qdrant.points import (
+    VERSION_KEY,
+    VersionConflictError,
+    backoff_retry,
+    compare_and_set_payload,
+    get_version_conflicts,
+    record_version_conflict,
+)
+from src.qdrant.write_buffer import buffer_payload, overlay_payload
 from src.embeddings.text_embedder import TextEmbedder
-from src.memory.reinforcement import compute_text_similarity, reinforce_incident
+from src.evidence.store import append_evidence, build_evidence_summary, get_evidence_page
+from src.memory.combiner import get_write_combiner
+from src.memory.reinforcement import reinforce_incident
+from src.memory.similarity import cosine_one_to_many
+from src.search.result_cache import invalidate_search_cache
+from src.stream.bus import (
+    INCIDENT_REINFORCED,
+    INCIDENT_STATUS,
+    INCIDENT_UPDATED,
+    publish_incident_event,
+)
 from src.utils.time_utils import utc_now_iso
 from src.utils.logger import get_logger
 
 _logger = get_logger("memory.manager")
 
 
+def get_reinforcement_stats() -> dict:
+    """Get reinforcement write statistics.
+    
+    Returns:
+        Dict with combiner stats and version_conflicts (retried writes).
+    """
+    return {
+        "combining": settings.REINFORCE_COMBINING,
+        "combiner": get_write_combiner().stats(),
+        "version_conflicts": get_version_conflicts(),
+    }
+
+
 class MemoryManager:
     """Manages incident memory stored in Qdrant."""
 
@@ -18,20 +53,22 @@ class MemoryManager:
         self._collection = SITUATION_REPORTS
         self._embedder = TextEmbedder()
 
-    def get_incident(self, incident_id: str) -> dict | None:
+    def get_incident(self, incident_id: str, with_vector: bool = False) -> dict | None:
         """Fetch incident by ID.
         
         Args:
             incident_id: Incident UUID.
+            with_vector: Also return the stored embedding vector.
         
         Returns:
-            Dict with id and payload, or None if not found.
+            Dict with id and payload (and vector if requested), or None if not found.
         """
         try:
             results = self._client.retrieve(
                 collection_name=self._collection,
                 ids=[incident_id],
                 with_payload=True,
+                with_vectors=with_vector,
             )
             
             if not results:
@@ -39,32 +76,64 @@ class MemoryManager:
                 return None
             
             point = results[0]
-            return {
+            incident = {
                 "id": str(point.id),
-                "payload": point.payload,
+                "payload": overlay_payload(self._collection, incident_id, point.payload),
             }
+            if with_vector:
+                incident["vector"] = point.vector
+            return incident
         except Exception as e:
             _logger.error(f"Error fetching incident {incident_id}: {e}")
             return None
 
-    def update_incident_payload(self, incident_id: str, updates: dict) -> bool:
+    def update_incident_payload(
+        self,
+        incident_id: str,
+        updates: dict,
+        zone_id: str | None = None,
+        buffered: bool = False,
+    ) -> bool:
         """Update payload fields for an incident.
         
         Args:
             incident_id: Incident UUID.
             updates: Dict of fields to update.
+            zone_id: Zone of the incident, to invalidate only that zone's
+                cached searches (all cached searches if not given).
+            buffered: Write through the payload write buffer instead of
+                waiting for Qdrant. Only for internal fire-and-forget fields:
+                a buffered update may be dropped if its flush keeps failing,
+                and other processes see it only after the flush.
         
         Returns:
-            True if update was successful.
+            True if update was successful (for buffered updates: queued).
         """
         try:
             # Add updated_at timestamp
             updates["updated_at"] = utc_now_iso()
             
-            self._client.set_payload(
-                collection_name=self._collection,
-                payload=updates,
-                points=[incident_id],
+            if buffered:
+                # Searches cached before the flush hold the old stored
+                # payload, so the zone is invalidated again once written
+                buffer_payload(
+                    self._collection,
+                    incident_id,
+                    updates,
+                    on_flush=partial(invalidate_search_cache, zone_id),
+                )
+            else:
+                self._client.set_payload(
+                    collection_name=self._collection,
+                    payload=updates,
+                    points=[incident_id],
+                )
+            invalidate_search_cache(zone_id)
+            publish_incident_event(
+                INCIDENT_STATUS if "status" in updates else INCIDENT_UPDATED,
+                incident_id=incident_id,
+                zone_id=zone_id,
+                changes=updates,
             )
             
             _logger.info(f"Updated incident {incident_id}: {list(updates.keys())}")
@@ -76,6 +145,9 @@ class MemoryManager:
     def reinforce(self, incident_id: str, new_source_type: str, new_text: str) -> dict:
         """Reinforce incident with new evidence.
         
+        Concurrent reinforcements of the same incident are combined into one
+        versioned write (see _reinforce_items()).
+        
         Args:
             incident_id: Incident UUID.
             new_source_type: Source type of new evidence.
@@ -86,42 +158,279 @@ class MemoryManager:
         
         Raises:
             ValueError: If incident not found or invalid input.
+            VersionConflictError: If the write kept losing to other writers.
         """
-        # Fetch incident
-        incident = self.get_incident(incident_id)
+        write = self._reinforce_items(
+            incident_id,
+            [{"source_type": new_source_type, "text": new_text}],
+        )
+        result = write["results"][0]
+        
+        _logger.info(f"Reinforced incident {incident_id}: accepted={result['accepted']}")
+        
+        return {
+            "incident_id": incident_id,
+            "similarity": result["similarity"],
+            "accepted": result["accepted"],
+            "old_confidence": result["old_confidence"],
+            "new_confidence": result["new_confidence"],
+            "reinforced_count": write["reinforced_count"],
+        }
+
+    def reinforce_batch(self, incident_id: str, evidence: list[dict]) -> dict:
+        """Reinforce incident with several pieces of evidence at once.
+        
+        All evidence texts are embedded in one batched forward pass, scored
+        against the stored incident vector, applied in order, and written
+        back with a single payload update.
+        
+        Args:
+            incident_id: Incident UUID.
+            evidence: List of dicts with 'source_type' and 'text' keys.
+        
+        Returns:
+            Dict with overall confidence change and per-evidence results.
+        
+        Raises:
+            ValueError: If incident not found or invalid input.
+            VersionConflictError: If the write kept losing to other writers.
+        """
+        if not evidence:
+            raise ValueError("evidence cannot be empty")
+        
+        write = self._reinforce_items(
+            incident_id,
+            [{"source_type": item["source_type"], "text": item["text"]} for item in evidence],
+        )
+        results = write["results"]
+        
+        accepted_count = sum(1 for r in results if r["accepted"])
+        _logger.info(
+            f"Batch reinforced incident {incident_id}: "
+            f"{accepted_count}/{len(results)} accepted"
+        )
+        
+        return {
+            "incident_id": incident_id,
+            "old_confidence": results[0]["old_confidence"],
+            "new_confidence": results[-1]["new_confidence"],
+            "reinforced_count": write["reinforced_count"],
+            "results": results,
+        }
+
+    def _reinforce_items(self, incident_id: str, items: list[dict]) -> dict:
+        """Apply evidence items, combined with concurrent callers.
+        
+        Args:
+            incident_id: Incident UUID.
+            items: Dicts with 'source_type' and 'text' keys.
+        
+        Returns:
+            Dict from _apply_reinforcement() with this caller's results.
+        """
+        if not settings.REINFORCE_COMBINING:
+            return self._apply_reinforcement(incident_id, items)
+        return get_write_combiner().submit(incident_id, items, self._apply_reinforcement)
+
+    def _apply_reinforcement(self, incident_id: str, items: list[dict]) -> dict:
+        """Apply evidence items in order as one compare-and-set write.
+        
+        Similarities are computed once; if the incident changes before the
+        write lands, the payload is re-read and the items re-applied to it.
+        
+        Args:
+            incident_id: Incident UUID.
+            items: Dicts with 'source_type' and 'text' keys.
+        
+        Returns:
+            Dict with incident_id, reinforced_count and per-item results
+            (source_type, similarity, accepted, old/new confidence).
+        
+        Raises:
+            ValueError: If incident not found.
+            VersionConflictError: If all attempts lost to other writers.
+        """
+        # Fetch incident together with its stored vector
+        incident = self.get_incident(incident_id, with_vector=True)
         if not incident:
             raise ValueError(f"Incident {incident_id} not found")
         
+        # Compute embeddings in one batch
+        incident_vector = self._incident_vector(incident)
+        new_vectors = self._embedder.embed_texts([item["text"] for item in items])
+        similarities = cosine_one_to_many(incident_vector, new_vectors).tolist()
+        
         payload = incident["payload"]
-        original_text = payload.get("text", "")
+        attempts = max(1, settings.REINFORCE_MAX_ATTEMPTS)
+        for attempt in range(attempts):
+            if attempt:
+                record_version_conflict()
+                backoff_retry(attempt)
+                incident = self.get_incident(incident_id)
+                if not incident:
+                    raise ValueError(f"Incident {incident_id} not found")
+                payload = incident["payload"]
+            
+            payload = self._migrate_evidence(incident_id, payload)
+            if payload is None:
+                continue
+            
+            # Apply reinforcement for each piece of evidence in order
+            start_seq = payload.get("evidence_summary", {}).get("count", 0)
+            updated = payload
+            updates = {}
+            results = []
+            entries = []
+            for item, similarity in zip(items, similarities):
+                updates = reinforce_incident(updated, item["source_type"], item["text"], similarity)
+                meta = updates.pop("_meta")
+                updated = {**updated, **updates}
+                entries.append(meta["evidence"])
+                results.append({
+                    "source_type": item["source_type"],
+                    "similarity": round(similarity, 4),
+                    "accepted": meta["accepted"],
+                    "old_confidence": meta["old_confidence"],
+                    "new_confidence": meta["new_confidence"],
+                })
+            
+            # Store the full entries first (like _migrate_evidence) so a
+            # confirmed write never counts missing evidence; IDs derive from
+            # the seq, so a retry overwrites the entries of a lost attempt
+            append_evidence(incident_id, entries, start_seq=start_seq, zone_id=payload.get("zone_id"))
+            version = compare_and_set_payload(self._collection, incident_id, updates, payload)
+            if version is not None:
+                break
+        else:
+            raise VersionConflictError(
+                f"Incident {incident_id} changed during {attempts} reinforcement attempts"
+            )
         
-        # Compute embeddings
-        vec1 = self._embedder.embed_text(original_text)
-        vec2 = self._embedder.embed_text(new_text)
+        updates[VERSION_KEY] = version
+        invalidate_search_cache(payload.get("zone_id"))
+        publish_incident_event(
+            INCIDENT_REINFORCED,
+            incident_id=incident_id,
+            zone_id=payload.get("zone_id"),
+            payload={**updated, **updates},
+            changes=updates,
+        )
         
-        # Compute similarity
-        similarity = compute_text_similarity(vec1, vec2)
+        return {
+            "incident_id": incident_id,
+            "reinforced_count": updates["reinforced_count"],
+            "results": results,
+        }
+
+    def get_evidence(
+        self,
+        incident_id: str,
+        offset: int = 0,
+        limit: int = 50,
+        newest_first: bool = True,
+    ) -> dict:
+        """Get a page of an incident's full evidence chain.
         
-        # Apply reinforcement
-        updates = reinforce_incident(payload, new_source_type, new_text, similarity)
+        Args:
+            incident_id: Incident UUID.
+            offset: Entries to skip (from the newest if newest_first).
+            limit: Maximum entries to return (up to EVIDENCE_PAGE_MAX).
+            newest_first: Page from the newest entry backwards.
         
-        # Extract meta info before removing it
-        meta = updates.pop("_meta")
+        Returns:
+            Dict with incident_id, total, offset, limit, newest_first,
+            summary and items.
         
-        # Update payload in Qdrant
-        self._client.set_payload(
-            collection_name=self._collection,
-            payload=updates,
-            points=[incident_id],
-        )
+        Raises:
+            ValueError: If incident not found or invalid paging.
+        """
+        if offset < 0:
+            raise ValueError("offset must be >= 0")
+        if not 1 <= limit <= settings.EVIDENCE_PAGE_MAX:
+            raise ValueError(f"limit must be between 1 and {settings.EVIDENCE_PAGE_MAX}")
+        
+        incident = self.get_incident(incident_id)
+        if not incident:
+            raise ValueError(f"Incident {incident_id} not found")
         
-        _logger.info(f"Reinforced incident {incident_id}: accepted={meta['accepted']}")
+        payload = self._migrate_evidence(incident_id, incident["payload"])
+        if payload is None:
+            # Migrated (or reinforced) concurrently; read the new state
+            payload = self.get_incident(incident_id)["payload"]
+        summary = payload.get("evidence_summary") or build_evidence_summary(
+            payload.get("evidence_chain", [])
+        )
+        items = get_evidence_page(
+            incident_id,
+            total=summary["count"],
+            offset=offset,
+            limit=limit,
+            newest_first=newest_first,
+        )
         
         return {
             "incident_id": incident_id,
-            "similarity": round(similarity, 4),
-            "accepted": meta["accepted"],
-            "old_confidence": meta["old_confidence"],
-            "new_confidence": meta["new_confidence"],
-            "reinforced_count": updates["reinforced_count"],
+            "total": summary["count"],
+            "offset": offset,
+            "limit": limit,
+            "newest_first": newest_first,
+            "summary": {k: v for k, v in summary.items() if k != "recent"},
+            "items": items,
         }
+
+    def _migrate_evidence(self, incident_id: str, payload: dict) -> dict | None:
+        """Move a legacy inline evidence_chain to the evidence collection.
+        
+        Args:
+            incident_id: Incident UUID.
+            payload: Current incident payload.
+        
+        Returns:
+            Payload with evidence_summary instead of evidence_chain
+            (unchanged if already migrated), or None if the incident changed
+            concurrently (re-read and retry).
+        """
+        if "evidence_chain" not in payload:
+            return payload
+        
+        if "evidence_summary" not in payload:
+            chain = payload.get("evidence_chain") or []
+            summary = build_evidence_summary(chain)
+            
+            # Store the chain first so a failure leaves the legacy payload intact
+            append_evidence(incident_id, chain, start_seq=0, zone_id=payload.get("zone_id"))
+            version = compare_and_set_payload(
+                self._collection,
+                incident_id,
+                {"evidence_summary": summary},
+                payload,
+            )
+            if version is None:
+                return None
+            
+            _logger.info(f"Migrated {len(chain)} evidence entries for incident {incident_id}")
+            payload = {**payload, "evidence_summary": summary, VERSION_KEY: version}
+        
+        self._client.delete_payload(
+            collection_name=self._collection,
+            keys=["evidence_chain"],
+            points=[incident_id],
+        )
+        
+        return {k: v for k, v in payload.items() if k != "evidence_chain"}
+
+    def _incident_vector(self, incident: dict) -> list[float]:
+        """Get the stored vector of an incident, embedding its text if missing.
+        
+        Args:
+            incident: Incident dict from get_incident(with_vector=True).
+        
+        Returns:
+            Incident embedding vector.
+        """
+        vector = incident.get("vector")
+        if vector:
+            return vector
+        
+        _logger.debug(f"No stored vector for incident {incident['id']}, re-embedding text")
+        return self._embedder.embed_text(incident["payload"].get("text", ""))
@@ -1,7 +1,7 @@
 """Reinforcement logic for RESPOND incident confidence boosting."""
 
-import math
-
+from src.evidence.store import add_to_evidence_summary, build_evidence_summary
+from src.memory.similarity import cosine_similarity
 from src.utils.time_utils import utc_now_iso
 from src.utils.logger import get_logger
 
@@ -21,14 +21,7 @@ def compute_text_similarity(vec1: list[float], vec2: list[float]) -> float:
     if len(vec1) != len(vec2):
         raise ValueError("Vectors must have same length")
     
-    dot_product = sum(a * b for a, b in zip(vec1, vec2))
-    norm1 = math.sqrt(sum(a * a for a in vec1))
-    norm2 = math.sqrt(sum(b * b for b in vec2))
-    
-    if norm1 == 0 or norm2 == 0:
-        return 0.0
-    
-    return dot_product / (norm1 * norm2)
+    return cosine_similarity(vec1, vec2)
 
 
 def reinforce_incident(
@@ -46,10 +39,14 @@ def reinforce_incident(
         similarity: Cosine similarity between texts.
     
     Returns:
-        Updated payload dict with reinforcement applied.
+        Updated payload dict with reinforcement applied. The full evidence
+        entry (to be stored out of line) is returned in _meta["evidence"].
     """
     old_confidence = incident_payload.get("confidence_score", 0.5)
-    evidence_chain = incident_payload.get("evidence_chain", [])
+    evidence_summary = incident_payload.get("evidence_summary")
+    if evidence_summary is None:
+        # Legacy incident with the chain stored inline
+        evidence_summary = build_evidence_summary(incident_payload.get("evidence_chain", []))
     reinforced_count = incident_payload.get("reinforced_count", 0)
     
     # Determine if evidence is accepted
@@ -73,12 +70,12 @@ def reinforce_incident(
         "timestamp": utc_now_iso(),
         "accepted": accepted,
     }
-    evidence_chain.append(evidence_entry)
+    evidence_summary = add_to_evidence_summary(evidence_summary, evidence_entry)
     
     # Return updated payload fields
     return {
         "confidence_score": new_confidence,
-        "evidence_chain": evidence_chain,
+        "evidence_summary": evidence_summary,
         "reinforced_count": reinforced_count,
         "updated_at": utc_now_iso(),
         "_meta": {
@@ -86,5 +83,6 @@ def reinforce_incident(
             "new_confidence": new_confidence,
             "accepted": accepted,
             "similarity": similarity,
+            "evidence": evidence_entry,
         },
     }
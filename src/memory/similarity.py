@@ -0,0 +1,107 @@
+"""Vectorized cosine similarity kernels for RESPOND.
+
+All kernels work on float32 arrays. Pass `normalized=True` when the inputs
+are already unit-length (e.g. vectors read back from a Cosine collection) to
+skip the renormalization step.
+"""
+
+import numpy as np
+
+
+def as_matrix(vectors) -> np.ndarray:
+    """Convert a vector or list of vectors to a 2-D float32 array.
+
+    Args:
+        vectors: Single vector or sequence of vectors (lists or arrays).
+
+    Returns:
+        Array of shape (n, dim).
+    """
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    return matrix
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length; all-zero rows stay zero.
+
+    Args:
+        matrix: Array of shape (n, dim).
+
+    Returns:
+        Row-normalized float32 array of the same shape.
+    """
+    matrix = as_matrix(matrix)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def cosine_similarity(vec1, vec2, normalized: bool = False) -> float:
+    """Compute cosine similarity between two vectors.
+
+    Args:
+        vec1: First embedding vector.
+        vec2: Second embedding vector.
+        normalized: Inputs are already unit-length.
+
+    Returns:
+        Cosine similarity in range [-1, 1].
+
+    Raises:
+        ValueError: If vectors have different lengths.
+    """
+    return float(cosine_one_to_many(vec1, [vec2], normalized=normalized)[0])
+
+
+def cosine_one_to_many(query, candidates, normalized: bool = False) -> np.ndarray:
+    """Score one query vector against many candidate vectors.
+
+    Args:
+        query: Query embedding vector.
+        candidates: Sequence or (n, dim) array of candidate vectors.
+        normalized: Inputs are already unit-length.
+
+    Returns:
+        Array of shape (n,) with cosine similarities.
+
+    Raises:
+        ValueError: If dimensions don't match.
+    """
+    q = as_matrix(query)[0]
+    c = as_matrix(candidates)
+    if c.size == 0:
+        return np.zeros(0, dtype=np.float32)
+    if c.shape[1] != q.shape[0]:
+        raise ValueError("Vectors must have same length")
+
+    if not normalized:
+        q = normalize_rows(q)[0]
+        c = normalize_rows(c)
+    return c @ q
+
+
+def cosine_matrix(a, b=None, normalized: bool = False) -> np.ndarray:
+    """Compute the pairwise cosine similarity matrix.
+
+    Args:
+        a: Sequence or (m, dim) array of vectors.
+        b: Sequence or (n, dim) array of vectors (defaults to `a`).
+        normalized: Inputs are already unit-length.
+
+    Returns:
+        Array of shape (m, n) with cosine similarities.
+
+    Raises:
+        ValueError: If dimensions don't match.
+    """
+    left = as_matrix(a)
+    right = left if b is None else as_matrix(b)
+    if left.size and right.size and left.shape[1] != right.shape[1]:
+        raise ValueError("Vectors must have same length")
+
+    if not normalized:
+        left = normalize_rows(left)
+        right = left if b is None else normalize_rows(right)
+    return left @ right.T
@@ -1,19 +1,66 @@
 """RESPOND Qdrant Package."""
 
-from src.qdrant.client import get_qdrant_client
+from src.qdrant.client import get_qdrant_client, get_async_qdrant_client
 from src.qdrant.collections import (
+    apply_collection_profile,
     collection_exists,
     create_collection,
+    describe_collection,
+    get_search_params,
     setup_all_collections,
 )
-from src.qdrant.indexer import upsert_point
-from src.qdrant.searcher import search
+from src.qdrant.indexer import upsert_point, upsert_point_async, upsert_points
+from src.qdrant.points import (
+    VersionConflictError,
+    compare_and_set_payload,
+    retrieve,
+    retrieve_async,
+    scroll_all,
+    set_payload,
+    set_payload_async,
+)
+from src.qdrant.write_buffer import (
+    buffer_payload,
+    flush_payload_writes,
+    get_payload_buffer,
+    overlay_payload,
+)
+from src.qdrant.searcher import (
+    search,
+    search_async,
+    search_batch,
+    search_batch_async,
+    search_with_formula,
+    search_with_formula_async,
+)
 
 __all__ = [
     "get_qdrant_client",
+    "get_async_qdrant_client",
     "collection_exists",
     "create_collection",
     "setup_all_collections",
+    "apply_collection_profile",
+    "describe_collection",
+    "get_search_params",
     "upsert_point",
+    "upsert_point_async",
+    "upsert_points",
+    "VersionConflictError",
+    "compare_and_set_payload",
+    "retrieve",
+    "retrieve_async",
+    "scroll_all",
+    "set_payload",
+    "set_payload_async",
+    "buffer_payload",
+    "flush_payload_writes",
+    "get_payload_buffer",
+    "overlay_payload",
     "search",
+    "search_async",
+    "search_batch",
+    "search_batch_async",
+    "search_with_formula",
+    "search_with_formula_async",
 ]
@@ -1,28 +1,191 @@
 """Qdrant client wrapper for RESPOND."""
 
-from qdrant_client import QdrantClient
+import asyncio
+import os
+import threading
+
+import httpx
+from qdrant_client import AsyncQdrantClient, QdrantClient
 
 from config.settings import settings
 from src.utils.logger import get_logger
 
 _logger = get_logger("qdrant.client")
 _client: QdrantClient | None = None
+_async_client: AsyncQdrantClient | None = None
+
+# PID that created the current clients (sockets must not be shared across forks)
+_client_pid: int | None = None
+
+
+# Embedded (local/memory) modes
+EMBEDDED_MODES = ("local", "memory")
+
+
+class _SerializedClient:
+    """Proxy that serializes calls to an embedded QdrantClient.
+    
+    The embedded client is not thread-safe, while RESPOND calls Qdrant from
+    request threads, the embedding pool and parallel upsert workers.
+    """
+
+    def __init__(self, client: QdrantClient):
+        self._client = client
+        self._lock = threading.RLock()
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+        
+        def _locked(*args, **kwargs):
+            with self._lock:
+                return attr(*args, **kwargs)
+        
+        return _locked
+
+
+class _EmbeddedAsyncClient:
+    """Async facade over the embedded client.
+    
+    A second embedded instance would not share data with the sync one
+    (and a path-backed store can only be opened once), so async calls run the
+    shared sync client in a worker thread instead.
+    """
+
+    def __init__(self, client: _SerializedClient):
+        self._client = client
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+        
+        async def _threaded(*args, **kwargs):
+            return await asyncio.to_thread(attr, *args, **kwargs)
+        
+        return _threaded
+
+
+def is_embedded_mode() -> bool:
+    """Check whether Qdrant runs embedded in this process (QDRANT_MODE local/memory)."""
+    return settings.QDRANT_MODE in EMBEDDED_MODES
+
+
+def _create_embedded_client() -> _SerializedClient:
+    """Create the embedded Qdrant client for local/memory mode."""
+    if settings.QDRANT_MODE == "memory":
+        _logger.info("Starting embedded in-memory Qdrant")
+        client = QdrantClient(location=":memory:")
+    else:
+        _logger.info(f"Starting embedded Qdrant at {settings.QDRANT_LOCAL_PATH}")
+        client = QdrantClient(
+            path=settings.QDRANT_LOCAL_PATH,
+            force_disable_check_same_thread=True,
+        )
+    return _SerializedClient(client)
+
+
+def _client_kwargs() -> dict:
+    """Build connection options shared by the sync and async clients.
+    
+    Returns:
+        Keyword arguments for QdrantClient / AsyncQdrantClient.
+    """
+    kwargs = {
+        "url": settings.QDRANT_URL,
+        "api_key": settings.QDRANT_API_KEY if settings.QDRANT_API_KEY else None,
+        "timeout": settings.QDRANT_TIMEOUT,
+    }
+    
+    if settings.QDRANT_PREFER_GRPC:
+        keepalive_ms = int(settings.QDRANT_KEEPALIVE_SECONDS * 1000)
+        kwargs.update(
+            prefer_grpc=True,
+            grpc_port=settings.QDRANT_GRPC_PORT,
+            pool_size=settings.QDRANT_POOL_SIZE,
+            grpc_options={
+                "grpc.keepalive_time_ms": keepalive_ms,
+                "grpc.keepalive_timeout_ms": min(keepalive_ms, 10000),
+                "grpc.keepalive_permit_without_calls": 1,
+            },
+        )
+    else:
+        # qdrant-client disables HTTP keep-alive unless limits are given
+        kwargs["limits"] = httpx.Limits(
+            max_connections=settings.QDRANT_POOL_SIZE,
+            max_keepalive_connections=settings.QDRANT_POOL_SIZE,
+            keepalive_expiry=settings.QDRANT_KEEPALIVE_SECONDS,
+        )
+    
+    return kwargs
+
+
+def _reset_after_fork() -> None:
+    """Drop inherited clients so a forked worker opens its own connections."""
+    global _client, _async_client, _client_pid
+    
+    if _client_pid is not None and _client_pid != os.getpid():
+        _client = None
+        _async_client = None
+        _client_pid = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
 
 
 def get_qdrant_client() -> QdrantClient:
     """Get singleton Qdrant client instance.
     
+    The singleton is per process: a worker forked by uvicorn/gunicorn after
+    the parent connected gets a fresh client instead of the parent's sockets.
+    
     Returns:
         Configured QdrantClient instance.
     """
-    global _client
+    global _client, _client_pid
+    
+    _reset_after_fork()
     
     if _client is None:
-        _logger.info(f"Connecting to Qdrant at {settings.QDRANT_URL}")
-        _client = QdrantClient(
-            url=settings.QDRANT_URL,
-            api_key=settings.QDRANT_API_KEY if settings.QDRANT_API_KEY else None,
-        )
+        if settings.QDRANT_MODE not in ("server", *EMBEDDED_MODES):
+            raise ValueError(
+                f"QDRANT_MODE must be one of {('server', *EMBEDDED_MODES)}, "
+                f"got '{settings.QDRANT_MODE}'"
+            )
+        
+        if is_embedded_mode():
+            _client = _create_embedded_client()
+        else:
+            transport = "gRPC" if settings.QDRANT_PREFER_GRPC else "HTTP"
+            _logger.info(f"Connecting to Qdrant at {settings.QDRANT_URL} ({transport})")
+            _client = QdrantClient(**_client_kwargs())
+        _client_pid = os.getpid()
         _logger.info("Qdrant client initialized")
     
     return _client
+
+
+def get_async_qdrant_client() -> AsyncQdrantClient:
+    """Get singleton async Qdrant client instance.
+    
+    Used by FastAPI routes so Qdrant round trips don't block the event loop.
+    
+    Returns:
+        Configured AsyncQdrantClient instance.
+    """
+    global _async_client, _client_pid
+    
+    _reset_after_fork()
+    
+    if _async_client is None:
+        if is_embedded_mode():
+            _async_client = _EmbeddedAsyncClient(get_qdrant_client())
+        else:
+            _logger.info(f"Connecting async client to Qdrant at {settings.QDRANT_URL}")
+            _async_client = AsyncQdrantClient(**_client_kwargs())
+            _client_pid = os.getpid()
+        _logger.info("Async Qdrant client initialized")
+    
+    return _async_client
@@ -1,20 +1,35 @@
 """Qdrant collection management for RESPOND."""
 
 from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    CollectionParamsDiff,
+    Disabled,
     Distance,
-    VectorParams,
+    HnswConfigDiff,
+    OptimizersConfigDiff,
     PayloadSchemaType,
+    QuantizationSearchParams,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    VectorParams,
+    VectorParamsDiff,
 )
 
 from config.settings import settings
 from config.qdrant_config import (
+    COLLECTION_PROFILES,
+    get_collection_profile_name,
     SITUATION_REPORTS,
     DISASTER_EVENTS,
     RESOURCE_DEPLOYMENTS,
     HISTORICAL_PATTERNS,
     INCIDENT_IMAGES,
+    INCIDENT_EVIDENCE,
 )
-from src.qdrant.client import get_qdrant_client
+from src.qdrant.client import get_qdrant_client, is_embedded_mode
 from src.utils.logger import get_logger
 
 _logger = get_logger("qdrant.collections")
@@ -32,8 +47,13 @@ IMAGE_COLLECTIONS = [
     INCIDENT_IMAGES,
 ]
 
+# Payload-only collections (no vectors)
+EVIDENCE_COLLECTIONS = [
+    INCIDENT_EVIDENCE,
+]
+
 # All collection names
-ALL_COLLECTIONS = TEXT_COLLECTIONS + IMAGE_COLLECTIONS
+ALL_COLLECTIONS = TEXT_COLLECTIONS + IMAGE_COLLECTIONS + EVIDENCE_COLLECTIONS
 
 # Vector sizes for different collection types
 TEXT_VECTOR_SIZE = 384  # MiniLM-L6-v2
@@ -59,6 +79,14 @@ IMAGE_PAYLOAD_INDEX_SCHEMA = {
     "zone_id": PayloadSchemaType.KEYWORD,
 }
 
+# Payload fields to index for the evidence collection
+EVIDENCE_PAYLOAD_INDEX_SCHEMA = {
+    "incident_id": PayloadSchemaType.KEYWORD,
+    "seq": PayloadSchemaType.INTEGER,
+    "source_type": PayloadSchemaType.KEYWORD,
+    "timestamp_unix": PayloadSchemaType.INTEGER,
+}
+
 
 def collection_exists(name: str) -> bool:
     """Check if a collection exists.
@@ -74,14 +102,81 @@ def collection_exists(name: str) -> bool:
     return any(c.name == name for c in collections)
 
 
-def create_collection(name: str, vector_size: int = None) -> None:
+def get_collection_profile(name: str, profile: str | None = None) -> tuple[str, dict]:
+    """Resolve the profile for a collection.
+    
+    Args:
+        name: Collection name.
+        profile: Profile name (defaults to the configured one).
+    
+    Returns:
+        Tuple of (profile name, profile dict).
+    
+    Raises:
+        ValueError: If the profile does not exist.
+    """
+    profile = profile or get_collection_profile_name(name)
+    if profile not in COLLECTION_PROFILES:
+        raise ValueError(
+            f"Unknown collection profile '{profile}' "
+            f"(expected one of {', '.join(COLLECTION_PROFILES)})"
+        )
+    return profile, COLLECTION_PROFILES[profile]
+
+
+def _quantization_config(profile: dict) -> ScalarQuantization | BinaryQuantization | None:
+    """Build the quantization config of a profile (None if unquantized)."""
+    quantization = profile.get("quantization")
+    if not quantization:
+        return None
+    if quantization["type"] == "scalar":
+        return ScalarQuantization(
+            scalar=ScalarQuantizationConfig(
+                type=ScalarType.INT8,
+                quantile=quantization.get("quantile"),
+                always_ram=quantization.get("always_ram"),
+            )
+        )
+    if quantization["type"] == "binary":
+        return BinaryQuantization(
+            binary=BinaryQuantizationConfig(always_ram=quantization.get("always_ram"))
+        )
+    raise ValueError(f"Unknown quantization type: {quantization['type']}")
+
+
+def _hnsw_config(profile: dict) -> HnswConfigDiff | None:
+    """Build the HNSW config of a profile (None keeps Qdrant's defaults)."""
+    hnsw = profile.get("hnsw")
+    return HnswConfigDiff(**hnsw) if hnsw else None
+
+
+def _optimizers_config(profile: dict) -> OptimizersConfigDiff | None:
+    """Build the optimizers config of a profile (None keeps Qdrant's defaults)."""
+    optimizers = profile.get("optimizers")
+    return OptimizersConfigDiff(**optimizers) if optimizers else None
+
+
+def create_collection(name: str, vector_size: int = None, profile: str | None = None) -> None:
     """Create a collection with vector config and payload indexes.
     
     Args:
         name: Collection name to create.
         vector_size: Vector dimension (defaults based on collection type).
+        profile: Collection profile (defaults to the configured one).
     """
     client = get_qdrant_client()
+    profile_name, profile_config = get_collection_profile(name, profile)
+    
+    if name in EVIDENCE_COLLECTIONS:
+        # Payload-only: only the payload storage setting of the profile applies
+        client.create_collection(
+            collection_name=name,
+            vectors_config={},
+            on_disk_payload=profile_config.get("on_disk_payload"),
+        )
+        _logger.info(f"Created collection: {name} (no vectors, profile={profile_name})")
+        _create_payload_indexes(name)
+        return
     
     # Determine vector size based on collection type
     if vector_size is None:
@@ -96,9 +191,16 @@ def create_collection(name: str, vector_size: int = None) -> None:
         vectors_config=VectorParams(
             size=vector_size,
             distance=Distance.COSINE,
+            on_disk=profile_config.get("on_disk"),
         ),
+        hnsw_config=_hnsw_config(profile_config),
+        optimizers_config=_optimizers_config(profile_config),
+        quantization_config=_quantization_config(profile_config),
+        on_disk_payload=profile_config.get("on_disk_payload"),
+    )
+    _logger.info(
+        f"Created collection: {name} (vector_size={vector_size}, profile={profile_name})"
     )
-    _logger.info(f"Created collection: {name} (vector_size={vector_size})")
     
     # Create payload indexes for filtering
     _create_payload_indexes(name)
@@ -110,11 +212,18 @@ def _create_payload_indexes(name: str) -> None:
     Args:
         name: Collection name.
     """
+    # Embedded Qdrant ignores payload indexes (and warns for each one)
+    if is_embedded_mode():
+        _logger.debug(f"Skipping payload indexes for {name} in embedded mode")
+        return
+    
     client = get_qdrant_client()
     
     # Select schema based on collection type
     if name in IMAGE_COLLECTIONS:
         schema = IMAGE_PAYLOAD_INDEX_SCHEMA
+    elif name in EVIDENCE_COLLECTIONS:
+        schema = EVIDENCE_PAYLOAD_INDEX_SCHEMA
     else:
         schema = TEXT_PAYLOAD_INDEX_SCHEMA
     
@@ -132,6 +241,142 @@ def _create_payload_indexes(name: str) -> None:
     _logger.info(f"Created payload indexes for: {name}")
 
 
+def apply_collection_profile(name: str, profile: str | None = None) -> dict:
+    """Migrate an existing collection to a profile.
+    
+    Qdrant applies the new storage, HNSW and quantization settings in the
+    background (re-indexing and quantizing existing segments), so the
+    collection stays searchable during the migration. Switching to the
+    "default" profile disables quantization; other settings keep their
+    current values.
+    
+    Embedded Qdrant always searches exactly and ignores these settings.
+    
+    Args:
+        name: Collection name.
+        profile: Profile to apply (defaults to the configured one).
+    
+    Returns:
+        Dict with collection, profile and applied flag.
+    
+    Raises:
+        ValueError: If the profile does not exist.
+    """
+    profile_name, profile_config = get_collection_profile(name, profile)
+    
+    if is_embedded_mode():
+        _logger.info(f"Skipping profile {profile_name} for {name} in embedded mode")
+        return {"collection": name, "profile": profile_name, "applied": False}
+    
+    client = get_qdrant_client()
+    
+    quantization_config = _quantization_config(profile_config) or Disabled.DISABLED
+    if name in EVIDENCE_COLLECTIONS:
+        # Payload-only: only the payload storage setting applies
+        profile_config = {"on_disk_payload": profile_config.get("on_disk_payload")}
+        quantization_config = None
+    
+    vectors_config = None
+    if profile_config.get("on_disk") is not None:
+        vectors_config = {"": VectorParamsDiff(on_disk=profile_config["on_disk"])}
+    
+    collection_params = None
+    if profile_config.get("on_disk_payload") is not None:
+        collection_params = CollectionParamsDiff(
+            on_disk_payload=profile_config["on_disk_payload"]
+        )
+    
+    client.update_collection(
+        collection_name=name,
+        vectors_config=vectors_config,
+        hnsw_config=_hnsw_config(profile_config),
+        optimizers_config=_optimizers_config(profile_config),
+        quantization_config=quantization_config,
+        collection_params=collection_params,
+    )
+    _search_params_cache.pop(name, None)
+    _logger.info(f"Applied profile {profile_name} to collection: {name}")
+    
+    return {"collection": name, "profile": profile_name, "applied": True}
+
+
+def describe_collection(name: str) -> dict:
+    """Summarize a collection's storage, index and quantization settings.
+    
+    Args:
+        name: Collection name.
+    
+    Returns:
+        Dict with status, point counts, configured profile and the current
+        on_disk, on_disk_payload, hnsw and quantization settings.
+    """
+    client = get_qdrant_client()
+    info = client.get_collection(name)
+    vectors = info.config.params.vectors
+    quantization = info.config.quantization_config
+    
+    return {
+        "collection": name,
+        "profile": get_collection_profile_name(name),
+        "status": str(getattr(info.status, "value", info.status)),
+        "points_count": info.points_count,
+        "indexed_vectors_count": info.indexed_vectors_count,
+        "on_disk": getattr(vectors, "on_disk", None),
+        "on_disk_payload": info.config.params.on_disk_payload,
+        "hnsw": {
+            "m": info.config.hnsw_config.m,
+            "ef_construct": info.config.hnsw_config.ef_construct,
+            "on_disk": info.config.hnsw_config.on_disk,
+        },
+        "quantization": _describe_quantization(quantization),
+    }
+
+
+def _describe_quantization(quantization) -> str | None:
+    """Name the quantization kind of a collection config."""
+    if isinstance(quantization, ScalarQuantization):
+        return "scalar"
+    if isinstance(quantization, BinaryQuantization):
+        return "binary"
+    if quantization is not None:
+        return type(quantization).__name__
+    return None
+
+
+# Search params per collection (profiles are fixed per process)
+_search_params_cache: dict[str, SearchParams | None] = {}
+
+
+def get_search_params(collection: str) -> SearchParams | None:
+    """Search-time HNSW and quantization params for a collection's profile.
+    
+    Args:
+        collection: Collection name.
+    
+    Returns:
+        SearchParams, or None if the profile sets none and in embedded mode
+        (which always searches exactly).
+    """
+    if collection in _search_params_cache:
+        return _search_params_cache[collection]
+    
+    params = None
+    if not is_embedded_mode():
+        _, profile_config = get_collection_profile(collection)
+        search = profile_config.get("search")
+        if search:
+            quantization = None
+            if profile_config.get("quantization"):
+                quantization = QuantizationSearchParams(
+                    rescore=search.get("rescore"),
+                    oversampling=search.get("oversampling"),
+                )
+            params = SearchParams(hnsw_ef=search.get("hnsw_ef"), quantization=quantization)
+    
+    _search_params_cache[collection] = params
+    return params
+
+
 def setup_all_collections() -> dict:
     """Create all required collections if they don't exist.
     
@@ -1,9 +1,14 @@
 """Qdrant indexing utilities for RESPOND."""
 
+import json
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+
 from qdrant_client.models import PointStruct
 
+from config.settings import settings
 from config.qdrant_config import INCIDENT_IMAGES
-from src.qdrant.client import get_qdrant_client
+from src.qdrant.client import get_async_qdrant_client, get_qdrant_client
 from src.qdrant.collections import IMAGE_VECTOR_SIZE, TEXT_VECTOR_SIZE
 from src.utils.logger import get_logger
 
@@ -14,6 +19,9 @@ COLLECTION_VECTOR_SIZES = {
     INCIDENT_IMAGES: IMAGE_VECTOR_SIZE,  # 512 for CLIP
 }
 
+# Rough wire size of one vector dimension in a JSON request body
+_VECTOR_BYTES_PER_DIM = 12
+
 
 def get_expected_vector_size(collection: str) -> int:
     """Get expected vector size for a collection.
@@ -70,3 +78,156 @@ def upsert_point(
     _logger.debug(f"Upserted point {point_id} to {collection}")
     return point_id
 
+
+async def upsert_point_async(
+    collection: str,
+    point_id: str,
+    vector: list[float],
+    payload: dict,
+) -> str:
+    """Async variant of upsert_point().
+    
+    Args:
+        collection: Collection name.
+        point_id: Unique point identifier.
+        vector: Embedding vector.
+        payload: Point payload/metadata.
+    
+    Returns:
+        The inserted point_id.
+    
+    Raises:
+        ValueError: If vector length doesn't match expected size for collection.
+    """
+    expected_size = get_expected_vector_size(collection)
+    if len(vector) != expected_size:
+        raise ValueError(
+            f"Vector length {len(vector)} doesn't match expected size {expected_size} "
+            f"for collection {collection}"
+        )
+    
+    client = get_async_qdrant_client()
+    
+    await client.upsert(
+        collection_name=collection,
+        points=[PointStruct(id=point_id, vector=vector, payload=payload)],
+    )
+    
+    _logger.debug(f"Upserted point {point_id} to {collection}")
+    return point_id
+
+
+def upsert_points(
+    collection: str,
+    points: Iterable[tuple[str, list[float], dict]],
+    batch_size: int | None = None,
+    max_batch_bytes: int | None = None,
+    parallel: int | None = None,
+    wait: bool = True,
+) -> list[str]:
+    """Upsert many points in size-aware, pipelined batches.
+    
+    Points are consumed lazily and validated in the same pass that cuts
+    them into chunks. A chunk is closed when it reaches `batch_size` points
+    or `max_batch_bytes` of estimated request size. Chunks are sent with
+    wait=False from up to `parallel` workers; if `wait` is True the final
+    chunk is sent with wait=True after all others are acknowledged, acting
+    as a barrier for the whole write.
+    
+    Args:
+        collection: Collection name.
+        points: Iterable of (point_id, vector, payload) tuples.
+        batch_size: Max points per upsert request (default from settings).
+        max_batch_bytes: Max estimated bytes per request (default from settings).
+        parallel: Concurrent upsert requests (default from settings).
+        wait: Block until all points are applied.
+    
+    Returns:
+        List of upserted point_ids, in input order.
+    
+    Raises:
+        ValueError: If any vector length doesn't match expected size for collection.
+            Chunks cut before the bad point may already have been sent.
+    """
+    batch_size = batch_size or settings.QDRANT_UPSERT_BATCH_SIZE
+    max_batch_bytes = max_batch_bytes or settings.QDRANT_UPSERT_MAX_BATCH_BYTES
+    parallel = max(1, parallel or settings.QDRANT_UPSERT_PARALLEL)
+    
+    client = get_qdrant_client()
+    point_ids: list[str] = []
+    in_flight: list[Future] = []
+    chunk_count = 0
+    
+    def _write(chunk: list[PointStruct], wait_for_apply: bool) -> None:
+        client.upsert(collection_name=collection, points=chunk, wait=wait_for_apply)
+    
+    chunks = _chunk_points(collection, points, batch_size, max_batch_bytes, point_ids)
+    
+    with ThreadPoolExecutor(max_workers=parallel) as pool:
+        previous = next(chunks, None)
+        for chunk in chunks:
+            # Keep a bounded number of requests in flight
+            if len(in_flight) >= parallel * 2:
+                in_flight.pop(0).result()
+            in_flight.append(pool.submit(_write, previous, False))
+            chunk_count += 1
+            previous = chunk
+        
+        for future in in_flight:
+            future.result()
+    
+    # Final chunk doubles as the barrier
+    if previous:
+        _write(previous, wait)
+        chunk_count += 1
+    
+    _logger.debug(f"Upserted {len(point_ids)} points to {collection} in {chunk_count} batches")
+    return point_ids
+
+
+def _chunk_points(
+    collection: str,
+    points: Iterable[tuple[str, list[float], dict]],
+    batch_size: int,
+    max_batch_bytes: int,
+    point_ids: list[str],
+) -> Iterator[list[PointStruct]]:
+    """Validate points and cut them into count- and size-bounded chunks.
+    
+    Args:
+        collection: Collection name (selects the expected vector size).
+        points: Iterable of (point_id, vector, payload) tuples.
+        batch_size: Max points per chunk.
+        max_batch_bytes: Max estimated bytes per chunk.
+        point_ids: List that collects accepted point ids.
+    
+    Yields:
+        Lists of PointStruct.
+    
+    Raises:
+        ValueError: If a vector length doesn't match the collection.
+    """
+    expected_size = get_expected_vector_size(collection)
+    vector_bytes = expected_size * _VECTOR_BYTES_PER_DIM
+    chunk: list[PointStruct] = []
+    chunk_bytes = 0
+    
+    for point_id, vector, payload in points:
+        if len(vector) != expected_size:
+            raise ValueError(
+                f"Vector length {len(vector)} doesn't match expected size {expected_size} "
+                f"for collection {collection} (point {point_id})"
+            )
+        
+        point_bytes = vector_bytes + len(json.dumps(payload, default=str, separators=(",", ":")))
+        if chunk and (len(chunk) >= batch_size or chunk_bytes + point_bytes > max_batch_bytes):
+            yield chunk
+            chunk = []
+            chunk_bytes = 0
+        
+        chunk.append(PointStruct(id=point_id, vector=vector, payload=payload))
+        chunk_bytes += point_bytes
+        point_ids.append(point_id)
+    
+    if chunk:
+        yield chunk
@@ -0,0 +1,263 @@
+"""Point read/update helpers for RESPOND."""
+
+import random
+import threading
+import time
+import uuid
+
+from qdrant_client.models import (
+    FieldCondition,
+    Filter,
+    HasIdCondition,
+    IsEmptyCondition,
+    MatchValue,
+    PayloadField,
+)
+
+from config.settings import settings
+from src.qdrant.client import get_async_qdrant_client, get_qdrant_client
+from src.utils.logger import get_logger
+
+_logger = get_logger("qdrant.points")
+
+# Payload field holding a point's version (missing means 0)
+VERSION_KEY = "version"
+
+# Payload field with the IDs of the last few versioned writes
+VERSION_WRITERS_KEY = "version_writers"
+
+# Write IDs kept; a write is confirmed as long as fewer than this many
+# later writes land before its read-back
+VERSION_WRITERS_KEPT = 8
+
+# Versioned writes retried after losing a version check
+_conflicts = 0
+_conflicts_lock = threading.Lock()
+
+
+class VersionConflictError(RuntimeError):
+    """A versioned write kept losing to concurrent writers."""
+
+
+def _to_dict(point, with_vectors: bool) -> dict:
+    """Convert a retrieved Qdrant record to a plain dict."""
+    record = {
+        "id": str(point.id),
+        "payload": point.payload,
+    }
+    if with_vectors:
+        record["vector"] = point.vector
+    return record
+
+
+def retrieve(
+    collection: str,
+    ids: list[str],
+    with_payload: bool | list[str] = True,
+    with_vectors: bool = False,
+) -> list[dict]:
+    """Fetch points by ID.
+    
+    Args:
+        collection: Collection name.
+        ids: Point IDs to fetch.
+        with_payload: Return payload (or only the listed payload keys).
+        with_vectors: Return stored vectors.
+    
+    Returns:
+        List of dicts with id, payload (and vector if requested).
+    """
+    client = get_qdrant_client()
+    points = client.retrieve(
+        collection_name=collection,
+        ids=ids,
+        with_payload=with_payload,
+        with_vectors=with_vectors,
+    )
+    return [_to_dict(point, with_vectors) for point in points]
+
+
+async def retrieve_async(
+    collection: str,
+    ids: list[str],
+    with_payload: bool | list[str] = True,
+    with_vectors: bool = False,
+) -> list[dict]:
+    """Async variant of retrieve().
+    
+    Args:
+        collection: Collection name.
+        ids: Point IDs to fetch.
+        with_payload: Return payload (or only the listed payload keys).
+        with_vectors: Return stored vectors.
+    
+    Returns:
+        List of dicts with id, payload (and vector if requested).
+    """
+    client = get_async_qdrant_client()
+    points = await client.retrieve(
+        collection_name=collection,
+        ids=ids,
+        with_payload=with_payload,
+        with_vectors=with_vectors,
+    )
+    return [_to_dict(point, with_vectors) for point in points]
+
+
+def set_payload(collection: str, point_id: str, payload: dict) -> None:
+    """Merge payload fields into a point.
+    
+    Args:
+        collection: Collection name.
+        point_id: Point ID to update.
+        payload: Fields to set.
+    """
+    client = get_qdrant_client()
+    client.set_payload(
+        collection_name=collection,
+        payload=payload,
+        points=[point_id],
+    )
+    _logger.debug(f"Set payload {list(payload.keys())} on {point_id} in {collection}")
+
+
+async def set_payload_async(collection: str, point_id: str, payload: dict) -> None:
+    """Async variant of set_payload().
+    
+    Args:
+        collection: Collection name.
+        point_id: Point ID to update.
+        payload: Fields to set.
+    """
+    client = get_async_qdrant_client()
+    await client.set_payload(
+        collection_name=collection,
+        payload=payload,
+        points=[point_id],
+    )
+    _logger.debug(f"Set payload {list(payload.keys())} on {point_id} in {collection}")
+
+
+def scroll_all(
+    collection: str,
+    query_filter=None,
+    with_payload: bool | list[str] = True,
+    with_vectors: bool = False,
+    batch_size: int = 256,
+):
+    """Iterate over every point in a collection, page by page.
+    
+    Args:
+        collection: Collection name.
+        query_filter: Optional Qdrant Filter.
+        with_payload: Return payload (or only the listed payload keys).
+        with_vectors: Return stored vectors.
+        batch_size: Points fetched per scroll request.
+    
+    Yields:
+        Dicts with id, payload (and vector if requested).
+    """
+    client = get_qdrant_client()
+    offset = None
+    while True:
+        points, offset = client.scroll(
+            collection_name=collection,
+            scroll_filter=query_filter,
+            limit=batch_size,
+            offset=offset,
+            with_payload=with_payload,
+            with_vectors=with_vectors,
+        )
+        for point in points:
+            yield _to_dict(point, with_vectors)
+        if offset is None:
+            break
+
+
+def compare_and_set_payload(
+    collection: str,
+    point_id: str,
+    payload: dict,
+    current: dict,
+) -> int | None:
+    """Merge payload fields into a point only if its version is unchanged.
+    
+    The write is a set_payload restricted to the point while its version
+    still equals the one in `current`, bumping the version. Qdrant does not
+    report whether the filter matched, so each write tags itself with a
+    random ID (kept in the last VERSION_WRITERS_KEPT writes) and is
+    confirmed by reading the point back.
+    
+    Args:
+        collection: Collection name.
+        point_id: Point ID to update.
+        payload: Fields to set.
+        current: Payload snapshot the update was computed from.
+    
+    Returns:
+        New version if the write was applied, None if the point changed
+        since `current` was read (re-read and retry).
+    """
+    client = get_qdrant_client()
+    expected = current.get(VERSION_KEY, 0)
+    write_id = uuid.uuid4().hex[:12]
+    writers = (current.get(VERSION_WRITERS_KEY) or [])[-(VERSION_WRITERS_KEPT - 1):]
+    
+    client.set_payload(
+        collection_name=collection,
+        payload={
+            **payload,
+            VERSION_KEY: expected + 1,
+            VERSION_WRITERS_KEY: writers + [write_id],
+        },
+        points=Filter(must=[
+            HasIdCondition(has_id=[point_id]),
+            _version_condition(expected),
+        ]),
+    )
+    
+    records = client.retrieve(
+        collection_name=collection,
+        ids=[point_id],
+        with_payload=[VERSION_WRITERS_KEY],
+    )
+    applied = bool(records) and write_id in (records[0].payload.get(VERSION_WRITERS_KEY) or [])
+    if not applied:
+        _logger.debug(f"Version conflict on {point_id} in {collection} (expected {expected})")
+        return None
+    return expected + 1
+
+
+def record_version_conflict() -> None:
+    """Count a lost compare-and-set that is about to be retried."""
+    global _conflicts
+    with _conflicts_lock:
+        _conflicts += 1
+
+
+def get_version_conflicts() -> int:
+    """Get the number of compare-and-set writes retried so far."""
+    with _conflicts_lock:
+        return _conflicts
+
+
+def backoff_retry(attempt: int) -> None:
+    """Sleep a jittered, exponentially growing delay before a retry.
+    
+    Args:
+        attempt: Retry number (1 for the first retry).
+    """
+    delay_ms = settings.REINFORCE_RETRY_BACKOFF_MS * (2 ** min(attempt - 1, 6))
+    time.sleep(random.uniform(0, delay_ms) / 1000.0)
+
+
+def _version_condition(expected: int) -> Filter | FieldCondition:
+    """Condition matching points at the expected version."""
+    condition = FieldCondition(key=VERSION_KEY, match=MatchValue(value=expected))
+    if expected:
+        return condition
+    # Points written before versioning have no version field
+    return Filter(should=[
+        condition,
+        IsEmptyCondition(is_empty=PayloadField(key=VERSION_KEY)),
+    ])
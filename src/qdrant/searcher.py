@@ -1,8 +1,9 @@
 """Qdrant search utilities for RESPOND."""
 
-from qdrant_client.models import Filter
+from qdrant_client.models import Filter, FormulaQuery, Prefetch, QueryRequest, SearchParams
 
-from src.qdrant.client import get_qdrant_client
+from src.qdrant.client import get_async_qdrant_client, get_qdrant_client
+from src.qdrant.collections import get_search_params
 from src.utils.logger import get_logger
 
 _logger = get_logger("qdrant.searcher")
@@ -32,10 +33,211 @@ def search(
         query=query_vector,
         limit=limit,
         query_filter=qdrant_filter,
+        search_params=get_search_params(collection),
     ).points
     
     _logger.debug(f"Search in {collection} returned {len(results)} results")
     
+    return _to_hits(results)
+
+
+async def search_async(
+    collection: str,
+    query_vector: list[float],
+    limit: int = 10,
+    qdrant_filter: Filter | None = None,
+) -> list[dict]:
+    """Async variant of search().
+    
+    Args:
+        collection: Collection name to search.
+        query_vector: Query embedding vector.
+        limit: Maximum results to return.
+        qdrant_filter: Optional Qdrant filter object.
+    
+    Returns:
+        List of dicts with id, score, and payload.
+    """
+    client = get_async_qdrant_client()
+    
+    response = await client.query_points(
+        collection_name=collection,
+        query=query_vector,
+        limit=limit,
+        query_filter=qdrant_filter,
+        search_params=get_search_params(collection),
+    )
+    results = response.points
+    
+    _logger.debug(f"Async search in {collection} returned {len(results)} results")
+    
+    return _to_hits(results)
+
+
+def search_with_formula(
+    collection: str,
+    query_vector: list[float],
+    formula: FormulaQuery,
+    limit: int = 10,
+    qdrant_filter: Filter | None = None,
+    prefetch_limit: int | None = None,
+) -> list[dict]:
+    """Semantic search re-scored on the server by a formula query.
+    
+    The nearest `prefetch_limit` points (by similarity) are re-scored with
+    the formula, and the top `limit` by formula score are returned.
+    
+    Args:
+        collection: Collection name to search.
+        query_vector: Query embedding vector.
+        formula: Formula query (e.g. decayed similarity).
+        limit: Maximum results to return.
+        qdrant_filter: Optional Qdrant filter object.
+        prefetch_limit: Candidates to re-score (defaults to limit).
+    
+    Returns:
+        List of dicts with id, score (formula score), and payload.
+    """
+    client = get_qdrant_client()
+    
+    results = client.query_points(
+        collection_name=collection,
+        prefetch=Prefetch(
+            query=query_vector,
+            limit=max(limit, prefetch_limit or limit),
+            filter=qdrant_filter,
+            params=get_search_params(collection),
+        ),
+        query=formula,
+        limit=limit,
+    ).points
+    
+    _logger.debug(f"Formula search in {collection} returned {len(results)} results")
+    
+    return _to_hits(results)
+
+
+async def search_with_formula_async(
+    collection: str,
+    query_vector: list[float],
+    formula: FormulaQuery,
+    limit: int = 10,
+    qdrant_filter: Filter | None = None,
+    prefetch_limit: int | None = None,
+) -> list[dict]:
+    """Async variant of search_with_formula().
+    
+    Args:
+        collection: Collection name to search.
+        query_vector: Query embedding vector.
+        formula: Formula query (e.g. decayed similarity).
+        limit: Maximum results to return.
+        qdrant_filter: Optional Qdrant filter object.
+        prefetch_limit: Candidates to re-score (defaults to limit).
+    
+    Returns:
+        List of dicts with id, score (formula score), and payload.
+    """
+    client = get_async_qdrant_client()
+    
+    response = await client.query_points(
+        collection_name=collection,
+        prefetch=Prefetch(
+            query=query_vector,
+            limit=max(limit, prefetch_limit or limit),
+            filter=qdrant_filter,
+            params=get_search_params(collection),
+        ),
+        query=formula,
+        limit=limit,
+    )
+    results = response.points
+    
+    _logger.debug(f"Async formula search in {collection} returned {len(results)} results")
+    
+    return _to_hits(results)
+
+
+def search_batch(collection: str, searches: list[dict]) -> list[list[dict]]:
+    """Run several searches in one request.
+    
+    Args:
+        collection: Collection name to search.
+        searches: Dicts with query_vector and optional limit (default 10),
+            qdrant_filter, formula and prefetch_limit (as in search() and
+            search_with_formula()).
+    
+    Returns:
+        One list of hit dicts (id, score, payload) per search, in order.
+    """
+    if not searches:
+        return []
+    
+    client = get_qdrant_client()
+    
+    responses = client.query_batch_points(
+        collection_name=collection,
+        requests=[_to_request(s, get_search_params(collection)) for s in searches],
+    )
+    
+    _logger.debug(f"Batch search in {collection} ran {len(searches)} queries")
+    
+    return [_to_hits(response.points) for response in responses]
+
+
+async def search_batch_async(collection: str, searches: list[dict]) -> list[list[dict]]:
+    """Async variant of search_batch().
+    
+    Args:
+        collection: Collection name to search.
+        searches: Dicts with query_vector and optional limit (default 10),
+            qdrant_filter, formula and prefetch_limit.
+    
+    Returns:
+        One list of hit dicts (id, score, payload) per search, in order.
+    """
+    if not searches:
+        return []
+    
+    client = get_async_qdrant_client()
+    
+    responses = await client.query_batch_points(
+        collection_name=collection,
+        requests=[_to_request(s, get_search_params(collection)) for s in searches],
+    )
+    
+    _logger.debug(f"Async batch search in {collection} ran {len(searches)} queries")
+    
+    return [_to_hits(response.points) for response in responses]
+
+
+def _to_request(search: dict, params: SearchParams | None = None) -> QueryRequest:
+    """Build one batch query request from a search spec."""
+    limit = search.get("limit", 10)
+    formula = search.get("formula")
+    if formula is not None:
+        return QueryRequest(
+            prefetch=Prefetch(
+                query=search["query_vector"],
+                limit=max(limit, search.get("prefetch_limit") or limit),
+                filter=search.get("qdrant_filter"),
+                params=params,
+            ),
+            query=formula,
+            limit=limit,
+            with_payload=True,
+        )
+    return QueryRequest(
+        query=search["query_vector"],
+        filter=search.get("qdrant_filter"),
+        limit=limit,
+        params=params,
+        with_payload=True,
+    )
+
+
+def _to_hits(results: list) -> list[dict]:
+    """Convert Qdrant scored points to result dicts."""
     return [
         {
             "id": hit.id,
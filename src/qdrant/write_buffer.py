@@ -0,0 +1,372 @@
+"""Write-behind buffer for RESPOND payload updates.
+
+The buffer is opt-in (PAYLOAD_WRITE_BUFFER_ENABLED) and meant for internal
+fire-and-forget fields only: callers are not told whether a buffered update
+was written, and one that keeps failing is dropped after MAX_FLUSH_ATTEMPTS.
+User-facing writes such as status changes go to Qdrant synchronously.
+
+Plain (unversioned) payload updates are merged per point and flushed in
+batches with batch_update_points, on a timer or once enough points are
+pending. Points that end up with identical updates (e.g. many incidents set
+to the same status) share one SetPayload operation.
+
+Reads in this process see buffered writes through overlay(), so callers keep
+read-your-writes semantics; other processes see them after the flush. Anything
+derived from the stored payload (e.g. cached searches) can register an
+on_flush callback to be dropped once the update actually reaches Qdrant. The
+buffer is flushed on application shutdown and at interpreter exit.
+
+Compare-and-set writes (compare_and_set_payload) bypass the buffer.
+"""
+
+import atexit
+import json
+import os
+import threading
+from typing import Callable
+
+from qdrant_client.models import SetPayload, SetPayloadOperation
+
+from config.settings import settings
+from src.qdrant.client import get_qdrant_client
+from src.utils.logger import get_logger
+
+_logger = get_logger("qdrant.write_buffer")
+
+# Flush attempts before a point's update is dropped (e.g. the point was deleted)
+MAX_FLUSH_ATTEMPTS = 3
+
+_buffer: "PayloadWriteBuffer | None" = None
+_buffer_lock = threading.Lock()
+
+
+class PayloadWriteBuffer:
+    """Merges payload updates per point and flushes them in batches."""
+
+    def __init__(self, flush_interval_ms: float, max_points: int):
+        self._flush_interval = max(1.0, flush_interval_ms) / 1000.0
+        self._max_points = max(1, max_points)
+        self._cond = threading.Condition()
+        # (collection, point_id) -> merged fields, not yet sent
+        self._pending: dict[tuple[str, str], dict] = {}
+        # Fields being sent by the current flush (still visible to overlay())
+        self._inflight: dict[tuple[str, str], dict] = {}
+        # Callbacks to run once a point's buffered update is written (or dropped)
+        self._callbacks: dict[tuple[str, str], list[Callable[[], None]]] = {}
+        # Failed flush attempts per point
+        self._failures: dict[tuple[str, str], int] = {}
+        self._flush_lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._worker_pid: int | None = None
+        self._stats = {"updates": 0, "flushes": 0, "points": 0, "operations": 0, "errors": 0}
+
+    def set_payload(
+        self,
+        collection: str,
+        point_id: str,
+        payload: dict,
+        on_flush: Callable[[], None] | None = None,
+    ) -> None:
+        """Buffer a payload update (merged with earlier buffered updates).
+
+        Args:
+            collection: Collection name.
+            point_id: Point ID to update.
+            payload: Fields to set.
+            on_flush: Called after the update was written to Qdrant (or
+                dropped after MAX_FLUSH_ATTEMPTS), outside the buffer lock.
+        """
+        key = (collection, str(point_id))
+        with self._cond:
+            self._ensure_worker()
+            self._pending[key] = {**self._pending.get(key, {}), **payload}
+            if on_flush is not None:
+                self._callbacks.setdefault(key, []).append(on_flush)
+            self._stats["updates"] += 1
+            if len(self._pending) >= self._max_points:
+                self._cond.notify()
+
+    def overlay(self, collection: str, point_id: str, payload: dict | None) -> dict | None:
+        """Apply this process's unflushed updates to a payload read from Qdrant.
+
+        Args:
+            collection: Collection name.
+            point_id: Point ID.
+            payload: Payload as stored in Qdrant (None if not found).
+
+        Returns:
+            Payload with buffered fields applied (a new dict if any apply).
+        """
+        if payload is None or not (self._pending or self._inflight):
+            return payload
+        key = (collection, str(point_id))
+        with self._cond:
+            inflight = self._inflight.get(key)
+            pending = self._pending.get(key)
+        if inflight is None and pending is None:
+            return payload
+        return {**payload, **(inflight or {}), **(pending or {})}
+
+    def has_pending(self, collection: str) -> bool:
+        """Check whether updates for a collection are buffered or being sent."""
+        with self._cond:
+            return any(c == collection for c, _ in self._pending) or any(
+                c == collection for c, _ in self._inflight
+            )
+
+    def flush(self) -> int:
+        """Send all buffered updates now.
+
+        Returns:
+            Number of points written.
+        """
+        with self._flush_lock:
+            with self._cond:
+                if not self._pending:
+                    return 0
+                batch = self._pending
+                self._pending = {}
+                self._inflight = batch
+                callbacks = {key: self._callbacks.pop(key) for key in batch if key in self._callbacks}
+
+            failed = {}
+            try:
+                failed = self._send(batch)
+            except Exception:
+                failed = batch
+                raise
+            finally:
+                with self._cond:
+                    self._inflight = {}
+                    # Retried updates keep their callbacks for the next flush
+                    for key in self._requeue(batch, failed):
+                        if key in callbacks:
+                            self._callbacks[key] = callbacks.pop(key) + self._callbacks.get(key, [])
+                self._run_callbacks(callbacks)
+            return len(batch) - len(failed)
+
+    def stats(self) -> dict:
+        """Get buffer statistics.
+
+        Returns:
+            Dict with updates, flushes, points, operations, errors, pending
+            and avg_updates_per_point.
+        """
+        with self._cond:
+            stats = dict(self._stats)
+            stats["pending"] = len(self._pending)
+        stats["avg_updates_per_point"] = (
+            stats["updates"] / stats["points"] if stats["points"] else 0.0
+        )
+        return stats
+
+    def _requeue(self, batch: dict[tuple[str, str], dict], failed: dict) -> list[tuple[str, str]]:
+        """Put failed updates back under newer ones. Caller holds the lock.
+
+        Returns:
+            Keys that will be retried.
+        """
+        retried = []
+        for key in batch:
+            if key not in failed:
+                self._failures.pop(key, None)
+        for key, payload in failed.items():
+            attempts = self._failures.get(key, 0) + 1
+            if attempts >= MAX_FLUSH_ATTEMPTS:
+                _logger.error(f"Dropping payload update for {key[1]} in {key[0]} after {attempts} attempts")
+                self._failures.pop(key, None)
+                self._stats["errors"] += 1
+                continue
+            self._failures[key] = attempts
+            self._pending[key] = {**payload, **self._pending.get(key, {})}
+            retried.append(key)
+        return retried
+
+    def _run_callbacks(self, callbacks: dict[tuple[str, str], list[Callable[[], None]]]) -> None:
+        """Run on_flush callbacks of written (or dropped) updates."""
+        for key, functions in callbacks.items():
+            for function in functions:
+                try:
+                    function()
+                except Exception as e:
+                    _logger.error(f"Flush callback for {key[1]} in {key[0]} failed: {e}")
+
+    def _send(self, batch: dict[tuple[str, str], dict]) -> dict[tuple[str, str], dict]:
+        """Write a batch, one batch_update_points request per collection.
+
+        Returns:
+            Updates that could not be written, by (collection, point_id).
+        """
+        client = get_qdrant_client()
+        by_collection: dict[str, dict[str, list[str]]] = {}
+        payloads: dict[str, dict] = {}
+        for (collection, point_id), payload in batch.items():
+            payload_key = json.dumps(payload, sort_keys=True, default=str)
+            payloads[payload_key] = payload
+            by_collection.setdefault(collection, {}).setdefault(payload_key, []).append(point_id)
+
+        failed = {}
+        for collection, groups in by_collection.items():
+            operations = [
+                SetPayloadOperation(set_payload=SetPayload(payload=payloads[k], points=ids))
+                for k, ids in groups.items()
+            ]
+            try:
+                client.batch_update_points(
+                    collection_name=collection,
+                    update_operations=operations,
+                )
+            except Exception as e:
+                # One missing point fails the whole request; retry point by point
+                _logger.warning(f"Batched payload flush to {collection} failed ({e}), retrying per point")
+                failed.update(self._send_each(collection, groups, payloads))
+            else:
+                with self._cond:
+                    self._stats["operations"] += len(operations)
+
+        written = len(batch) - len(failed)
+        with self._cond:
+            self._stats["flushes"] += 1
+            self._stats["points"] += written
+        _logger.debug(f"Flushed payload updates for {written} points")
+        return failed
+
+    def _send_each(
+        self,
+        collection: str,
+        groups: dict[str, list[str]],
+        payloads: dict[str, dict],
+    ) -> dict[tuple[str, str], dict]:
+        """Write a collection's updates one point at a time.
+
+        Returns:
+            Updates that failed, by (collection, point_id).
+        """
+        client = get_qdrant_client()
+        failed = {}
+        for payload_key, point_ids in groups.items():
+            for point_id in point_ids:
+                try:
+                    client.set_payload(
+                        collection_name=collection,
+                        payload=payloads[payload_key],
+                        points=[point_id],
+                    )
+                except Exception as e:
+                    _logger.warning(f"Payload update for {point_id} in {collection} failed: {e}")
+                    failed[(collection, point_id)] = payloads[payload_key]
+        with self._cond:
+            self._stats["operations"] += sum(len(ids) for ids in groups.values()) - len(failed)
+        return failed
+
+    def _ensure_worker(self) -> None:
+        """Start the flush thread (again after a fork). Caller holds the lock."""
+        if (
+            self._worker is not None
+            and self._worker.is_alive()
+            and self._worker_pid == os.getpid()
+        ):
+            return
+        self._worker_pid = os.getpid()
+        self._worker = threading.Thread(
+            target=self._run,
+            name="respond-payload-flush",
+            daemon=True,
+        )
+        self._worker.start()
+
+    def _run(self) -> None:
+        """Flush loop: flush every interval, or early once max_points are pending."""
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: len(self._pending) >= self._max_points,
+                    timeout=self._flush_interval,
+                )
+            try:
+                self.flush()
+            except Exception as e:
+                _logger.error(f"Payload flush failed: {e}")
+
+
+def get_payload_buffer() -> PayloadWriteBuffer | None:
+    """Get the shared payload write buffer.
+
+    Returns:
+        PayloadWriteBuffer, or None if PAYLOAD_WRITE_BUFFER_ENABLED is off.
+    """
+    global _buffer
+    if not settings.PAYLOAD_WRITE_BUFFER_ENABLED:
+        return None
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = PayloadWriteBuffer(
+                    flush_interval_ms=settings.PAYLOAD_WRITE_BUFFER_FLUSH_MS,
+                    max_points=settings.PAYLOAD_WRITE_BUFFER_MAX_POINTS,
+                )
+                atexit.register(flush_payload_writes)
+    return _buffer
+
+
+def buffer_payload(
+    collection: str,
+    point_id: str,
+    payload: dict,
+    on_flush: Callable[[], None] | None = None,
+) -> None:
+    """Set payload fields through the write buffer (directly if disabled).
+
+    Args:
+        collection: Collection name.
+        point_id: Point ID to update.
+        payload: Fields to set.
+        on_flush: Called once the update is written to Qdrant.
+    """
+    buffer = get_payload_buffer()
+    if buffer is None:
+        get_qdrant_client().set_payload(
+            collection_name=collection,
+            payload=payload,
+            points=[point_id],
+        )
+        if on_flush is not None:
+            on_flush()
+        return
+    buffer.set_payload(collection, point_id, payload, on_flush)
+
+
+def overlay_payload(collection: str, point_id: str, payload: dict | None) -> dict | None:
+    """Apply unflushed buffered updates to a payload read from Qdrant.
+
+    Args:
+        collection: Collection name.
+        point_id: Point ID.
+        payload: Payload as stored in Qdrant.
+
+    Returns:
+        Payload including this process's buffered writes.
+    """
+    if _buffer is None:
+        return payload
+    return _buffer.overlay(collection, point_id, payload)
+
+
+def has_pending_payload_writes(collection: str) -> bool:
+    """Check whether this process has unflushed updates for a collection."""
+    return _buffer is not None and _buffer.has_pending(collection)
+
+
+def flush_payload_writes() -> int:
+    """Flush buffered payload updates (no-op if the buffer was never used).
+
+    Returns:
+        Number of points written.
+    """
+    if _buffer is None:
+        return 0
+    try:
+        return _buffer.flush()
+    except Exception as e:
+        _logger.error(f"Final payload flush failed: {e}")
+        return 0
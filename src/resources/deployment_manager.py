@@ -9,7 +9,9 @@ from datetime import datetime, timezone
 from config.qdrant_config import RESOURCE_DEPLOYMENTS
 from src.embeddings.text_embedder import TextEmbedder
 from src.qdrant.client import get_qdrant_client
-from src.qdrant.indexer import upsert_point
+from src.qdrant.indexer import upsert_points
+from src.qdrant.points import scroll_all
+from src.search.filters import build_search_filter
 from src.utils.ids import generate_uuid
 from src.utils.time_utils import utc_now_iso
 from src.utils.logger import get_logger
@@ -19,6 +21,9 @@ _logger = get_logger("resources.deployment")
 # Valid deployment statuses
 DEPLOYMENT_STATUSES = ["assigned", "en_route", "on_site", "completed", "cancelled"]
 
+# Statuses of deployments still in progress
+ACTIVE_STATUSES = ["assigned", "en_route", "on_site"]
+
 
 class DeploymentManager:
     """Manages resource deployments in Qdrant.
@@ -89,12 +94,7 @@ class DeploymentManager:
         
         # Generate ID and store
         deployment_id = generate_uuid()
-        upsert_point(
-            collection=self._collection,
-            point_id=deployment_id,
-            vector=vector,
-            payload=payload,
-        )
+        upsert_points(self._collection, [(deployment_id, vector, payload)])
         
         _logger.info(
             f"Created deployment {deployment_id[:8]}... "
@@ -201,39 +201,17 @@ class DeploymentManager:
         Returns:
             List of deployment dicts.
         """
-        from qdrant_client.models import Filter, FieldCondition, MatchValue
-        
-        # Filter for non-completed statuses
-        conditions = [
-            FieldCondition(
-                key="status",
-                match=MatchValue(value=status),
-            )
-            for status in ["assigned", "en_route", "on_site"]
-        ]
+        # Non-completed statuses (and zone) are filtered by Qdrant
+        active_filter = build_search_filter(zone_id=zone_id, status=ACTIVE_STATUSES)
         
         try:
-            # Search with dummy vector (we just want to list)
-            dummy_vector = [0.0] * 384
-            
-            results = self._client.search(
-                collection_name=self._collection,
-                query_vector=dummy_vector,
-                limit=50,
-                query_filter=Filter(should=conditions),
+            results = scroll_all(
+                self._collection,
+                query_filter=active_filter,
                 with_payload=True,
             )
             
-            deployments = []
-            for r in results:
-                if zone_id and r.payload.get("zone_id") != zone_id:
-                    continue
-                deployments.append({
-                    "id": str(r.id),
-                    "payload": r.payload,
-                })
-            
-            return deployments
+            return [{"id": r["id"], "payload": r["payload"]} for r in results]
         except Exception as e:
             _logger.error(f"Error listing deployments: {e}")
             return []
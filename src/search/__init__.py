@@ -1,5 +1,14 @@
 """RESPOND Search Package."""
 
-from src.search.hybrid_search import HybridSearcher
+from src.search.geo_search import GeoIndex, get_geo_index
+from src.search.hybrid_search import HybridSearcher, get_rerank_stats
+from src.search.temporal_search import TemporalIndex, get_temporal_index
 
-__all__ = ["HybridSearcher"]
+__all__ = [
+    "GeoIndex",
+    "HybridSearcher",
+    "TemporalIndex",
+    "get_geo_index",
+    "get_rerank_stats",
+    "get_temporal_index",
+]
@@ -1,89 +1,161 @@
-"""Filter builders for Qdrant search in RESPOND."""
+"""Filter builders for Qdrant search in RESPOND.
 
-from datetime import datetime, timezone, timedelta
+Filter objects are memoized: conditions are cached per (field, value) and
+whole filters per compiled plan (the normalized filter arguments), so a
+repeated search reuses the same pydantic objects instead of rebuilding
+them. Time cutoffs are rounded down to FILTER_TIME_QUANTUM_SECONDS so that
+`last_hours` plans stay reusable for that long (the window may include up to
+one quantum of older incidents).
+
+Returned conditions and filters are shared; treat them as immutable.
+"""
+
+import time
+from functools import lru_cache
 
 from qdrant_client.models import (
     Filter,
     FieldCondition,
+    HasIdCondition,
+    IsEmptyCondition,
+    MatchAny,
     MatchValue,
     Range,
     GeoBoundingBox,
     GeoRadius,
     GeoPoint,
+    PayloadField,
 )
 
+from config.settings import settings
+
+# Distinct compiled filters kept
+FILTER_PLAN_CACHE_SIZE = 4096
+
+# Distinct (field, value) conditions kept
+CONDITION_CACHE_SIZE = 8192
+
+
+def _normalize_values(value: str | list[str] | tuple | None) -> tuple | None:
+    """Normalize a single value or list of values to a hashable sorted tuple."""
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple, set, frozenset)):
+        values = tuple(sorted(set(value)))
+        return values or None
+    return (value,)
+
+
+@lru_cache(maxsize=CONDITION_CACHE_SIZE)
+def _match_condition(key: str, values: tuple) -> FieldCondition:
+    """Cached match condition: MatchValue for one value, MatchAny for several."""
+    if len(values) == 1:
+        return FieldCondition(key=key, match=MatchValue(value=values[0]))
+    return FieldCondition(key=key, match=MatchAny(any=list(values)))
+
+
+@lru_cache(maxsize=CONDITION_CACHE_SIZE)
+def _range_condition(key: str, gte: int) -> FieldCondition:
+    """Cached lower-bound range condition."""
+    return FieldCondition(key=key, range=Range(gte=gte))
 
-def build_status_filter(status: str | None) -> FieldCondition | None:
+
+@lru_cache(maxsize=CONDITION_CACHE_SIZE)
+def _geo_radius_condition(lat: float, lon: float, radius_km: float) -> FieldCondition:
+    """Cached geo-radius condition on the location field."""
+    return FieldCondition(
+        key="location",
+        geo_radius=GeoRadius(
+            center=GeoPoint(lat=lat, lon=lon),
+            radius=radius_km * 1000,  # Convert to meters
+        ),
+    )
+
+
+def build_match_filter(key: str, value: str | list[str] | None) -> FieldCondition | None:
+    """Build a match filter on any keyword payload field.
+    
+    Args:
+        key: Payload field name.
+        value: Value, or list of values (matches any of them).
+    
+    Returns:
+        FieldCondition or None if value is None or an empty list.
+    """
+    values = _normalize_values(value)
+    if values is None:
+        return None
+    return _match_condition(key, values)
+
+
+def build_status_filter(status: str | list[str] | None) -> FieldCondition | None:
     """Build filter for status field.
     
     Args:
-        status: Status value to filter on.
+        status: Status value (or list of values) to filter on.
     
     Returns:
         FieldCondition or None if status is None.
     """
-    if status is None:
-        return None
-    return FieldCondition(
-        key="status",
-        match=MatchValue(value=status),
-    )
+    return build_match_filter("status", status)
 
 
-def build_urgency_filter(urgency: str | None) -> FieldCondition | None:
+def build_urgency_filter(urgency: str | list[str] | None) -> FieldCondition | None:
     """Build filter for urgency field.
     
     Args:
-        urgency: Urgency value to filter on.
+        urgency: Urgency value (or list of values) to filter on.
     
     Returns:
         FieldCondition or None if urgency is None.
     """
-    if urgency is None:
-        return None
-    return FieldCondition(
-        key="urgency",
-        match=MatchValue(value=urgency),
-    )
+    return build_match_filter("urgency", urgency)
 
 
-def build_zone_filter(zone_id: str | None) -> FieldCondition | None:
+def build_zone_filter(zone_id: str | list[str] | None) -> FieldCondition | None:
     """Build filter for zone_id field.
     
     Args:
-        zone_id: Zone ID to filter on.
+        zone_id: Zone ID (or list of zone IDs) to filter on.
     
     Returns:
         FieldCondition or None if zone_id is None.
     """
-    if zone_id is None:
-        return None
-    return FieldCondition(
-        key="zone_id",
-        match=MatchValue(value=zone_id),
-    )
+    return build_match_filter("zone_id", zone_id)
 
 
-def build_time_filter(last_hours: int | None) -> FieldCondition | None:
-    """Build filter for timestamp_unix within last N hours.
+def time_cutoff(last_hours: int | None, now_unix: float | None = None) -> int | None:
+    """Quantized timestamp_unix cutoff for a last-N-hours window.
     
     Args:
         last_hours: Number of hours to look back.
+        now_unix: Reference time (defaults to now).
     
     Returns:
-        FieldCondition or None if last_hours is None.
+        Cutoff rounded down to FILTER_TIME_QUANTUM_SECONDS, or None.
     """
     if last_hours is None:
         return None
+    now = time.time() if now_unix is None else now_unix
+    quantum = max(1, settings.FILTER_TIME_QUANTUM_SECONDS)
+    cutoff = int(now - last_hours * 3600)
+    return cutoff - cutoff % quantum
+
+
+def build_time_filter(last_hours: int | None, now_unix: float | None = None) -> FieldCondition | None:
+    """Build filter for timestamp_unix within last N hours.
     
-    # Calculate cutoff as Unix epoch seconds
-    now_unix = int(datetime.now(timezone.utc).timestamp())
-    cutoff_unix = now_unix - (last_hours * 3600)
+    Args:
+        last_hours: Number of hours to look back.
+        now_unix: Reference time (defaults to now).
     
-    return FieldCondition(
-        key="timestamp_unix",
-        range=Range(gte=cutoff_unix),
-    )
+    Returns:
+        FieldCondition or None if last_hours is None.
+    """
+    cutoff_unix = time_cutoff(last_hours, now_unix)
+    if cutoff_unix is None:
+        return None
+    return _range_condition("timestamp_unix", cutoff_unix)
 
 
 def build_geo_filter(
@@ -101,17 +173,7 @@ def build_geo_filter(
     """
     if center is None or radius_km is None:
         return None
-    
-    return FieldCondition(
-        key="location",
-        geo_radius=GeoRadius(
-            center=GeoPoint(
-                lat=float(center["lat"]),
-                lon=float(center["lon"]),
-            ),
-            radius=radius_km * 1000,  # Convert to meters
-        ),
-    )
+    return _geo_radius_condition(float(center["lat"]), float(center["lon"]), float(radius_km))
 
 
 def combine_filters(filters: list) -> Filter | None:
@@ -130,3 +192,110 @@ def combine_filters(filters: list) -> Filter | None:
         return None
     
     return Filter(must=valid_filters)
+
+
+def build_widening_filter(
+    base: Filter | None,
+    since_unix: int | None,
+    exclude_ids: list[str],
+) -> Filter:
+    """Restrict a filter to unfetched incidents reported at or after since_unix.
+    
+    Incidents without a timestamp_unix are kept (decay treats them as new).
+    
+    Args:
+        base: Filter to restrict (None for all incidents).
+        since_unix: Earliest timestamp_unix (None for any).
+        exclude_ids: Point IDs already fetched.
+    
+    Returns:
+        New Filter (not memoized).
+    """
+    must = [base] if base is not None else []
+    if since_unix is not None:
+        must.append(Filter(should=[
+            _range_condition("timestamp_unix", since_unix),
+            IsEmptyCondition(is_empty=PayloadField(key="timestamp_unix")),
+        ]))
+    must_not = [HasIdCondition(has_id=exclude_ids)] if exclude_ids else None
+    return Filter(must=must or None, must_not=must_not)
+
+
+def build_search_filter(
+    zone_id: str | list[str] | None = None,
+    urgency: str | list[str] | None = None,
+    status: str | list[str] | None = None,
+    last_hours: int | None = None,
+    center: dict | None = None,
+    radius_km: float | None = None,
+    now_unix: float | None = None,
+    **match_fields,
+) -> Filter | None:
+    """Compile (or reuse) the Filter for a set of search filters.
+    
+    Args:
+        zone_id: Zone ID or list of zone IDs.
+        urgency: Urgency level or list of levels.
+        status: Status or list of statuses.
+        last_hours: Filter to incidents within last N hours (quantized).
+        center: Geo center point {"lat": float, "lon": float}.
+        radius_km: Radius in kilometers for geo filtering.
+        now_unix: Reference time for last_hours (defaults to now).
+        **match_fields: Other keyword fields to match (value or list),
+            e.g. image_type or incident_id.
+    
+    Returns:
+        Shared Filter, or None if no filter applies.
+    """
+    geo = None
+    if center is not None and radius_km is not None:
+        geo = (float(center["lat"]), float(center["lon"]), float(radius_km))
+    
+    fields = [
+        ("zone_id", _normalize_values(zone_id)),
+        ("urgency", _normalize_values(urgency)),
+        ("status", _normalize_values(status)),
+    ]
+    fields.extend(
+        (key, _normalize_values(value)) for key, value in sorted(match_fields.items())
+    )
+    plan = (
+        tuple((key, values) for key, values in fields if values is not None),
+        time_cutoff(last_hours, now_unix),
+        geo,
+    )
+    return _compile_plan(plan)
+
+
+@lru_cache(maxsize=FILTER_PLAN_CACHE_SIZE)
+def _compile_plan(plan: tuple) -> Filter | None:
+    """Build the Filter for a normalized plan (see build_search_filter())."""
+    matches, cutoff_unix, geo = plan
+    conditions = [_match_condition(key, values) for key, values in matches]
+    if cutoff_unix is not None:
+        conditions.append(_range_condition("timestamp_unix", cutoff_unix))
+    if geo is not None:
+        conditions.append(_geo_radius_condition(*geo))
+    return Filter(must=conditions) if conditions else None
+
+
+def get_filter_plan_stats() -> dict:
+    """Get filter memoization statistics.
+    
+    Returns:
+        Dict with plan and condition cache hits, misses and sizes.
+    """
+    plans = _compile_plan.cache_info()
+    conditions = [
+        _match_condition.cache_info(),
+        _range_condition.cache_info(),
+        _geo_radius_condition.cache_info(),
+    ]
+    return {
+        "plan_hits": plans.hits,
+        "plan_misses": plans.misses,
+        "plans": plans.currsize,
+        "condition_hits": sum(info.hits for info in conditions),
+        "condition_misses": sum(info.misses for info in conditions),
+        "conditions": sum(info.currsize for info in conditions),
+    }
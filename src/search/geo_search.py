@@ -0,0 +1,642 @@
+"""Geo search for RESPOND.
+
+An in-memory grid index over incident locations answers nearest-incident,
+bounding-box count and density (heatmap) queries without a vector query.
+
+The index is built once from a payload-only scroll of situation reports and
+then kept in sync through the incident bus, so it reflects writes made by
+this process immediately. It is per process: with several workers, each
+worker sees its own writes plus everything present at its last rebuild.
+"""
+
+import math
+import threading
+import time
+
+import numpy as np
+
+from config.qdrant_config import SITUATION_REPORTS, SUPPORTED_URGENCY
+from config.settings import settings
+from src.qdrant.points import scroll_all
+from src.stream.bus import INCIDENT_CREATED, get_incident_bus
+from src.utils.geo_utils import EARTH_RADIUS_KM, is_valid_lat_lon
+from src.utils.logger import get_logger
+
+_logger = get_logger("search.geo_search")
+
+# Kilometers per degree of latitude
+KM_PER_DEG = EARTH_RADIUS_KM * math.pi / 180.0
+
+# Payload fields kept per indexed incident
+INDEXED_FIELDS = ["location", "zone_id", "urgency", "status", "timestamp_unix"]
+
+# Fine rings scanned before a nearest query moves to the coarse grid
+FINE_MAX_RINGS = 8
+
+# Fine cells per coarse cell side
+COARSE_FACTOR = 16
+
+_URGENCY_RANK = {urgency: rank for rank, urgency in enumerate(reversed(SUPPORTED_URGENCY))}
+
+_index: "GeoIndex | None" = None
+_index_lock = threading.Lock()
+
+
+def _haversine_np(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Vectorized great-circle distance (km) from one point to many."""
+    phi1 = math.radians(lat)
+    phi2 = np.radians(lats)
+    dphi = phi2 - phi1
+    dlambda = np.radians(lons - lon)
+    a = np.sin(dphi / 2) ** 2 + math.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(1.0, np.sqrt(a)))
+
+
+def _grid_index(offset_deg: float, cell_deg: float) -> int:
+    """Cell index of an offset, robust to float error on cell edges."""
+    return int(math.floor(offset_deg / cell_deg + 1e-9))
+
+
+def _in_lon_range(lon: float, min_lon: float, max_lon: float) -> bool:
+    """Check a longitude against a range that may cross the antimeridian."""
+    if min_lon <= max_lon:
+        return min_lon <= lon <= max_lon
+    return lon >= min_lon or lon <= max_lon
+
+
+class GeoIndex:
+    """Uniform lat/lon grid of incident locations.
+
+    Each cell maps incident id -> entry dict (id, lat, lon, zone_id,
+    urgency, status, timestamp_unix). Nearest-neighbour queries scan rings
+    of cells outward from the query point until no unvisited cell can hold
+    a closer incident, switching to a coarser grid (COARSE_FACTOR fine cells
+    per side) when the neighbourhood is sparse.
+    """
+
+    def __init__(self, cell_deg: float = 0.05):
+        if cell_deg <= 0:
+            raise ValueError("cell_deg must be positive")
+        self._cell_deg = cell_deg
+        self._rows = math.ceil(180.0 / cell_deg)
+        self._cols = math.ceil(360.0 / cell_deg)
+        self._cells: dict[tuple[int, int], dict[str, dict]] = {}
+        self._points: dict[str, tuple[int, int]] = {}
+        # Coarse cell -> occupied fine cells, for wide nearest-neighbour searches
+        self._coarse: dict[tuple[int, int], set[tuple[int, int]]] = {}
+        self._lock = threading.RLock()
+        # Ids written through the bus while a rebuild scroll is running
+        self._touched: set[str] | None = None
+        self._built_at: float | None = None
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def upsert(self, incident_id: str, payload: dict) -> None:
+        """Insert or move an incident.
+
+        Args:
+            incident_id: Incident ID.
+            payload: Incident payload (needs 'location'; others optional).
+        """
+        location = payload.get("location")
+        with self._lock:
+            if self._touched is not None:
+                self._touched.add(incident_id)
+            if not location or not is_valid_lat_lon(location["lat"], location["lon"]):
+                self._remove(incident_id)
+                return
+            self._place(incident_id, payload)
+
+    def update(self, incident_id: str, changes: dict) -> None:
+        """Apply payload changes to an indexed incident.
+
+        Args:
+            incident_id: Incident ID.
+            changes: Changed payload fields.
+        """
+        with self._lock:
+            if self._touched is not None:
+                self._touched.add(incident_id)
+            cell = self._points.get(incident_id)
+            if cell is None:
+                if changes.get("location"):
+                    self.upsert(incident_id, changes)
+                return
+            entry = self._cells[cell][incident_id]
+            if "location" in changes:
+                merged = {**entry, **changes}
+                self.upsert(incident_id, merged)
+                return
+            for key in ("zone_id", "urgency", "status", "timestamp_unix"):
+                if key in changes:
+                    entry[key] = changes[key]
+
+    def remove(self, incident_id: str) -> None:
+        """Drop an incident from the index."""
+        with self._lock:
+            if self._touched is not None:
+                self._touched.add(incident_id)
+            self._remove(incident_id)
+
+    def clear(self) -> None:
+        """Drop every incident."""
+        with self._lock:
+            self._cells.clear()
+            self._points.clear()
+            self._coarse.clear()
+
+    def handle_event(self, event: dict) -> None:
+        """Incident bus listener keeping the index in sync."""
+        incident_id = event.get("incident_id")
+        if incident_id is None or not event["type"].startswith("incident."):
+            return
+        if event["type"] == INCIDENT_CREATED and event.get("payload"):
+            self.upsert(incident_id, event["payload"])
+        elif event.get("changes"):
+            self.update(incident_id, event["changes"])
+
+    def rebuild(self) -> int:
+        """Reload the index from the situation reports collection.
+
+        Incidents written through the bus while the scroll runs keep their
+        newer state.
+
+        Returns:
+            Number of indexed incidents.
+        """
+        started = time.perf_counter()
+        with self._lock:
+            self._touched = set()
+        try:
+            records = list(scroll_all(SITUATION_REPORTS, with_payload=INDEXED_FIELDS))
+        except Exception:
+            with self._lock:
+                self._touched = None
+            raise
+
+        with self._lock:
+            touched = self._touched
+            self._touched = None
+            kept = {
+                incident_id: self._cells[cell][incident_id]
+                for incident_id, cell in self._points.items()
+                if incident_id in touched
+            }
+            self.clear()
+            for record in records:
+                payload = record["payload"] or {}
+                location = payload.get("location")
+                if record["id"] in touched or not location:
+                    continue
+                if is_valid_lat_lon(location["lat"], location["lon"]):
+                    self._place(record["id"], payload)
+            for incident_id, entry in kept.items():
+                self._place(incident_id, entry)
+            self._built_at = time.time()
+            count = len(self._points)
+
+        _logger.info(
+            f"Geo index rebuilt: {count} incidents in "
+            f"{(time.perf_counter() - started) * 1000:.1f}ms"
+        )
+        return count
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def nearest(
+        self,
+        lat: float,
+        lon: float,
+        k: int = 10,
+        max_radius_km: float | None = None,
+        zone_id: str | None = None,
+        urgency: str | None = None,
+        status: str | None = None,
+        last_hours: int | None = None,
+    ) -> list[dict]:
+        """Find the k incidents closest to a point.
+
+        Args:
+            lat: Query latitude.
+            lon: Query longitude.
+            k: Number of incidents to return.
+            max_radius_km: Optional maximum distance.
+            zone_id: Filter by zone ID.
+            urgency: Filter by urgency level.
+            status: Filter by status.
+            last_hours: Filter to incidents within last N hours.
+
+        Returns:
+            Entries sorted by distance, each with an added 'distance_km'.
+
+        Raises:
+            ValueError: If the point is invalid or k < 1.
+        """
+        if not is_valid_lat_lon(lat, lon):
+            raise ValueError("Invalid lat/lon")
+        if k < 1:
+            raise ValueError("k must be at least 1")
+
+        match = self._matcher(zone_id, urgency, status, last_hours)
+
+        with self._lock:
+            # Fine rings first; far-away or sparse neighbourhoods on the coarse grid
+            candidates = self._ring_search(
+                lat, lon, k, max_radius_km, match, coarse=False, max_rings=FINE_MAX_RINGS,
+            )
+            if candidates is None:
+                candidates = self._ring_search(lat, lon, k, max_radius_km, match, coarse=True)
+            candidates = [dict(entry) for entry in candidates]
+
+        if not candidates:
+            return []
+
+        distances = _haversine_np(
+            lat,
+            lon,
+            np.fromiter((e["lat"] for e in candidates), float, len(candidates)),
+            np.fromiter((e["lon"] for e in candidates), float, len(candidates)),
+        )
+        order = np.argsort(distances, kind="stable")
+        results = []
+        for i in order[:k]:
+            if max_radius_km is not None and distances[i] > max_radius_km:
+                break
+            entry = candidates[i]
+            entry["distance_km"] = round(float(distances[i]), 4)
+            results.append(entry)
+        return results
+
+    def count_bbox(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        zone_id: str | None = None,
+        urgency: str | None = None,
+        status: str | None = None,
+        last_hours: int | None = None,
+    ) -> dict:
+        """Count incidents inside a bounding box.
+
+        A box with min_lon > max_lon crosses the antimeridian.
+
+        Args:
+            min_lat: Southern edge.
+            min_lon: Western edge.
+            max_lat: Northern edge.
+            max_lon: Eastern edge.
+            zone_id: Filter by zone ID.
+            urgency: Filter by urgency level.
+            status: Filter by status.
+            last_hours: Filter to incidents within last N hours.
+
+        Returns:
+            Dict with count, by_urgency and by_status.
+
+        Raises:
+            ValueError: If the box is invalid.
+        """
+        by_urgency: dict[str, int] = {}
+        by_status: dict[str, int] = {}
+        count = 0
+        for entry in self._in_bbox(
+            min_lat, min_lon, max_lat, max_lon, zone_id, urgency, status, last_hours
+        ):
+            count += 1
+            if entry.get("urgency") is not None:
+                by_urgency[entry["urgency"]] = by_urgency.get(entry["urgency"], 0) + 1
+            if entry.get("status") is not None:
+                by_status[entry["status"]] = by_status.get(entry["status"], 0) + 1
+        return {"count": count, "by_urgency": by_urgency, "by_status": by_status}
+
+    def density(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        precision_deg: float | None = None,
+        zone_id: str | None = None,
+        urgency: str | None = None,
+        status: str | None = None,
+        last_hours: int | None = None,
+    ) -> list[dict]:
+        """Aggregate incidents in a bounding box into heatmap cells.
+
+        Args:
+            min_lat: Southern edge.
+            min_lon: Western edge.
+            max_lat: Northern edge.
+            max_lon: Eastern edge.
+            precision_deg: Heatmap cell size in degrees (defaults to, and is
+                never finer than, the index cell size).
+            zone_id: Filter by zone ID.
+            urgency: Filter by urgency level.
+            status: Filter by status.
+            last_hours: Filter to incidents within last N hours.
+
+        Returns:
+            Non-empty cells sorted by count (descending), each with lat/lon
+            of the cell center, bounds, count, max_urgency and the mean
+            location of its incidents (centroid).
+
+        Raises:
+            ValueError: If the box is invalid.
+        """
+        precision = max(precision_deg or self._cell_deg, self._cell_deg)
+        buckets: dict[tuple[int, int], dict] = {}
+
+        for entry in self._in_bbox(
+            min_lat, min_lon, max_lat, max_lon, zone_id, urgency, status, last_hours
+        ):
+            key = (
+                _grid_index(entry["lat"] + 90.0, precision),
+                _grid_index(entry["lon"] + 180.0, precision),
+            )
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = {"count": 0, "lat_sum": 0.0, "lon_sum": 0.0, "rank": -1}
+            bucket["count"] += 1
+            bucket["lat_sum"] += entry["lat"]
+            bucket["lon_sum"] += entry["lon"]
+            bucket["rank"] = max(bucket["rank"], _URGENCY_RANK.get(entry.get("urgency"), -1))
+
+        urgency_by_rank = {rank: urgency for urgency, rank in _URGENCY_RANK.items()}
+        cells = []
+        for (i, j), bucket in buckets.items():
+            south = i * precision - 90.0
+            west = j * precision - 180.0
+            cells.append({
+                "lat": round(south + precision / 2, 6),
+                "lon": round(west + precision / 2, 6),
+                "bounds": {
+                    "min_lat": round(south, 6),
+                    "min_lon": round(west, 6),
+                    "max_lat": round(south + precision, 6),
+                    "max_lon": round(west + precision, 6),
+                },
+                "count": bucket["count"],
+                "max_urgency": urgency_by_rank.get(bucket["rank"]),
+                "centroid": {
+                    "lat": bucket["lat_sum"] / bucket["count"],
+                    "lon": bucket["lon_sum"] / bucket["count"],
+                },
+            })
+        cells.sort(key=lambda cell: cell["count"], reverse=True)
+        return cells
+
+    def stats(self) -> dict:
+        """Get index statistics.
+
+        Returns:
+            Dict with incidents, occupied cells, cell_deg and built_at.
+        """
+        with self._lock:
+            return {
+                "incidents": len(self._points),
+                "cells": len(self._cells),
+                "cell_deg": self._cell_deg,
+                "built_at": self._built_at,
+            }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _cell(self, lat: float, lon: float) -> tuple[int, int]:
+        """Grid cell of a point."""
+        i = min(self._rows - 1, _grid_index(lat + 90.0, self._cell_deg))
+        j = _grid_index(lon + 180.0, self._cell_deg) % self._cols
+        return i, j
+
+    @staticmethod
+    def _coarse_cell(cell: tuple[int, int]) -> tuple[int, int]:
+        """Coarse cell containing a fine cell."""
+        return cell[0] // COARSE_FACTOR, cell[1] // COARSE_FACTOR
+
+    def _place(self, incident_id: str, payload: dict) -> None:
+        """Store an entry for a validated location (caller holds the lock)."""
+        location = payload.get("location") or {"lat": payload["lat"], "lon": payload["lon"]}
+        entry = {
+            "id": incident_id,
+            "lat": float(location["lat"]),
+            "lon": float(location["lon"]),
+            "zone_id": payload.get("zone_id"),
+            "urgency": payload.get("urgency"),
+            "status": payload.get("status"),
+            "timestamp_unix": payload.get("timestamp_unix"),
+        }
+        self._remove(incident_id)
+        cell = self._cell(entry["lat"], entry["lon"])
+        if cell not in self._cells:
+            self._cells[cell] = {}
+            self._coarse.setdefault(self._coarse_cell(cell), set()).add(cell)
+        self._cells[cell][incident_id] = entry
+        self._points[incident_id] = cell
+
+    def _remove(self, incident_id: str) -> None:
+        """Remove an entry if present (caller holds the lock)."""
+        cell = self._points.pop(incident_id, None)
+        if cell is None:
+            return
+        entries = self._cells[cell]
+        entries.pop(incident_id, None)
+        if not entries:
+            del self._cells[cell]
+            coarse = self._coarse_cell(cell)
+            self._coarse[coarse].discard(cell)
+            if not self._coarse[coarse]:
+                del self._coarse[coarse]
+
+    def _ring_search(
+        self,
+        lat: float,
+        lon: float,
+        k: int,
+        max_radius_km: float | None,
+        match,
+        coarse: bool,
+        max_rings: int | None = None,
+    ) -> list[dict] | None:
+        """Collect candidates ring by ring on one grid level (caller holds the lock).
+
+        Returns:
+            Matching entries that include the k nearest, or None if
+            `max_rings` rings were not enough.
+        """
+        factor = COARSE_FACTOR if coarse else 1
+        cell_deg = self._cell_deg * factor
+        cols = math.ceil(self._cols / factor)
+        occupied = len(self._coarse) if coarse else len(self._cells)
+        fine_i, fine_j = self._cell(lat, lon)
+        center = (fine_i // factor, fine_j // factor)
+
+        candidates: list[dict] = []
+        lats: list[float] = []
+        lons: list[float] = []
+        radius = 0
+        while True:
+            side = 2 * radius + 1
+            if coarse and (side * side >= occupied or side >= cols):
+                # The ring covers more cells than are occupied: scan them all
+                return [
+                    entry
+                    for entries in self._cells.values()
+                    for entry in entries.values()
+                    if match(entry)
+                ]
+            if max_rings is not None and radius >= max_rings:
+                return None
+
+            for cell in self._ring(center, radius, factor):
+                for entries in self._cell_entries(cell, coarse):
+                    for entry in entries.values():
+                        if match(entry):
+                            candidates.append(entry)
+                            lats.append(entry["lat"])
+                            lons.append(entry["lon"])
+
+            bound = self._ring_bound_km(lat, radius, cell_deg)
+            if max_radius_km is not None and bound > max_radius_km:
+                return candidates
+            if len(candidates) >= k:
+                distances = _haversine_np(lat, lon, np.asarray(lats), np.asarray(lons))
+                if np.partition(distances, k - 1)[k - 1] <= bound:
+                    return candidates
+            radius += 1
+
+    def _cell_entries(self, cell: tuple[int, int], coarse: bool):
+        """Entry dicts of a fine cell, or of every fine cell in a coarse cell."""
+        if not coarse:
+            entries = self._cells.get(cell)
+            return (entries,) if entries else ()
+        return [self._cells[fine] for fine in self._coarse.get(cell, ())]
+
+    def _ring(self, center: tuple[int, int], radius: int, factor: int = 1):
+        """Cells at Chebyshev distance `radius` from `center` on a grid of `factor`-sized cells."""
+        rows = math.ceil(self._rows / factor)
+        cols = math.ceil(self._cols / factor)
+        ci, cj = center
+        if radius == 0:
+            yield ci, cj
+            return
+        for di in range(-radius, radius + 1):
+            i = ci + di
+            if not 0 <= i < rows:
+                continue
+            if abs(di) == radius:
+                for dj in range(-radius, radius + 1):
+                    yield i, (cj + dj) % cols
+            else:
+                yield i, (cj - radius) % cols
+                yield i, (cj + radius) % cols
+
+    def _ring_bound_km(self, lat: float, radius: int, cell_deg: float) -> float:
+        """Lower bound on the distance to any cell outside ring `radius`.
+
+        Such a cell is at least radius cells away in latitude or in
+        longitude. A longitude gap is bounded by the cross-track distance
+        from the point to the meridian at that gap, which is also the
+        closest any point on a farther meridian can be.
+        """
+        gap_deg = radius * cell_deg
+        lat_km = gap_deg * KM_PER_DEG
+        lon_km = EARTH_RADIUS_KM * math.asin(
+            min(1.0, math.cos(math.radians(lat)) * math.sin(math.radians(min(gap_deg, 90.0))))
+        )
+        return min(lat_km, lon_km)
+
+    @staticmethod
+    def _matcher(zone_id, urgency, status, last_hours):
+        """Build an entry predicate for the payload filters."""
+        since = time.time() - last_hours * 3600 if last_hours is not None else None
+
+        def match(entry: dict) -> bool:
+            if zone_id is not None and entry["zone_id"] != zone_id:
+                return False
+            if urgency is not None and entry["urgency"] != urgency:
+                return False
+            if status is not None and entry["status"] != status:
+                return False
+            if since is not None and (entry["timestamp_unix"] or 0) < since:
+                return False
+            return True
+
+        return match
+
+    def _in_bbox(self, min_lat, min_lon, max_lat, max_lon, zone_id, urgency, status, last_hours):
+        """Copies of matching entries inside a bounding box."""
+        if not (is_valid_lat_lon(min_lat, min_lon) and is_valid_lat_lon(max_lat, max_lon)):
+            raise ValueError("Invalid bounding box coordinates")
+        if min_lat > max_lat:
+            raise ValueError("min_lat must not exceed max_lat")
+
+        match = self._matcher(zone_id, urgency, status, last_hours)
+        i_lo = self._cell(min_lat, min_lon)[0]
+        i_hi = self._cell(max_lat, max_lon)[0]
+        j_lo = self._cell(min_lat, min_lon)[1]
+        j_hi = self._cell(max_lat, max_lon)[1]
+        n_cols = (j_hi - j_lo) % self._cols + 1
+        if min_lon > max_lon and n_cols == 1:
+            n_cols = self._cols
+
+        with self._lock:
+            if (i_hi - i_lo + 1) * n_cols > len(self._cells):
+                cells = [
+                    entries
+                    for (i, j), entries in self._cells.items()
+                    if i_lo <= i <= i_hi and (j - j_lo) % self._cols < n_cols
+                ]
+            else:
+                cells = [
+                    self._cells[(i, (j_lo + dj) % self._cols)]
+                    for i in range(i_lo, i_hi + 1)
+                    for dj in range(n_cols)
+                    if (i, (j_lo + dj) % self._cols) in self._cells
+                ]
+            return [
+                dict(entry)
+                for entries in cells
+                for entry in entries.values()
+                if min_lat <= entry["lat"] <= max_lat
+                and _in_lon_range(entry["lon"], min_lon, max_lon)
+                and match(entry)
+            ]
+
+
+def get_geo_index() -> GeoIndex | None:
+    """Get the process-wide geo index, building it on first use.
+
+    Returns:
+        Shared GeoIndex, or None if the geo index is disabled.
+    """
+    global _index
+
+    if not settings.GEO_INDEX_ENABLED:
+        return None
+
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                index = GeoIndex(cell_deg=settings.GEO_INDEX_CELL_DEG)
+                # Listen before scrolling so no write falls between the two
+                get_incident_bus().add_listener(index.handle_event)
+                try:
+                    index.rebuild()
+                except Exception as e:
+                    _logger.warning(f"Geo index rebuild failed, starting empty: {e}")
+                _index = index
+
+    return _index
+
+
+def reset_geo_index() -> None:
+    """Empty the geo index after its collection was dropped (no-op if unbuilt)."""
+    if _index is not None:
+        _index.clear()
@@ -1,22 +1,85 @@
 """Hybrid semantic search for RESPOND."""
 
+import asyncio
+import threading
+import time
+
+import numpy as np
+
 from config.qdrant_config import SITUATION_REPORTS
+from config.settings import settings
 from src.embeddings.text_embedder import TextEmbedder
-from src.qdrant.searcher import search
-from src.search.filters import (
-    build_status_filter,
-    build_urgency_filter,
-    build_zone_filter,
-    build_time_filter,
-    build_geo_filter,
-    combine_filters,
+from src.qdrant.searcher import (
+    search,
+    search_async,
+    search_batch,
+    search_batch_async,
+    search_with_formula,
+    search_with_formula_async,
+)
+from src.qdrant.write_buffer import (
+    flush_payload_writes,
+    has_pending_payload_writes,
+    overlay_payload,
 )
-from src.memory.decay import apply_decay
+from src.search.filters import build_search_filter, build_widening_filter
+from src.memory.decay import apply_decay_batch, build_decay_formula, decay_horizon
+from src.search.result_cache import get_search_cache
 from src.evidence.tracer import extract_evidence
 from src.utils.logger import get_logger
 
 _logger = get_logger("search.hybrid")
 
+# Per-query search options accepted by the batch methods, in filter order
+FILTER_KEYS = ("zone_id", "urgency", "status", "last_hours", "center", "radius_km")
+
+# Widening rounds after the first one before a query gives up on proving
+# its decayed top-k final
+MAX_WIDEN_ROUNDS = 4
+
+# Process-wide over-fetch/rerank counters
+_rerank_stats = {
+    "queries": 0,
+    "widened_queries": 0,
+    "widen_rounds": 0,
+    "changed_queries": 0,
+    "unstable_queries": 0,
+    "candidates_fetched": 0,
+}
+_rerank_stats_lock = threading.Lock()
+
+
+def _hashable(value):
+    """Make a list-valued filter argument usable in a cache key."""
+    if isinstance(value, (list, tuple, set)):
+        return tuple(sorted(set(value)))
+    return value
+
+
+def _cache_zone(zone_id: str | list[str] | None) -> str | None:
+    """Zone a cached search is invalidated by (None = any write)."""
+    if isinstance(zone_id, (list, tuple, set)):
+        zones = set(zone_id)
+        return next(iter(zones)) if len(zones) == 1 else None
+    return zone_id
+
+
+def get_rerank_stats() -> dict:
+    """Get over-fetch/rerank statistics for client-side decayed searches.
+    
+    Returns:
+        Dict with counters plus changed_rate (share of queries whose top-k
+        differs from the raw-similarity top-k), widened_rate and
+        avg_candidates.
+    """
+    with _rerank_stats_lock:
+        stats = dict(_rerank_stats)
+    queries = stats["queries"]
+    stats["changed_rate"] = stats["changed_queries"] / queries if queries else 0.0
+    stats["widened_rate"] = stats["widened_queries"] / queries if queries else 0.0
+    stats["avg_candidates"] = stats["candidates_fetched"] / queries if queries else 0.0
+    return stats
+
 
 class HybridSearcher:
     """Hybrid semantic search with operational filters, time decay, and evidence."""
@@ -28,9 +91,9 @@ class HybridSearcher:
         self,
         query: str,
         limit: int = 10,
-        zone_id: str | None = None,
-        urgency: str | None = None,
-        status: str | None = None,
+        zone_id: str | list[str] | None = None,
+        urgency: str | list[str] | None = None,
+        status: str | list[str] | None = None,
         last_hours: int | None = None,
         center: dict | None = None,
         radius_km: float | None = None,
@@ -40,9 +103,9 @@ class HybridSearcher:
         Args:
             query: Search query text.
             limit: Maximum results to return.
-            zone_id: Filter by zone ID.
-            urgency: Filter by urgency level.
-            status: Filter by status.
+            zone_id: Filter by zone ID (or any of a list of zone IDs).
+            urgency: Filter by urgency level (or list of levels).
+            status: Filter by status (or list of statuses).
             last_hours: Filter to incidents within last N hours.
             center: Geo center point {"lat": float, "lon": float}.
             radius_km: Radius in kilometers for geo search.
@@ -54,43 +117,547 @@ class HybridSearcher:
         # Generate query embedding
         query_vector = self._embedder.embed_text(query)
         
-        # Build filters
-        filters = [
-            build_status_filter(status),
-            build_urgency_filter(urgency),
-            build_zone_filter(zone_id),
-            build_time_filter(last_hours),
-            build_geo_filter(center, radius_km),
+        # One reference time for the whole result page
+        now_unix = int(time.time())
+        
+        # Cached hits are re-decayed against the current time
+        filter_args = (zone_id, urgency, status, last_hours, center, radius_km)
+        cache, key, generation = self._cache_lookup(query_vector, limit, filter_args)
+        if key is not None:
+            hits = cache.get(key)
+            if hits is not None:
+                return self._rerank_cached(hits, now_unix, limit, last_hours)
+        
+        if self._needs_flush(filter_args):
+            flush_payload_writes()
+        qdrant_filter = self._build_filter(*filter_args)
+        formula = self._decay_formula(now_unix)
+        
+        # Ranked by decayed score on the server if enabled
+        if formula is not None:
+            results = search_with_formula(
+                collection=SITUATION_REPORTS,
+                query_vector=query_vector,
+                formula=formula,
+                limit=limit,
+                qdrant_filter=qdrant_filter,
+                prefetch_limit=settings.DECAY_PREFETCH_LIMIT,
+            )
+            reranked = self._rerank(results, now_unix, server_decayed=True)
+        else:
+            # Over-fetch by similarity, rerank by decay, widen while unstable
+            state = self._rerank_state(limit, qdrant_filter)
+            while True:
+                hits = search(
+                    collection=SITUATION_REPORTS,
+                    query_vector=query_vector,
+                    limit=state["request"],
+                    qdrant_filter=state["qdrant_filter"],
+                )
+                if not self._widen(state, hits, now_unix):
+                    break
+            results, reranked = state["results"], state["reranked"]
+            self._record_rerank(state)
+        
+        if key is not None:
+            cache.put(key, _cache_zone(zone_id), self._cacheable_hits(results, reranked, formula), generation)
+        
+        _logger.info(f"Search query='{query[:50]}...' returned {len(reranked)} results (reranked)")
+        return reranked
+
+    async def search_incidents_async(
+        self,
+        query: str,
+        limit: int = 10,
+        zone_id: str | list[str] | None = None,
+        urgency: str | list[str] | None = None,
+        status: str | list[str] | None = None,
+        last_hours: int | None = None,
+        center: dict | None = None,
+        radius_km: float | None = None,
+    ) -> list[dict]:
+        """Async variant of search_incidents() for use inside the event loop.
+        
+        The query is embedded on the bounded embedding executor and the
+        search goes through the async Qdrant client.
+        
+        Args:
+            query: Search query text.
+            limit: Maximum results to return.
+            zone_id: Filter by zone ID (or any of a list of zone IDs).
+            urgency: Filter by urgency level (or list of levels).
+            status: Filter by status (or list of statuses).
+            last_hours: Filter to incidents within last N hours.
+            center: Geo center point {"lat": float, "lon": float}.
+            radius_km: Radius in kilometers for geo search.
+        
+        Returns:
+            Same result dicts as search_incidents().
+        """
+        query_vector = await self._embedder.embed_text_async(query)
+        
+        now_unix = int(time.time())
+        
+        filter_args = (zone_id, urgency, status, last_hours, center, radius_km)
+        cache, key, generation = self._cache_lookup(query_vector, limit, filter_args)
+        if key is not None:
+            hits = cache.get(key)
+            if hits is not None:
+                return self._rerank_cached(hits, now_unix, limit, last_hours)
+        
+        if self._needs_flush(filter_args):
+            await asyncio.to_thread(flush_payload_writes)
+        qdrant_filter = self._build_filter(*filter_args)
+        formula = self._decay_formula(now_unix)
+        
+        if formula is not None:
+            results = await search_with_formula_async(
+                collection=SITUATION_REPORTS,
+                query_vector=query_vector,
+                formula=formula,
+                limit=limit,
+                qdrant_filter=qdrant_filter,
+                prefetch_limit=settings.DECAY_PREFETCH_LIMIT,
+            )
+            reranked = self._rerank(results, now_unix, server_decayed=True)
+        else:
+            state = self._rerank_state(limit, qdrant_filter)
+            while True:
+                hits = await search_async(
+                    collection=SITUATION_REPORTS,
+                    query_vector=query_vector,
+                    limit=state["request"],
+                    qdrant_filter=state["qdrant_filter"],
+                )
+                if not self._widen(state, hits, now_unix):
+                    break
+            results, reranked = state["results"], state["reranked"]
+            self._record_rerank(state)
+        
+        if key is not None:
+            cache.put(key, _cache_zone(zone_id), self._cacheable_hits(results, reranked, formula), generation)
+        
+        _logger.info(f"Async search query='{query[:50]}...' returned {len(reranked)} results (reranked)")
+        return reranked
+
+    def search_incidents_batch(self, queries: list[dict]) -> list[list[dict]]:
+        """Run several incident searches with one embedding pass.
+        
+        All query texts are embedded in a single batch, and the Qdrant
+        searches of each over-fetch/widening round go out as one batch
+        request, so N queries cost one embedding call and (usually) one
+        round trip.
+        
+        Args:
+            queries: Dicts with query and optional limit (default 10) and
+                the filters of search_incidents() (zone_id, urgency,
+                status, last_hours, center, radius_km).
+        
+        Returns:
+            One result list per query, in input order, with the same dicts
+            as search_incidents().
+        
+        Raises:
+            ValueError: If a query text is empty.
+        """
+        vectors = self._embedder.embed_texts([q["query"] for q in queries])
+        now_unix = int(time.time())
+        formula = self._decay_formula(now_unix)
+        if any(self._needs_flush(tuple(q.get(key) for key in FILTER_KEYS)) for q in queries):
+            flush_payload_writes()
+        
+        states, outputs = self._start_batch(queries, vectors, now_unix, formula)
+        pending = list(states)
+        while pending:
+            responses = search_batch(
+                SITUATION_REPORTS,
+                [self._batch_search_spec(state, formula) for state in pending],
+            )
+            pending = self._advance_batch(pending, responses, now_unix, formula)
+        self._finish_batch(states, outputs, formula)
+        
+        _logger.info(
+            f"Batch search ran {len(queries)} queries "
+            f"({len(queries) - len(states)} from cache)"
+        )
+        return outputs
+
+    async def search_incidents_batch_async(self, queries: list[dict]) -> list[list[dict]]:
+        """Async variant of search_incidents_batch().
+        
+        Args:
+            queries: Dicts with query and optional limit and filters.
+        
+        Returns:
+            One result list per query, in input order.
+        
+        Raises:
+            ValueError: If a query text is empty.
+        """
+        vectors = await self._embedder.embed_texts_async([q["query"] for q in queries])
+        now_unix = int(time.time())
+        formula = self._decay_formula(now_unix)
+        if any(self._needs_flush(tuple(q.get(key) for key in FILTER_KEYS)) for q in queries):
+            await asyncio.to_thread(flush_payload_writes)
+        
+        states, outputs = self._start_batch(queries, vectors, now_unix, formula)
+        pending = list(states)
+        while pending:
+            responses = await search_batch_async(
+                SITUATION_REPORTS,
+                [self._batch_search_spec(state, formula) for state in pending],
+            )
+            pending = self._advance_batch(pending, responses, now_unix, formula)
+        self._finish_batch(states, outputs, formula)
+        
+        _logger.info(
+            f"Async batch search ran {len(queries)} queries "
+            f"({len(queries) - len(states)} from cache)"
+        )
+        return outputs
+
+    def _start_batch(
+        self,
+        queries: list[dict],
+        vectors: list[list[float]],
+        now_unix: int,
+        formula,
+    ) -> tuple[list[dict], list[list[dict] | None]]:
+        """Serve cached queries and set up search state for the rest.
+        
+        Returns:
+            Tuple of (states of queries to search, outputs with cached
+            results filled in).
+        """
+        outputs: list[list[dict] | None] = [None] * len(queries)
+        states = []
+        for index, (query, vector) in enumerate(zip(queries, vectors)):
+            limit = query.get("limit", 10)
+            filter_args = tuple(query.get(key) for key in FILTER_KEYS)
+            
+            cache, key, generation = self._cache_lookup(vector, limit, filter_args)
+            if key is not None:
+                hits = cache.get(key)
+                if hits is not None:
+                    outputs[index] = self._rerank_cached(hits, now_unix, limit, filter_args[3])
+                    continue
+            
+            state = self._rerank_state(limit, self._build_filter(*filter_args))
+            if formula is not None:
+                state["request"] = limit
+            states.append({
+                **state,
+                "index": index,
+                "vector": vector,
+                "zone_id": _cache_zone(filter_args[0]),
+                "cache": cache,
+                "key": key,
+                "generation": generation,
+            })
+        return states, outputs
+
+    def _batch_search_spec(self, state: dict, formula) -> dict:
+        """Qdrant batch search spec for one pending query."""
+        return {
+            "query_vector": state["vector"],
+            "limit": state["request"],
+            "qdrant_filter": state["qdrant_filter"],
+            "formula": formula,
+            "prefetch_limit": settings.DECAY_PREFETCH_LIMIT,
+        }
+
+    def _advance_batch(
+        self,
+        pending: list[dict],
+        responses: list[list[dict]],
+        now_unix: int,
+        formula,
+    ) -> list[dict]:
+        """Rerank one round of batch results and widen unstable queries.
+        
+        Returns:
+            States that need another (wider) round.
+        """
+        still_pending = []
+        for state, results in zip(pending, responses):
+            if formula is not None:
+                state["results"] = results
+                state["reranked"] = self._rerank(results, now_unix, server_decayed=True)
+                continue
+            if self._widen(state, results, now_unix):
+                still_pending.append(state)
+        return still_pending
+
+    def _finish_batch(self, states: list[dict], outputs: list, formula) -> None:
+        """Fill outputs, record rerank stats and cache the searched queries."""
+        for state in states:
+            outputs[state["index"]] = state["reranked"]
+            if formula is None:
+                self._record_rerank(state)
+            if state["key"] is not None:
+                state["cache"].put(
+                    state["key"],
+                    state["zone_id"],
+                    self._cacheable_hits(state["results"], state["reranked"], formula),
+                    state["generation"],
+                )
+
+    def _needs_flush(self, filter_args: tuple) -> bool:
+        """Check whether buffered updates must reach Qdrant before searching.
+        
+        Internal callers may change status or urgency through the opt-in
+        payload write buffer; Qdrant evaluates filters on them against the
+        stored payload, so a search filtering on either flushes pending
+        updates first.
+        """
+        _, urgency, status = filter_args[:3]
+        return (status is not None or urgency is not None) and has_pending_payload_writes(
+            SITUATION_REPORTS
+        )
+
+    def _build_filter(
+        self,
+        zone_id: str | list[str] | None,
+        urgency: str | list[str] | None,
+        status: str | list[str] | None,
+        last_hours: int | None,
+        center: dict | None,
+        radius_km: float | None,
+    ):
+        """Get the (memoized) combined Qdrant filter for a search."""
+        return build_search_filter(
+            zone_id=zone_id,
+            urgency=urgency,
+            status=status,
+            last_hours=last_hours,
+            center=center,
+            radius_km=radius_km,
+        )
+
+    def _cache_lookup(self, query_vector: list[float], limit: int, filter_args: tuple):
+        """Resolve the result cache, key and invalidation generation.
+        
+        Returns:
+            Tuple of (cache, key, generation); key is None if caching is off.
+        """
+        cache = get_search_cache()
+        if cache is None:
+            return None, None, None
+        
+        zone_id, urgency, status, last_hours, center, radius_km = filter_args
+        params = (
+            _hashable(zone_id),
+            _hashable(urgency),
+            _hashable(status),
+            last_hours,
+            tuple(sorted(center.items())) if center else None,
+            radius_km,
+            settings.DECAY_CURVE,
+            settings.DECAY_SERVER_SIDE,
+        )
+        key = cache.make_key(query_vector, params, limit)
+        zone_key = _cache_zone(zone_id)
+        return cache, key, cache.generation(zone_key)
+
+    def _cacheable_hits(self, results: list[dict], reranked: list[dict], formula) -> list[dict]:
+        """Raw hits (undecayed similarity) to store in the result cache."""
+        if formula is None:
+            return results
+        # Server-decayed scores were converted back to similarity by _rerank
+        return [{"id": r["id"], "score": r["score"], "payload": r["payload"]} for r in reranked]
+
+    def _rerank_cached(
+        self,
+        hits: list[dict],
+        now_unix: int,
+        limit: int,
+        last_hours: int | None,
+    ) -> list[dict]:
+        """Rerank cached hits at the current time.
+        
+        Hits that aged out of the last_hours window since they were cached
+        are dropped.
+        """
+        if last_hours is not None:
+            cutoff = now_unix - last_hours * 3600
+            hits = [h for h in hits if h["payload"].get("timestamp_unix", now_unix) >= cutoff]
+        
+        reranked = self._rerank(hits, now_unix, limit=limit)
+        _logger.debug(f"Search served {len(reranked)} results from cache")
+        return reranked
+
+    def _decay_formula(self, now_unix: int):
+        """Server-side decay formula, or None to decay on the client."""
+        if not settings.DECAY_SERVER_SIDE:
+            return None
+        return build_decay_formula(now_unix)
+
+    def _initial_candidates(self, limit: int) -> int:
+        """Number of new candidates to fetch per round."""
+        candidates = limit * max(1, settings.SEARCH_CANDIDATE_MULTIPLIER)
+        return min(candidates, max(limit, settings.SEARCH_MAX_CANDIDATES))
+
+    def _rerank_state(self, limit: int, qdrant_filter) -> dict:
+        """Initial over-fetch/widening state for one client-side decayed query."""
+        candidates = self._initial_candidates(limit)
+        return {
+            "limit": limit,
+            "base_filter": qdrant_filter,
+            "qdrant_filter": qdrant_filter,
+            "candidates": candidates,
+            "request": candidates,
+            "since": None,
+            "results": [],
+            "seen": set(),
+            "reranked": [],
+            "fetched": 0,
+            "rounds": 0,
+            "stable": True,
+        }
+
+    def _widen(self, state: dict, hits: list[dict], now_unix: int) -> bool:
+        """Merge one round of hits and decide whether another round is needed.
+        
+        A round returns the best hits by similarity among the incidents its
+        filter admits, so every unfetched incident there scores at most the
+        round's lowest similarity. If the k-th decayed score reaches that
+        bound, the top-k is final. Otherwise only incidents young enough to
+        decay by less than kth / lowest can still enter it, and the next
+        round is restricted to them (decay_horizon()) and skips incidents
+        already fetched; incidents outside the window are bounded by the k-th
+        score of the round that excluded them.
+        Rounds stop without that proof when a widening round leaves the top-k
+        unchanged, or after MAX_WIDEN_ROUNDS.
+        
+        Args:
+            state: State from _rerank_state(), updated in place.
+            hits: Raw hits (by similarity) of the round.
+            now_unix: Reference time for the decay.
+        
+        Returns:
+            True if another round should run with state["request"] and
+            state["qdrant_filter"].
+        """
+        limit = state["limit"]
+        previous = [r["id"] for r in state["reranked"]]
+        new = [r for r in hits if r["id"] not in state["seen"]]
+        state["seen"].update(r["id"] for r in new)
+        state["results"].extend(new)
+        state["fetched"] += len(hits)
+        state["reranked"] = self._rerank(state["results"], now_unix, limit=limit)
+        
+        # The round's filter admits fewer incidents than requested: all fetched
+        if len(hits) < state["request"] or len(state["reranked"]) < limit:
+            state["stable"] = True
+            return False
+        
+        kth = state["reranked"][limit - 1]["final_score"]
+        lowest = min(r["score"] for r in hits)
+        # A negative similarity can only rise towards zero when decayed
+        if kth >= max(lowest, 0.0):
+            state["stable"] = True
+            return False
+        
+        if state["rounds"] and [r["id"] for r in state["reranked"]] == previous:
+            state["stable"] = False
+            return False
+        if state["rounds"] >= MAX_WIDEN_ROUNDS:
+            state["stable"] = False
+            return False
+        
+        horizon = decay_horizon(kth / lowest) if kth > 0 else None
+        if horizon is not None:
+            since = now_unix - horizon
+            state["since"] = since if state["since"] is None else max(since, state["since"])
+        
+        # Only incidents in the window that were not fetched yet
+        in_window = [
+            r["id"] for r in state["results"]
+            if state["since"] is None
+            or r["payload"].get("timestamp_unix") is None
+            or r["payload"]["timestamp_unix"] >= state["since"]
         ]
-        combined_filter = combine_filters(filters)
-        
-        # Execute search
-        results = search(
-            collection=SITUATION_REPORTS,
-            query_vector=query_vector,
-            limit=limit,
-            qdrant_filter=combined_filter,
+        state["qdrant_filter"] = build_widening_filter(
+            state["base_filter"], state["since"], in_window
+        )
+        state["request"] = state["candidates"]
+        state["rounds"] += 1
+        return True
+
+    def _record_rerank(self, state: dict) -> None:
+        """Update rerank statistics for one client-side decayed query."""
+        limit = state["limit"]
+        raw_top = {str(r["id"]) for r in state["results"][:limit]}
+        final_top = {str(r["id"]) for r in state["reranked"]}
+        
+        with _rerank_stats_lock:
+            _rerank_stats["queries"] += 1
+            _rerank_stats["candidates_fetched"] += state["fetched"]
+            _rerank_stats["widen_rounds"] += state["rounds"]
+            if state["rounds"]:
+                _rerank_stats["widened_queries"] += 1
+            if raw_top != final_top:
+                _rerank_stats["changed_queries"] += 1
+            if not state["stable"]:
+                _rerank_stats["unstable_queries"] += 1
+
+    def _rerank(
+        self,
+        results: list[dict],
+        now_unix: int | None = None,
+        server_decayed: bool = False,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """Apply decay, extract evidence, and sort by final score.
+        
+        Args:
+            results: Raw search hits with id, score, and payload.
+            now_unix: Reference time for the decay (defaults to now).
+            server_decayed: Hit scores are already decayed by Qdrant; the
+                raw similarity is recovered by dividing out the decay factor.
+            limit: Keep only the top `limit` after reranking (evidence is
+                only extracted for those).
+        
+        Returns:
+            Reranked result dicts.
+        """
+        if not results:
+            return []
+        
+        payloads = [r["payload"] for r in results]
+        scores = np.array([r["score"] for r in results], dtype=np.float64)
+        decayed = apply_decay_batch(
+            scores,
+            [p.get("timestamp_unix") for p in payloads],
+            [p.get("urgency") for p in payloads],
+            now_unix,
         )
+        factors = decayed["decay_factors"]
+        
+        if server_decayed:
+            final_scores = scores
+            scores = np.divide(scores, factors, out=scores.copy(), where=factors > 0)
+        else:
+            final_scores = decayed["final_scores"]
+        
+        # Sort by final_score descending
+        order = np.argsort(-final_scores, kind="stable")
+        if limit is not None:
+            order = order[:limit]
         
-        # Apply decay, extract evidence, and rerank
         reranked = []
-        for r in results:
-            timestamp_unix = r["payload"].get("timestamp_unix")
-            decay_info = apply_decay(r["score"], timestamp_unix)
-            evidence = extract_evidence(r["payload"])
-            
+        for i in order:
+            r = results[i]
+            # Include this process's buffered (not yet flushed) updates
+            payload = overlay_payload(SITUATION_REPORTS, r["id"], r["payload"])
             reranked.append({
                 "id": r["id"],
-                "score": r["score"],
-                "payload": r["payload"],
-                "final_score": decay_info["final_score"],
-                "decay_factor": decay_info["decay_factor"],
-                "age_seconds": decay_info["age_seconds"],
-                "evidence": evidence,
+                "score": float(scores[i]),
+                "payload": payload,
+                "final_score": float(final_scores[i]),
+                "decay_factor": float(factors[i]),
+                "age_seconds": int(decayed["age_seconds"][i]),
+                "evidence": extract_evidence(payload),
             })
         
-        # Sort by final_score descending
-        reranked.sort(key=lambda x: x["final_score"], reverse=True)
-        
-        _logger.info(f"Search query='{query[:50]}...' returned {len(reranked)} results (reranked)")
         return reranked
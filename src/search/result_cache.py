@@ -0,0 +1,201 @@
+"""Search result cache for RESPOND.
+
+Caches the raw hits (id, similarity, payload) of incident searches keyed by
+(query embedding, filters, limit) for a short TTL. Decay and evidence are
+recomputed from the cached hits on every read, so ages stay correct.
+
+Writes invalidate selectively: a write to zone Z drops entries filtered on
+Z and entries without a zone filter. The cache is per process; the TTL
+bounds staleness across workers.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from config.settings import settings
+from src.utils.logger import get_logger
+
+_logger = get_logger("search.result_cache")
+
+_cache: "SearchResultCache | None" = None
+_cache_lock = threading.Lock()
+
+
+class SearchResultCache:
+    """TTL + LRU cache of raw search hits with zone-based invalidation."""
+
+    def __init__(self, ttl_seconds: float = 5.0, max_entries: int = 1024):
+        self._ttl = ttl_seconds
+        self._max_entries = max(1, max_entries)
+        # key -> (expires_at, zone_id, hits)
+        self._entries: OrderedDict[bytes, tuple[float, str | None, list[dict]]] = OrderedDict()
+        self._zone_keys: dict[str | None, set[bytes]] = {}
+        self._generation = 0
+        self._zone_generations: dict[str | None, int] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "invalidated": 0, "stale_puts": 0}
+
+    @staticmethod
+    def make_key(query_vector: list[float], params: tuple, limit: int) -> bytes:
+        """Build a cache key.
+
+        Args:
+            query_vector: Query embedding.
+            params: Hashable tuple of every filter/ranking parameter.
+            limit: Requested result count.
+
+        Returns:
+            Digest identifying the search.
+        """
+        digest = hashlib.sha256(np.asarray(query_vector, dtype=np.float32).tobytes())
+        digest.update(repr((params, limit)).encode())
+        return digest.digest()
+
+    def generation(self, zone_id: str | None) -> tuple[int, int]:
+        """Invalidation generation seen by a search about to run.
+
+        Pass the result to put() so hits computed before a concurrent write
+        are not cached after that write invalidated the zone.
+        """
+        with self._lock:
+            return self._generation, self._zone_generations.get(zone_id, 0)
+
+    def get(self, key: bytes) -> list[dict] | None:
+        """Look up cached hits.
+
+        Args:
+            key: Key from make_key().
+
+        Returns:
+            Raw hits, or None on a miss or expired entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+
+            expires_at, zone_id, hits = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return hits
+
+    def put(
+        self,
+        key: bytes,
+        zone_id: str | None,
+        hits: list[dict],
+        generation: tuple[int, int],
+    ) -> None:
+        """Store raw hits unless the zone was invalidated since `generation`.
+
+        Args:
+            key: Key from make_key().
+            zone_id: Zone filter of the search (None = all zones).
+            hits: Raw hits with id, score, and payload.
+            generation: Value of generation() taken before the search.
+        """
+        with self._lock:
+            current = (self._generation, self._zone_generations.get(zone_id, 0))
+            if current != generation:
+                self._stats["stale_puts"] += 1
+                return
+
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self._ttl, zone_id, hits)
+            self._zone_keys.setdefault(zone_id, set()).add(key)
+
+            while len(self._entries) > self._max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_zone(self, zone_id: str | None) -> None:
+        """Drop entries that a write to `zone_id` may affect.
+
+        Args:
+            zone_id: Zone of the written incident (None = unknown, drops all).
+        """
+        if zone_id is None:
+            self.invalidate_all()
+            return
+
+        with self._lock:
+            for zone in (zone_id, None):
+                self._zone_generations[zone] = self._zone_generations.get(zone, 0) + 1
+                for key in list(self._zone_keys.get(zone, ())):
+                    self._remove(key)
+                    self._stats["invalidated"] += 1
+
+    def invalidate_all(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._generation += 1
+            self._stats["invalidated"] += len(self._entries)
+            self._entries.clear()
+            self._zone_keys.clear()
+
+    def stats(self) -> dict:
+        """Get cache statistics.
+
+        Returns:
+            Dict with hits, misses, expired, invalidated, stale_puts, size
+            and hit_rate.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def _remove(self, key: bytes) -> None:
+        """Remove one entry (caller holds the lock)."""
+        _, zone_id, _ = self._entries.pop(key)
+        keys = self._zone_keys.get(zone_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._zone_keys[zone_id]
+
+
+def get_search_cache() -> SearchResultCache | None:
+    """Get the process-wide search result cache.
+
+    Returns:
+        Shared SearchResultCache, or None if caching is disabled.
+    """
+    global _cache
+
+    if not settings.SEARCH_CACHE_ENABLED:
+        return None
+
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = SearchResultCache(
+                    ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS,
+                    max_entries=settings.SEARCH_CACHE_MAX_ENTRIES,
+                )
+
+    return _cache
+
+
+def invalidate_search_cache(zone_id: str | None = None) -> None:
+    """Invalidate cached searches affected by a write.
+
+    Args:
+        zone_id: Zone of the written incident (None = unknown, drops all).
+    """
+    cache = get_search_cache()
+    if cache is not None:
+        cache.invalidate_zone(zone_id)
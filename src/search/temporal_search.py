@@ -0,0 +1,568 @@
+"""Temporal search for RESPOND.
+
+An in-memory index of incidents bucketed by report time, per zone and
+urgency, answers windowed counts ("incidents per 5 minutes in zone X over
+the last 6 hours"), surge detection and "what changed since T" without
+scanning the collection.
+
+Like the geo index, it is built once from a payload-only scroll of
+situation reports, kept in sync through the incident bus, and per process.
+Buckets and change records older than the retention window are pruned.
+"""
+
+import bisect
+import threading
+import time
+from collections import deque
+from itertools import islice
+
+from config.qdrant_config import SITUATION_REPORTS
+from config.settings import settings
+from src.qdrant.points import scroll_all
+from src.stream.bus import INCIDENT_CREATED, get_incident_bus
+from src.utils.logger import get_logger
+
+_logger = get_logger("search.temporal_search")
+
+# Payload fields kept per indexed incident
+INDEXED_FIELDS = ["zone_id", "urgency", "status", "timestamp_unix"]
+
+_index: "TemporalIndex | None" = None
+_index_lock = threading.Lock()
+
+
+class TemporalIndex:
+    """Time-bucketed incident counters and ID lists per (zone, urgency).
+
+    Each series maps bucket number (timestamp_unix // bucket_seconds) to the
+    set of incident ids reported in that bucket. A change journal records
+    every write seen on the bus, in arrival order, for changes_since(); it
+    keeps at most max_changes records, dropping the oldest.
+    """
+
+    def __init__(
+        self,
+        bucket_seconds: int = 60,
+        retention_hours: float = 48.0,
+        max_changes: int = 100_000,
+    ):
+        if bucket_seconds < 1:
+            raise ValueError("bucket_seconds must be at least 1")
+        if max_changes < 1:
+            raise ValueError("max_changes must be at least 1")
+        self._bucket_seconds = bucket_seconds
+        self._retention_seconds = retention_hours * 3600
+        # (zone_id, urgency) -> bucket -> incident ids
+        self._series: dict[tuple[str | None, str | None], dict[int, set[str]]] = {}
+        # incident id -> {zone_id, urgency, status, timestamp_unix, bucket}
+        self._incidents: dict[str, dict] = {}
+        # Change journal: parallel deques ordered by recorded time
+        self._change_times: deque[float] = deque()
+        self._changes: deque[dict] = deque()
+        self._max_changes = max_changes
+        # Time of the newest record dropped to stay within max_changes
+        self._trimmed_through: float | None = None
+        self._lock = threading.RLock()
+        self._touched: set[str] | None = None
+        self._built_at: float | None = None
+        self._pruned_at = 0.0
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def upsert(self, incident_id: str, payload: dict) -> None:
+        """Insert or re-bucket an incident.
+
+        Args:
+            incident_id: Incident ID.
+            payload: Incident payload (zone_id, urgency, status, timestamp_unix).
+        """
+        with self._lock:
+            if self._touched is not None:
+                self._touched.add(incident_id)
+            self._place(incident_id, payload)
+            self._maybe_prune()
+
+    def update(self, incident_id: str, changes: dict) -> None:
+        """Apply payload changes to an indexed incident.
+
+        Args:
+            incident_id: Incident ID.
+            changes: Changed payload fields.
+        """
+        with self._lock:
+            if self._touched is not None:
+                self._touched.add(incident_id)
+            meta = self._incidents.get(incident_id)
+            if meta is None:
+                return
+            if any(key in changes for key in ("zone_id", "urgency", "timestamp_unix")):
+                self._place(incident_id, {**meta, **changes})
+            elif "status" in changes:
+                meta["status"] = changes["status"]
+
+    def clear(self) -> None:
+        """Drop every incident and change record."""
+        with self._lock:
+            self._series.clear()
+            self._incidents.clear()
+            self._change_times.clear()
+            self._changes.clear()
+            self._trimmed_through = None
+
+    def handle_event(self, event: dict) -> None:
+        """Incident bus listener keeping the index and journal in sync."""
+        incident_id = event.get("incident_id")
+        if incident_id is None:
+            return
+
+        with self._lock:
+            if event["type"] == INCIDENT_CREATED and event.get("payload"):
+                self.upsert(incident_id, event["payload"])
+            elif event["type"].startswith("incident.") and event.get("changes"):
+                self.update(incident_id, event["changes"])
+
+            meta = self._incidents.get(incident_id) or {}
+            self._record_change(
+                event["timestamp"],
+                {
+                    "incident_id": incident_id,
+                    "type": event["type"],
+                    "zone_id": event.get("zone_id") or meta.get("zone_id"),
+                    "urgency": meta.get("urgency"),
+                    "fields": sorted((event.get("changes") or {}).keys()),
+                    "event_id": event.get("event_id"),
+                },
+            )
+
+    def rebuild(self) -> int:
+        """Reload the index from the situation reports collection.
+
+        The change journal is seeded with a creation record per incident in
+        the retention window; incidents written through the bus while the
+        scroll runs keep their newer state.
+
+        Returns:
+            Number of indexed incidents.
+        """
+        started = time.perf_counter()
+        with self._lock:
+            self._touched = set()
+        try:
+            cutoff = time.time() - self._retention_seconds
+            records = list(scroll_all(SITUATION_REPORTS, with_payload=INDEXED_FIELDS))
+        except Exception:
+            with self._lock:
+                self._touched = None
+            raise
+
+        with self._lock:
+            touched = self._touched
+            self._touched = None
+            kept = {
+                incident_id: self._incidents[incident_id]
+                for incident_id in touched
+                if incident_id in self._incidents
+            }
+            journal = [
+                (time_, change) for time_, change in zip(self._change_times, self._changes)
+            ]
+            self.clear()
+
+            seeded = []
+            for record in records:
+                payload = record["payload"] or {}
+                if record["id"] in touched or (payload.get("timestamp_unix") or 0) < cutoff:
+                    continue
+                self._place(record["id"], payload)
+                seeded.append((
+                    float(payload["timestamp_unix"]),
+                    {
+                        "incident_id": record["id"],
+                        "type": INCIDENT_CREATED,
+                        "zone_id": payload.get("zone_id"),
+                        "urgency": payload.get("urgency"),
+                        "fields": [],
+                        "event_id": None,
+                    },
+                ))
+            for incident_id, meta in kept.items():
+                self._place(incident_id, meta)
+
+            for time_, change in sorted(seeded + journal, key=lambda item: item[0]):
+                self._record_change(time_, change)
+
+            self._built_at = time.time()
+            count = len(self._incidents)
+
+        _logger.info(
+            f"Temporal index rebuilt: {count} incidents in "
+            f"{(time.perf_counter() - started) * 1000:.1f}ms"
+        )
+        return count
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def histogram(
+        self,
+        interval_seconds: int = 300,
+        last_hours: float = 6.0,
+        zone_id: str | None = None,
+        urgency: str | None = None,
+        status: str | None = None,
+        end_unix: float | None = None,
+    ) -> dict:
+        """Count incidents per time interval.
+
+        Args:
+            interval_seconds: Interval width (rounded up to a multiple of the
+                bucket size).
+            last_hours: Window length ending at `end_unix`.
+            zone_id: Filter by zone ID.
+            urgency: Filter by urgency level.
+            status: Filter by current status.
+            end_unix: Window end (defaults to now).
+
+        Returns:
+            Dict with interval_seconds, total and intervals (start, end,
+            count, by_urgency), oldest first.
+
+        Raises:
+            ValueError: If the interval or window is invalid.
+        """
+        if interval_seconds < 1 or last_hours <= 0:
+            raise ValueError("interval_seconds and last_hours must be positive")
+
+        per_interval = max(1, -(-interval_seconds // self._bucket_seconds))
+        interval = per_interval * self._bucket_seconds
+        end = end_unix if end_unix is not None else time.time()
+        last_interval = int(end // interval)
+        first_interval = int((end - last_hours * 3600) // interval)
+        n_intervals = last_interval - first_interval + 1
+        if n_intervals > 10000:
+            raise ValueError("Too many intervals; increase interval_seconds")
+
+        counts = [0] * n_intervals
+        by_urgency = [{} for _ in range(n_intervals)]
+        first_bucket = first_interval * per_interval
+        last_bucket = (last_interval + 1) * per_interval - 1
+
+        with self._lock:
+            for (series_zone, series_urgency), buckets in self._series.items():
+                if zone_id is not None and series_zone != zone_id:
+                    continue
+                if urgency is not None and series_urgency != urgency:
+                    continue
+                for bucket, ids in self._buckets_in_range(buckets, first_bucket, last_bucket):
+                    if status is not None:
+                        count = sum(1 for i in ids if self._incidents[i]["status"] == status)
+                    else:
+                        count = len(ids)
+                    if not count:
+                        continue
+                    slot = bucket // per_interval - first_interval
+                    counts[slot] += count
+                    key = series_urgency or "unknown"
+                    by_urgency[slot][key] = by_urgency[slot].get(key, 0) + count
+
+        intervals = [
+            {
+                "start": (first_interval + slot) * interval,
+                "end": (first_interval + slot + 1) * interval,
+                "count": counts[slot],
+                "by_urgency": by_urgency[slot],
+            }
+            for slot in range(n_intervals)
+        ]
+        return {"interval_seconds": interval, "total": sum(counts), "intervals": intervals}
+
+    def incident_ids(
+        self,
+        start_unix: float,
+        end_unix: float | None = None,
+        zone_id: str | None = None,
+        urgency: str | None = None,
+        status: str | None = None,
+        limit: int = 1000,
+    ) -> list[str]:
+        """List incidents reported in a time window, newest first.
+
+        Args:
+            start_unix: Window start.
+            end_unix: Window end (defaults to now).
+            zone_id: Filter by zone ID.
+            urgency: Filter by urgency level.
+            status: Filter by current status.
+            limit: Maximum number of ids.
+
+        Returns:
+            Incident ids.
+        """
+        end = end_unix if end_unix is not None else time.time()
+        first_bucket = int(start_unix // self._bucket_seconds)
+        last_bucket = int(end // self._bucket_seconds)
+
+        matches = []
+        with self._lock:
+            for (series_zone, series_urgency), buckets in self._series.items():
+                if zone_id is not None and series_zone != zone_id:
+                    continue
+                if urgency is not None and series_urgency != urgency:
+                    continue
+                for _, ids in self._buckets_in_range(buckets, first_bucket, last_bucket):
+                    for incident_id in ids:
+                        meta = self._incidents[incident_id]
+                        if status is not None and meta["status"] != status:
+                            continue
+                        if start_unix <= meta["timestamp_unix"] <= end:
+                            matches.append((meta["timestamp_unix"], incident_id))
+
+        matches.sort(reverse=True)
+        return [incident_id for _, incident_id in matches[:limit]]
+
+    def changes_since(
+        self,
+        since_unix: float,
+        zone_id: str | None = None,
+        urgency: str | None = None,
+        limit: int = 500,
+    ) -> dict:
+        """List writes recorded after a point in time, oldest first.
+
+        Poll with the returned `next_since` to read changes incrementally.
+
+        Args:
+            since_unix: Only changes recorded strictly after this time.
+            zone_id: Filter by zone ID.
+            urgency: Filter by urgency level.
+            limit: Maximum number of changes.
+
+        Returns:
+            Dict with changes (incident_id, type, zone_id, urgency, fields,
+            event_id, at), next_since, truncated, and complete (False if
+            `since_unix` is older than the journal, or records after it were
+            dropped to keep the journal within its size cap).
+        """
+        with self._lock:
+            start = bisect.bisect_right(self._change_times, since_unix)
+            complete = not self._change_times or since_unix >= self._change_times[0] or (
+                since_unix >= time.time() - self._retention_seconds
+            )
+            if self._trimmed_through is not None and since_unix < self._trimmed_through:
+                complete = False
+            changes = []
+            truncated = False
+            next_since = since_unix
+            # Deque indexing is O(n), so walk the tail with one iterator
+            for at, change in islice(zip(self._change_times, self._changes), start, None):
+                if zone_id is not None and change["zone_id"] != zone_id:
+                    continue
+                if urgency is not None and change["urgency"] != urgency:
+                    continue
+                if len(changes) >= limit:
+                    truncated = True
+                    break
+                changes.append({**change, "at": at})
+                next_since = at
+            if not truncated and self._change_times:
+                next_since = max(next_since, self._change_times[-1])
+
+        return {
+            "changes": changes,
+            "next_since": next_since,
+            "truncated": truncated,
+            "complete": complete,
+        }
+
+    def surges(
+        self,
+        window_minutes: float = 30.0,
+        baseline_hours: float = 6.0,
+        min_count: int = 3,
+        min_ratio: float = 2.0,
+        urgency: str | None = None,
+    ) -> list[dict]:
+        """Find zones whose recent report rate is well above their baseline.
+
+        Args:
+            window_minutes: Recent window.
+            baseline_hours: Baseline window preceding the recent one.
+            min_count: Minimum incidents in the recent window.
+            min_ratio: Minimum recent/baseline rate ratio.
+            urgency: Only count this urgency level.
+
+        Returns:
+            Zones sorted by ratio (descending), each with zone_id,
+            recent_count, baseline_count, recent_rate_per_hour,
+            baseline_rate_per_hour and ratio (None if the baseline is empty).
+        """
+        now = time.time()
+        window = window_minutes * 60
+        baseline = baseline_hours * 3600
+        recent_first = int((now - window) // self._bucket_seconds)
+        baseline_first = int((now - window - baseline) // self._bucket_seconds)
+        last_bucket = int(now // self._bucket_seconds)
+
+        recent: dict[str | None, int] = {}
+        base: dict[str | None, int] = {}
+        with self._lock:
+            for (series_zone, series_urgency), buckets in self._series.items():
+                if urgency is not None and series_urgency != urgency:
+                    continue
+                for bucket, ids in self._buckets_in_range(buckets, baseline_first, last_bucket):
+                    target = recent if bucket >= recent_first else base
+                    target[series_zone] = target.get(series_zone, 0) + len(ids)
+
+        results = []
+        for zone, recent_count in recent.items():
+            if recent_count < min_count:
+                continue
+            recent_rate = recent_count / (window / 3600)
+            baseline_count = base.get(zone, 0)
+            baseline_rate = baseline_count / baseline_hours
+            ratio = recent_rate / baseline_rate if baseline_rate else None
+            if ratio is not None and ratio < min_ratio:
+                continue
+            results.append({
+                "zone_id": zone,
+                "recent_count": recent_count,
+                "baseline_count": baseline_count,
+                "recent_rate_per_hour": round(recent_rate, 3),
+                "baseline_rate_per_hour": round(baseline_rate, 3),
+                "ratio": round(ratio, 3) if ratio is not None else None,
+            })
+
+        results.sort(key=lambda r: (r["ratio"] is None, r["ratio"] or 0), reverse=True)
+        return results
+
+    def stats(self) -> dict:
+        """Get index statistics.
+
+        Returns:
+            Dict with incidents, series, buckets, journal size, bucket_seconds
+            and built_at.
+        """
+        with self._lock:
+            return {
+                "incidents": len(self._incidents),
+                "series": len(self._series),
+                "buckets": sum(len(buckets) for buckets in self._series.values()),
+                "changes": len(self._changes),
+                "bucket_seconds": self._bucket_seconds,
+                "built_at": self._built_at,
+            }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _place(self, incident_id: str, payload: dict) -> None:
+        """Store or move an incident (caller holds the lock)."""
+        self._remove(incident_id)
+        timestamp_unix = payload.get("timestamp_unix")
+        if timestamp_unix is None:
+            return
+        bucket = int(timestamp_unix // self._bucket_seconds)
+        meta = {
+            "zone_id": payload.get("zone_id"),
+            "urgency": payload.get("urgency"),
+            "status": payload.get("status"),
+            "timestamp_unix": timestamp_unix,
+            "bucket": bucket,
+        }
+        series = self._series.setdefault((meta["zone_id"], meta["urgency"]), {})
+        series.setdefault(bucket, set()).add(incident_id)
+        self._incidents[incident_id] = meta
+
+    def _remove(self, incident_id: str) -> None:
+        """Remove an incident if present (caller holds the lock)."""
+        meta = self._incidents.pop(incident_id, None)
+        if meta is None:
+            return
+        key = (meta["zone_id"], meta["urgency"])
+        buckets = self._series[key]
+        ids = buckets[meta["bucket"]]
+        ids.discard(incident_id)
+        if not ids:
+            del buckets[meta["bucket"]]
+            if not buckets:
+                del self._series[key]
+
+    def _record_change(self, at: float, change: dict) -> None:
+        """Append to the journal, keeping it ordered and capped (caller holds the lock)."""
+        if self._change_times and at < self._change_times[-1]:
+            at = self._change_times[-1]
+        self._change_times.append(at)
+        self._changes.append(change)
+        while len(self._changes) > self._max_changes:
+            self._trimmed_through = self._change_times.popleft()
+            self._changes.popleft()
+
+    def _buckets_in_range(self, buckets: dict[int, set[str]], first: int, last: int):
+        """Non-empty (bucket, ids) pairs of a series within [first, last]."""
+        if last - first + 1 <= len(buckets):
+            for bucket in range(first, last + 1):
+                ids = buckets.get(bucket)
+                if ids:
+                    yield bucket, ids
+        else:
+            for bucket, ids in buckets.items():
+                if first <= bucket <= last:
+                    yield bucket, ids
+
+    def _maybe_prune(self) -> None:
+        """Drop buckets and journal records past retention (caller holds the lock)."""
+        now = time.time()
+        if now - self._pruned_at < self._bucket_seconds:
+            return
+        self._pruned_at = now
+        cutoff = now - self._retention_seconds
+
+        cutoff_bucket = int(cutoff // self._bucket_seconds)
+        for buckets in list(self._series.values()):
+            for bucket in [b for b in buckets if b < cutoff_bucket]:
+                for incident_id in list(buckets[bucket]):
+                    self._remove(incident_id)
+
+        while self._change_times and self._change_times[0] < cutoff:
+            self._change_times.popleft()
+            self._changes.popleft()
+
+
+def get_temporal_index() -> TemporalIndex | None:
+    """Get the process-wide temporal index, building it on first use.
+
+    Returns:
+        Shared TemporalIndex, or None if the temporal index is disabled.
+    """
+    global _index
+
+    if not settings.TEMPORAL_INDEX_ENABLED:
+        return None
+
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                index = TemporalIndex(
+                    bucket_seconds=settings.TEMPORAL_BUCKET_SECONDS,
+                    retention_hours=settings.TEMPORAL_RETENTION_HOURS,
+                    max_changes=settings.TEMPORAL_JOURNAL_MAX_ENTRIES,
+                )
+                # Listen before scrolling so no write falls between the two
+                get_incident_bus().add_listener(index.handle_event)
+                try:
+                    index.rebuild()
+                except Exception as e:
+                    _logger.warning(f"Temporal index rebuild failed, starting empty: {e}")
+                _index = index
+
+    return _index
+
+
+def reset_temporal_index() -> None:
+    """Empty the temporal index after its collection was dropped (no-op if unbuilt)."""
+    if _index is not None:
+        _index.clear()
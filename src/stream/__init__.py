@@ -0,0 +1,17 @@
+"""RESPOND Stream Package."""
+
+from src.stream.bus import (
+    IncidentBus,
+    Subscription,
+    get_incident_bus,
+    publish_incident_event,
+)
+from src.stream.filters import StreamFilter
+
+__all__ = [
+    "IncidentBus",
+    "Subscription",
+    "get_incident_bus",
+    "publish_incident_event",
+    "StreamFilter",
+]
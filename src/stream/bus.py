@@ -0,0 +1,251 @@
+"""In-process pub/sub bus for live incident updates in RESPOND.
+
+Writers (ingesters, memory manager, event manager) publish small change
+events from any thread. Consumers either register a synchronous listener
+(called inline in the publishing thread) or subscribe with an asyncio
+queue (delivered on the subscriber's event loop). A bounded replay buffer
+lets reconnecting SSE clients resume from the last event id they saw.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Callable
+
+from config.settings import settings
+from src.utils.logger import get_logger
+
+_logger = get_logger("stream.bus")
+
+# Event types
+INCIDENT_CREATED = "incident.created"
+INCIDENT_REINFORCED = "incident.reinforced"
+INCIDENT_STATUS = "incident.status"
+INCIDENT_UPDATED = "incident.updated"
+EVENT_CREATED = "event.created"
+EVENT_ASSIGNED = "event.assigned"
+
+_bus: "IncidentBus | None" = None
+_bus_lock = threading.Lock()
+
+
+class Subscription:
+    """Async subscription: a bounded queue fed on the subscriber's loop.
+
+    `predicate` runs on the subscriber's loop, so it may keep state without
+    locking. If the queue fills up, events are dropped and `overflowed` is
+    set so the consumer can tell its client to resync.
+    """
+
+    def __init__(
+        self,
+        bus: "IncidentBus",
+        loop: asyncio.AbstractEventLoop,
+        predicate: Callable[[dict], bool] | None,
+        maxsize: int,
+    ):
+        self._bus = bus
+        self._loop = loop
+        self._predicate = predicate
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.overflowed = False
+        self.dropped = 0
+
+    def offer(self, event: dict) -> None:
+        """Filter and enqueue an event (called on the subscriber's loop)."""
+        if self._predicate is not None and not self._predicate(event):
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            self.dropped += 1
+
+    def deliver_threadsafe(self, event: dict) -> bool:
+        """Schedule offer() on the subscriber's loop.
+
+        Returns:
+            False if the loop is closed (the subscription is dead).
+        """
+        try:
+            self._loop.call_soon_threadsafe(self.offer, event)
+        except RuntimeError:
+            return False
+        return True
+
+    async def get(self, timeout: float | None = None) -> dict | None:
+        """Wait for the next event.
+
+        Args:
+            timeout: Seconds to wait (None = forever).
+
+        Returns:
+            Event dict, or None on timeout.
+        """
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        """Stop receiving events."""
+        self._bus.unsubscribe(self)
+
+
+class IncidentBus:
+    """Thread-safe publish/subscribe hub for incident change events."""
+
+    def __init__(self, replay_size: int = 1000):
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._replay: deque[dict] = deque(maxlen=max(0, replay_size))
+        self._listeners: list[Callable[[dict], None]] = []
+        self._subscriptions: set[Subscription] = set()
+
+    def publish(
+        self,
+        event_type: str,
+        incident_id: str | None = None,
+        zone_id: str | None = None,
+        payload: dict | None = None,
+        changes: dict | None = None,
+        vector: list[float] | None = None,
+        **extra,
+    ) -> dict:
+        """Publish a change event to all listeners and subscribers.
+
+        Args:
+            event_type: One of the event type constants.
+            incident_id: Affected incident.
+            zone_id: Zone of the incident.
+            payload: Full current payload, if known.
+            changes: Fields changed by this write.
+            vector: Incident embedding (for semantic subscriptions; never
+                sent to clients).
+            **extra: Additional fields (e.g. event_id).
+
+        Returns:
+            The published event.
+        """
+        with self._lock:
+            self._seq += 1
+            event = {
+                "id": self._seq,
+                "type": event_type,
+                "incident_id": incident_id,
+                "zone_id": zone_id,
+                "payload": payload,
+                "changes": changes,
+                "vector": vector,
+                "timestamp": time.time(),
+                **extra,
+            }
+            self._replay.append(event)
+            listeners = list(self._listeners)
+            subscriptions = list(self._subscriptions)
+
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                _logger.error(f"Bus listener failed on {event_type}: {e}")
+
+        dead = [sub for sub in subscriptions if not sub.deliver_threadsafe(event)]
+        for sub in dead:
+            self.unsubscribe(sub)
+
+        return event
+
+    def add_listener(self, listener: Callable[[dict], None]) -> None:
+        """Register a synchronous listener, called in the publishing thread."""
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[dict], None]) -> None:
+        """Unregister a synchronous listener."""
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def subscribe(
+        self,
+        predicate: Callable[[dict], bool] | None = None,
+        maxsize: int | None = None,
+        last_event_id: int | None = None,
+    ) -> Subscription:
+        """Subscribe from inside a running event loop.
+
+        Args:
+            predicate: Optional filter, run on the subscriber's loop.
+            maxsize: Queue size (defaults to STREAM_QUEUE_SIZE).
+            last_event_id: Replay buffered events after this id first.
+
+        Returns:
+            Subscription to read events from.
+        """
+        sub = Subscription(
+            self,
+            asyncio.get_running_loop(),
+            predicate,
+            maxsize or settings.STREAM_QUEUE_SIZE,
+        )
+        with self._lock:
+            if last_event_id is not None:
+                # Missed events that already left the buffer can't be replayed
+                if self._replay and self._replay[0]["id"] > last_event_id + 1:
+                    sub.overflowed = True
+                for event in self._replay:
+                    if event["id"] > last_event_id:
+                        sub.offer(event)
+            self._subscriptions.add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        """Remove a subscription."""
+        with self._lock:
+            self._subscriptions.discard(sub)
+
+    def stats(self) -> dict:
+        """Get bus statistics.
+
+        Returns:
+            Dict with last_event_id, listeners, subscribers and replay_size.
+        """
+        with self._lock:
+            return {
+                "last_event_id": self._seq,
+                "listeners": len(self._listeners),
+                "subscribers": len(self._subscriptions),
+                "replay_size": len(self._replay),
+            }
+
+
+def get_incident_bus() -> IncidentBus:
+    """Get the process-wide incident bus.
+
+    Returns:
+        Shared IncidentBus instance.
+    """
+    global _bus
+
+    if _bus is None:
+        with _bus_lock:
+            if _bus is None:
+                _bus = IncidentBus(replay_size=settings.STREAM_REPLAY_SIZE)
+
+    return _bus
+
+
+def publish_incident_event(event_type: str, **fields) -> None:
+    """Publish to the shared bus without letting a failure break the write.
+
+    Args:
+        event_type: One of the event type constants.
+        **fields: Event fields (see IncidentBus.publish()).
+    """
+    try:
+        get_incident_bus().publish(event_type, **fields)
+    except Exception as e:
+        _logger.error(f"Failed to publish {event_type}: {e}")
@@ -0,0 +1,98 @@
+"""Subscription filters for the live incident stream in RESPOND.
+
+Mirrors the filters of IncidentSearchRequest for events on the bus. An
+incident that matched once stays visible to the subscriber, so later
+reinforcement/status deltas for it are delivered even if they don't carry
+the fields the filter looks at.
+"""
+
+import time
+from collections import OrderedDict
+
+from src.memory.similarity import cosine_similarity
+from src.utils.geo_utils import haversine_km
+
+# Incident ids remembered per subscriber for follow-up deltas
+SEEN_LIMIT = 10000
+
+
+class StreamFilter:
+    """Stateful per-subscriber event predicate."""
+
+    def __init__(
+        self,
+        zone_id: str | None = None,
+        urgency: str | None = None,
+        status: str | None = None,
+        last_hours: int | None = None,
+        center: dict | None = None,
+        radius_km: float | None = None,
+        query_vector: list[float] | None = None,
+        min_score: float = 0.5,
+    ):
+        self._zone_id = zone_id
+        self._urgency = urgency
+        self._status = status
+        self._last_hours = last_hours
+        self._center = center if center is not None and radius_km is not None else None
+        self._radius_km = radius_km
+        self._query_vector = query_vector
+        self._min_score = min_score
+        self._seen: OrderedDict[str, None] = OrderedDict()
+
+    def __call__(self, event: dict) -> bool:
+        """Check whether a bus event should be sent to this subscriber."""
+        incident_id = event.get("incident_id")
+
+        if incident_id is not None and incident_id in self._seen:
+            self._seen.move_to_end(incident_id)
+            return True
+
+        if not self._matches(event):
+            return False
+
+        if incident_id is not None:
+            self._seen[incident_id] = None
+            if len(self._seen) > SEEN_LIMIT:
+                self._seen.popitem(last=False)
+        return True
+
+    def _matches(self, event: dict) -> bool:
+        """Evaluate the filters on the fields the event carries.
+
+        Fields an event doesn't carry don't reject it, except that a
+        semantic query needs the incident vector.
+        """
+        fields = {**(event.get("payload") or {}), **(event.get("changes") or {})}
+        if event.get("zone_id") is not None:
+            fields.setdefault("zone_id", event["zone_id"])
+
+        for key, wanted in (
+            ("zone_id", self._zone_id),
+            ("urgency", self._urgency),
+            ("status", self._status),
+        ):
+            if wanted is not None and key in fields and fields[key] != wanted:
+                return False
+
+        timestamp_unix = fields.get("timestamp_unix")
+        if self._last_hours is not None and timestamp_unix is not None:
+            if timestamp_unix < time.time() - self._last_hours * 3600:
+                return False
+
+        location = fields.get("location")
+        if self._center is not None and location:
+            distance = haversine_km(
+                self._center["lat"], self._center["lon"], location["lat"], location["lon"],
+            )
+            if distance > self._radius_km:
+                return False
+
+        if self._query_vector is not None:
+            vector = event.get("vector")
+            if vector is None:
+                return False
+            if cosine_similarity(self._query_vector, vector) < self._min_score:
+                return False
+
+        return True
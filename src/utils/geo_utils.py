@@ -1,5 +1,9 @@
 """Geo utilities for RESPOND."""
 
+import math
+
+EARTH_RADIUS_KM = 6371.0088
+
 
 def km_to_meters(km: float) -> float:
     """Convert kilometers to meters."""
@@ -30,3 +34,22 @@ def normalize_location(lat: float, lon: float) -> dict:
         Dict with 'lat' and 'lon' keys as floats.
     """
     return {"lat": float(lat), "lon": float(lon)}
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points.
+    
+    Args:
+        lat1: Latitude of the first point.
+        lon1: Longitude of the first point.
+        lat2: Latitude of the second point.
+        lon2: Longitude of the second point.
+    
+    Returns:
+        Distance in kilometers.
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
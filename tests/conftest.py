@@ -0,0 +1,34 @@
+"""Shared fixtures for RESPOND tests.
+
+Tests run against the embedded in-memory Qdrant, so no server is needed.
+"""
+
+import os
+
+os.environ["QDRANT_MODE"] = "memory"
+
+import pytest
+
+from src.ingestion.dedup_index import reset_dedup_index
+from src.qdrant.client import get_qdrant_client
+from src.qdrant.collections import ALL_COLLECTIONS, setup_all_collections
+from src.qdrant.write_buffer import flush_payload_writes
+from src.search.geo_search import reset_geo_index
+from src.search.result_cache import invalidate_search_cache
+from src.search.temporal_search import reset_temporal_index
+
+
+@pytest.fixture
+def qdrant():
+    """Empty collections in the in-process Qdrant (like DELETE /reset)."""
+    client = get_qdrant_client()
+    for name in ALL_COLLECTIONS:
+        if client.collection_exists(name):
+            client.delete_collection(name)
+    setup_all_collections()
+    invalidate_search_cache()
+    reset_geo_index()
+    reset_temporal_index()
+    reset_dedup_index()
+    yield client
+    flush_payload_writes()
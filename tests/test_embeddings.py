@@ -0,0 +1,104 @@
+"""Tests for RESPOND embeddings."""
+
+import numpy as np
+import pytest
+
+from src.embeddings.batcher import MicroBatcher
+from src.embeddings.cache import DiskEmbeddingTier, EmbeddingCache, cache_key
+
+
+def test_batcher_resolves_each_caller_with_its_vector():
+    """Texts embedded together come back to the caller that submitted them."""
+    batcher = MicroBatcher(lambda texts: [[float(len(t))] for t in texts], max_wait_ms=20)
+
+    futures = [batcher.submit("x" * n) for n in range(1, 6)]
+
+    assert [f.result(timeout=5) for f in futures] == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+
+
+def test_batcher_fails_every_caller_on_short_result():
+    """A batch that returns too few vectors fails every caller instead of hanging."""
+    batcher = MicroBatcher(lambda texts: [[0.0]] * (len(texts) - 1), max_wait_ms=20)
+
+    futures = [batcher.submit(text) for text in ("a", "b", "c")]
+
+    for future in futures:
+        with pytest.raises(RuntimeError, match="vectors for"):
+            future.result(timeout=5)
+
+
+def test_cache_miss_and_hit_return_the_same_vector(tmp_path):
+    """The computing call gets the stored float32 values, like later hits."""
+    cache = EmbeddingCache(disk_dir=str(tmp_path))
+    original = [0.1, 1 / 3, 2 / 7]
+
+    computed = cache.get_or_compute_many("model", 3, ["flood"], lambda texts: [original])[0]
+    stored = cache.put("model", 3, "fire", original)
+
+    assert computed == cache.get("model", 3, "flood")
+    assert stored == cache.get("model", 3, "fire")
+    assert computed != original
+
+
+def test_cache_evicts_least_recently_used():
+    """Beyond max_entries the least recently used vector is dropped."""
+    cache = EmbeddingCache(max_entries=2)
+    cache.put("model", 1, "a", [1.0])
+    cache.put("model", 1, "b", [2.0])
+    assert cache.get("model", 1, "a") == [1.0]
+
+    cache.put("model", 1, "c", [3.0])
+
+    assert cache.get("model", 1, "b") is None
+    assert cache.get("model", 1, "a") == [1.0]
+    assert cache.get("model", 1, "c") == [3.0]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["size"]) == (3, 1, 1, 2)
+
+
+def test_cache_keys_by_model_and_normalized_text():
+    """Whitespace differences hit the same entry; other models do not."""
+    cache = EmbeddingCache()
+    cache.put("model", 1, "  bridge   collapse ", [1.0])
+
+    assert cache.get("model", 1, "bridge collapse") == [1.0]
+    assert cache.get("other", 1, "bridge collapse") is None
+
+
+def test_cache_computes_each_distinct_miss_once():
+    """A batch with repeats and hits computes only its distinct misses."""
+    cache = EmbeddingCache()
+    cache.put("model", 1, "a", [1.0])
+    computed = []
+
+    def compute(texts):
+        computed.extend(texts)
+        return [[float(len(t))] for t in texts]
+
+    vectors = cache.get_or_compute_many("model", 1, ["a", "bb", "bb", "ccc"], compute)
+
+    assert vectors == [[1.0], [2.0], [2.0], [3.0]]
+    assert computed == ["bb", "ccc"]
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    """Flushed vectors are read back by a new cache over the same directory."""
+    cache = EmbeddingCache(disk_dir=str(tmp_path), disk_slots=64)
+    stored = cache.put("model", 3, "fire", [0.5, 0.25, 0.125])
+    cache.flush()
+
+    restarted = EmbeddingCache(disk_dir=str(tmp_path), disk_slots=64)
+
+    assert restarted.get("model", 3, "fire") == stored
+    assert restarted.stats()["disk_hits"] == 1
+
+
+def test_disk_tier_slot_holds_newest_key(tmp_path):
+    """A key evicted from its direct-mapped slot reads as a miss, not a wrong vector."""
+    tier = DiskEmbeddingTier(tmp_path / "tier.mmap", dim=2, slots=1)
+    first, second = cache_key("model", "a"), cache_key("model", "b")
+    tier.put(first, np.array([1.0, 2.0]))
+    tier.put(second, np.array([3.0, 4.0]))
+
+    assert tier.get(first) is None
+    assert tier.get(second).tolist() == [3.0, 4.0]
@@ -0,0 +1,108 @@
+"""Tests for RESPOND incident ingestion."""
+
+import hashlib
+import threading
+
+import numpy as np
+import pytest
+
+from config.qdrant_config import SITUATION_REPORTS
+from config.settings import settings
+from src.embeddings.text_embedder import TextEmbedder
+from src.ingestion.incident_ingester import IncidentIngester
+from src.ingestion.smart_ingester import SmartIncidentIngester
+from src.qdrant.points import scroll_all
+from src.search.hybrid_search import HybridSearcher
+
+REPORT = {
+    "text": "Building collapse on Market Street, people trapped",
+    "source_type": "call",
+    "zone_id": "zone_a",
+}
+
+
+def _incidents() -> list[dict]:
+    """All stored incidents."""
+    return list(scroll_all(SITUATION_REPORTS))
+
+
+@pytest.mark.parametrize("index_enabled", [True, False])
+def test_concurrent_identical_reports_make_one_incident(qdrant, monkeypatch, index_enabled):
+    """N simultaneous copies of a report give one incident reinforced N-1 times."""
+    monkeypatch.setattr(settings, "DEDUP_INDEX_ENABLED", index_enabled)
+    monkeypatch.setattr(settings, "SEARCH_CACHE_ENABLED", False)
+    count = 12
+    ingester = SmartIncidentIngester()
+    barrier = threading.Barrier(count)
+    outcomes = [None] * count
+
+    def worker(i):
+        barrier.wait()
+        try:
+            outcomes[i] = ingester.ingest(dict(REPORT))
+        except Exception as e:
+            outcomes[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not [o for o in outcomes if isinstance(o, Exception)]
+    incidents = _incidents()
+    assert len(incidents) == 1
+    assert {o["incident_id"] for o in outcomes} == {incidents[0]["id"]}
+    assert sum(not o["deduplicated"] for o in outcomes) == 1
+    assert incidents[0]["payload"]["reinforced_count"] == count - 1
+
+
+@pytest.fixture
+def distinct_embeddings(monkeypatch):
+    """Random unit vectors per text, so different reports are dissimilar."""
+    def embed_text(self, text):
+        seed = int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "big")
+        vector = np.random.default_rng(seed).normal(size=settings.DEFAULT_VECTOR_SIZE)
+        return (vector / np.linalg.norm(vector)).tolist()
+
+    monkeypatch.setattr(TextEmbedder, "embed_text", embed_text)
+    monkeypatch.setattr(TextEmbedder, "embed_texts", lambda self, texts: [embed_text(self, t) for t in texts])
+
+
+def test_batch_misses_use_one_search_and_one_write(qdrant, monkeypatch, distinct_embeddings):
+    """Reports missing the index are searched and created in batches."""
+    monkeypatch.setattr(settings, "DEDUP_INDEX_ENABLED", False)
+    existing = IncidentIngester().ingest(dict(REPORT))
+    ingester = SmartIncidentIngester()
+    calls = {"search": 0, "search_one": 0, "write": 0}
+    search_batch = ingester._searcher.search_incidents_batch
+    ingest_many = ingester._basic_ingester.ingest_many
+
+    def counting_search_batch(queries):
+        calls["search"] += 1
+        return search_batch(queries)
+
+    def counting_search(*args, **kwargs):
+        calls["search_one"] += 1
+        return HybridSearcher.search_incidents(ingester._searcher, *args, **kwargs)
+
+    def counting_ingest_many(items):
+        calls["write"] += 1
+        return ingest_many(items)
+
+    monkeypatch.setattr(ingester._searcher, "search_incidents_batch", counting_search_batch)
+    monkeypatch.setattr(ingester._searcher, "search_incidents", counting_search)
+    monkeypatch.setattr(ingester._basic_ingester, "ingest_many", counting_ingest_many)
+    reports = [
+        dict(REPORT),
+        {**REPORT, "text": "Wildfire spreading toward the northern highway"},
+        {**REPORT, "text": "Water main burst flooding the subway entrance"},
+        {**REPORT, "text": "Chemical spill at the port, strong fumes reported"},
+    ]
+
+    results = ingester.ingest_many(reports)
+
+    assert [r["status"] for r in results] == ["deduplicated", "created", "created", "created"]
+    assert results[0]["incident_id"] == existing
+    assert calls == {"search": 1, "search_one": 0, "write": 1}
+    assert len(_incidents()) == 4
@@ -0,0 +1,148 @@
+"""Tests for RESPOND incident memory (reinforcement writes)."""
+
+import threading
+import time
+import uuid
+
+import numpy as np
+import pytest
+from qdrant_client import models
+
+from config.qdrant_config import SITUATION_REPORTS
+from config.settings import settings
+from src.evidence.store import get_evidence_page
+from src.ingestion.incident_ingester import IncidentIngester
+from src.memory import memory_manager
+from src.memory.combiner import WriteCombiner
+from src.memory.decay import apply_decay_batch, build_decay_formula
+from src.memory.memory_manager import MemoryManager
+from src.qdrant import write_buffer
+from src.qdrant.indexer import upsert_points
+from src.qdrant.points import VersionConflictError, get_version_conflicts
+
+TEXT = "Flooding on the river road, two cars stranded"
+
+
+def _run_concurrently(count, fn):
+    """Call fn(i) from `count` threads started together; return results or errors."""
+    barrier = threading.Barrier(count)
+    outcomes = [None] * count
+
+    def worker(i):
+        barrier.wait()
+        try:
+            outcomes[i] = fn(i)
+        except Exception as e:
+            outcomes[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+@pytest.mark.parametrize("combining", [True, False])
+def test_concurrent_reinforcements_all_land(qdrant, monkeypatch, combining):
+    """N concurrent reinforcements give N accepted entries with unique seqs."""
+    monkeypatch.setattr(settings, "REINFORCE_COMBINING", combining)
+    monkeypatch.setattr(settings, "REINFORCE_MAX_ATTEMPTS", 100)
+    count = 16
+    incident_id = IncidentIngester().ingest({"text": TEXT, "source_type": "call", "zone_id": "zone_a"})
+    manager = MemoryManager()
+
+    outcomes = _run_concurrently(count, lambda i: manager.reinforce(incident_id, "social", TEXT))
+
+    assert not [o for o in outcomes if isinstance(o, Exception)]
+    payload = manager.get_incident(incident_id)["payload"]
+    assert payload["reinforced_count"] == count
+    assert payload["evidence_summary"]["count"] == count
+    entries = get_evidence_page(incident_id, total=count, limit=count, newest_first=False)
+    assert [e["seq"] for e in entries] == list(range(count))
+
+
+def test_reinforce_raises_when_attempts_run_out(qdrant, monkeypatch):
+    """A write that keeps losing its version check gives up with VersionConflictError."""
+    monkeypatch.setattr(settings, "REINFORCE_MAX_ATTEMPTS", 3)
+    monkeypatch.setattr(settings, "REINFORCE_RETRY_BACKOFF_MS", 0.0)
+    monkeypatch.setattr(memory_manager, "compare_and_set_payload", lambda *args: None)
+    incident_id = IncidentIngester().ingest({"text": TEXT, "source_type": "call", "zone_id": "zone_a"})
+    conflicts = get_version_conflicts()
+
+    with pytest.raises(VersionConflictError):
+        MemoryManager().reinforce(incident_id, "social", TEXT)
+
+    # The first attempt is not a retry
+    assert get_version_conflicts() - conflicts == 2
+
+
+def test_leader_error_reaches_every_combined_caller():
+    """All callers combined into a failing write get its exception."""
+    combiner = WriteCombiner(window_ms=200)
+    calls = []
+
+    def apply_fn(key, items):
+        calls.append(len(items))
+        raise RuntimeError("write failed")
+
+    count = 8
+    outcomes = _run_concurrently(count, lambda i: combiner.submit("incident", [{"i": i}], apply_fn))
+
+    assert calls == [count]
+    assert all(isinstance(o, RuntimeError) and str(o) == "write failed" for o in outcomes)
+
+
+def test_evidence_is_stored_before_the_versioned_write(qdrant, monkeypatch):
+    """Each attempt stores its entries before the summary that counts them."""
+    incident_id = IncidentIngester().ingest({"text": TEXT, "source_type": "call", "zone_id": "zone_a"})
+    stored_at_write = []
+    compare_and_set = memory_manager.compare_and_set_payload
+
+    def checking_compare_and_set(collection, point_id, payload, current):
+        count = payload["evidence_summary"]["count"]
+        stored_at_write.append(len(get_evidence_page(incident_id, total=count, limit=count)))
+        return compare_and_set(collection, point_id, payload, current)
+
+    monkeypatch.setattr(memory_manager, "compare_and_set_payload", checking_compare_and_set)
+    MemoryManager().reinforce_batch(incident_id, [{"source_type": "social", "text": TEXT}] * 3)
+
+    assert stored_at_write == [3]
+
+
+@pytest.mark.parametrize("curve", ["exponential", "urgency"])
+def test_server_side_decay_matches_client_for_future_timestamps(qdrant, monkeypatch, curve):
+    """Incidents stamped in the future count as brand new on both sides."""
+    monkeypatch.setattr(settings, "DECAY_CURVE", curve)
+    now = int(time.time())
+    vector = [1.0] + [0.0] * (settings.DEFAULT_VECTOR_SIZE - 1)
+    stamps = [now + 3 * 3600, now, now - 3 * 3600]
+    upsert_points(SITUATION_REPORTS, [
+        (str(uuid.uuid4()), vector, {"timestamp_unix": stamp, "urgency": "high"})
+        for stamp in stamps
+    ])
+
+    response = qdrant.query_points(
+        SITUATION_REPORTS,
+        prefetch=models.Prefetch(query=vector, limit=10),
+        query=build_decay_formula(now),
+        with_payload=True,
+    )
+    server = {p.payload["timestamp_unix"]: p.score for p in response.points}
+    client = apply_decay_batch([1.0] * 3, stamps, ["high"] * 3, now_unix=now)["final_scores"]
+
+    assert np.allclose([server[stamp] for stamp in stamps], client, atol=1e-5)
+
+
+def test_status_update_is_written_before_returning(qdrant, monkeypatch):
+    """Status changes skip the write buffer even when it is enabled."""
+    monkeypatch.setattr(settings, "PAYLOAD_WRITE_BUFFER_ENABLED", True)
+    buffer = write_buffer.PayloadWriteBuffer(flush_interval_ms=3_600_000, max_points=10_000)
+    monkeypatch.setattr(write_buffer, "_buffer", buffer)
+    incident_id = IncidentIngester().ingest({"text": TEXT, "source_type": "call", "zone_id": "zone_a"})
+
+    assert MemoryManager().update_incident_payload(incident_id, {"status": "acknowledged"}, zone_id="zone_a")
+
+    stored = qdrant.retrieve(SITUATION_REPORTS, ids=[incident_id], with_payload=True)[0].payload
+    assert stored["status"] == "acknowledged"
+    assert buffer.stats()["pending"] == 0
@@ -0,0 +1,80 @@
+"""Tests for RESPOND Qdrant point helpers."""
+
+import uuid
+
+from config.qdrant_config import SITUATION_REPORTS
+from config.settings import settings
+from src.qdrant.indexer import upsert_points
+from src.qdrant.points import (
+    VERSION_KEY,
+    VERSION_WRITERS_KEY,
+    VERSION_WRITERS_KEPT,
+    compare_and_set_payload,
+    retrieve,
+)
+
+
+def _add_point(payload: dict) -> str:
+    """Store a point with the given payload and return its ID."""
+    point_id = str(uuid.uuid4())
+    upsert_points(SITUATION_REPORTS, [(point_id, [0.1] * settings.DEFAULT_VECTOR_SIZE, payload)])
+    return point_id
+
+
+def _payload(point_id: str) -> dict:
+    """Read a point's current payload."""
+    return retrieve(SITUATION_REPORTS, [point_id])[0]["payload"]
+
+
+def test_compare_and_set_applies_at_current_version(qdrant):
+    """A write computed from the current payload lands and bumps the version."""
+    point_id = _add_point({"status": "pending", VERSION_KEY: 0})
+
+    version = compare_and_set_payload(
+        SITUATION_REPORTS, point_id, {"status": "acknowledged"}, _payload(point_id)
+    )
+
+    assert version == 1
+    payload = _payload(point_id)
+    assert payload["status"] == "acknowledged"
+    assert payload[VERSION_KEY] == 1
+    assert len(payload[VERSION_WRITERS_KEY]) == 1
+
+
+def test_compare_and_set_rejects_stale_snapshot(qdrant):
+    """A write computed from an outdated payload is filtered out and reported."""
+    point_id = _add_point({"status": "pending", VERSION_KEY: 0})
+    stale = _payload(point_id)
+    assert compare_and_set_payload(SITUATION_REPORTS, point_id, {"status": "acknowledged"}, stale) == 1
+
+    version = compare_and_set_payload(SITUATION_REPORTS, point_id, {"status": "resolved"}, stale)
+
+    assert version is None
+    payload = _payload(point_id)
+    assert payload["status"] == "acknowledged"
+    assert payload[VERSION_KEY] == 1
+
+
+def test_compare_and_set_treats_missing_version_as_zero(qdrant):
+    """Points written before versioning match version 0."""
+    point_id = _add_point({"status": "pending"})
+
+    version = compare_and_set_payload(
+        SITUATION_REPORTS, point_id, {"status": "resolved"}, _payload(point_id)
+    )
+
+    assert version == 1
+    assert _payload(point_id)["status"] == "resolved"
+
+
+def test_compare_and_set_keeps_recent_writer_ids(qdrant):
+    """Only the last VERSION_WRITERS_KEPT write IDs are kept."""
+    point_id = _add_point({VERSION_KEY: 0})
+    writes = VERSION_WRITERS_KEPT + 3
+
+    for i in range(writes):
+        assert compare_and_set_payload(SITUATION_REPORTS, point_id, {"n": i}, _payload(point_id)) == i + 1
+
+    payload = _payload(point_id)
+    assert payload[VERSION_KEY] == writes
+    assert len(payload[VERSION_WRITERS_KEY]) == VERSION_WRITERS_KEPT
@@ -0,0 +1,278 @@
+"""Tests for RESPOND incident search."""
+
+import time
+import uuid
+
+import numpy as np
+import pytest
+
+from config.qdrant_config import SITUATION_REPORTS
+from config.settings import settings
+from src.ingestion.incident_ingester import IncidentIngester
+from src.memory.memory_manager import MemoryManager
+from src.qdrant import write_buffer
+from src.qdrant.indexer import upsert_points
+from src.qdrant.searcher import search
+from src.search.filters import build_search_filter, get_filter_plan_stats, time_cutoff
+from src.search.geo_search import GeoIndex, _haversine_np
+from src.search.hybrid_search import HybridSearcher, get_rerank_stats
+from src.search.temporal_search import TemporalIndex
+from src.stream.bus import INCIDENT_CREATED
+
+
+def _vector_with_similarity(query: np.ndarray, similarity: float, rng) -> list[float]:
+    """Unit vector whose cosine similarity to the unit query is `similarity`."""
+    noise = rng.normal(size=query.shape)
+    noise -= noise.dot(query) * query
+    noise /= np.linalg.norm(noise)
+    return (similarity * query + np.sqrt(1 - similarity ** 2) * noise).tolist()
+
+
+def _add_incidents(query, similarities, ages, rng, now_unix, label="incident"):
+    """Store incidents with given similarity to the query and age in seconds."""
+    points = [
+        (
+            str(uuid.uuid4()),
+            _vector_with_similarity(query, similarity, rng),
+            {
+                "text": f"{label} {i}",
+                "timestamp_unix": int(now_unix - age),
+                "zone_id": "zone_a",
+                "urgency": "medium",
+                "status": "pending",
+            },
+        )
+        for i, (similarity, age) in enumerate(zip(similarities, ages))
+    ]
+    upsert_points(SITUATION_REPORTS, points)
+
+
+@pytest.fixture
+def searcher(qdrant, monkeypatch):
+    """HybridSearcher with a fixed query vector and no result cache."""
+    monkeypatch.setattr(settings, "SEARCH_CACHE_ENABLED", False)
+    monkeypatch.setattr(settings, "DECAY_SERVER_SIDE", False)
+    monkeypatch.setattr(settings, "DECAY_CURVE", "exponential")
+    rng = np.random.default_rng(7)
+    query = rng.normal(size=settings.DEFAULT_VECTOR_SIZE)
+    query /= np.linalg.norm(query)
+    hybrid = HybridSearcher()
+    monkeypatch.setattr(hybrid._embedder, "embed_text", lambda text: query.tolist())
+    return hybrid, query, rng
+
+
+def _exhaustive_top(query, limit):
+    """Decayed top-k over every stored incident."""
+    hits = search(SITUATION_REPORTS, query.tolist(), limit=10_000)
+    return HybridSearcher()._rerank(hits, int(time.time()), limit=limit)
+
+
+def test_typical_query_stops_after_first_round(searcher):
+    """A few strong matches over a weak background need no widening."""
+    hybrid, query, rng = searcher
+    now = time.time()
+    _add_incidents(query, rng.uniform(0.8, 0.9, 10), rng.uniform(0, 6 * 3600, 10), rng, now)
+    _add_incidents(query, rng.uniform(0.0, 0.3, 1000), rng.uniform(0, 86400, 1000), rng, now)
+
+    before = get_rerank_stats()
+    results = hybrid.search_incidents("bridge collapse", limit=10)
+    after = get_rerank_stats()
+
+    assert after["widen_rounds"] == before["widen_rounds"]
+    assert after["candidates_fetched"] - before["candidates_fetched"] == 30
+    assert [r["id"] for r in results] == [r["id"] for r in _exhaustive_top(query, 10)]
+
+
+def test_widening_finds_fresh_less_similar_incident(searcher):
+    """A fresh incident below the first round's similarities still ranks first."""
+    hybrid, query, rng = searcher
+    now = time.time()
+    _add_incidents(query, rng.uniform(0.85, 0.95, 200), [20 * 3600] * 200, rng, now)
+    _add_incidents(query, [0.5], [60], rng, now, label="fresh")
+
+    before = get_rerank_stats()
+    results = hybrid.search_incidents("bridge collapse", limit=10)
+    after = get_rerank_stats()
+
+    assert results[0]["payload"]["text"] == "fresh 0"
+    assert after["widen_rounds"] > before["widen_rounds"]
+    # The fresh window excludes the old incidents instead of fetching them all
+    assert after["candidates_fetched"] - before["candidates_fetched"] < 100
+    assert [r["id"] for r in results] == [r["id"] for r in _exhaustive_top(query, 10)]
+
+
+@pytest.fixture
+def buffered(qdrant, monkeypatch):
+    """Write buffer that only flushes when asked to, with the result cache on."""
+    monkeypatch.setattr(settings, "SEARCH_CACHE_ENABLED", True)
+    monkeypatch.setattr(settings, "PAYLOAD_WRITE_BUFFER_ENABLED", True)
+    buffer = write_buffer.PayloadWriteBuffer(flush_interval_ms=3_600_000, max_points=10_000)
+    monkeypatch.setattr(write_buffer, "_buffer", buffer)
+    return buffer
+
+
+def test_cached_search_sees_status_after_flush(buffered):
+    """A search cached inside the flush window is dropped once the update is written."""
+    text = "Gas leak reported near the primary school"
+    incident_id = IncidentIngester().ingest({"text": text, "source_type": "call", "zone_id": "zone_a"})
+    MemoryManager().update_incident_payload(
+        incident_id, {"status": "acknowledged"}, zone_id="zone_a", buffered=True
+    )
+    hybrid = HybridSearcher()
+
+    before_flush = hybrid.search_incidents(text, zone_id="zone_a")
+    assert buffered.flush() == 1
+    after_flush = hybrid.search_incidents(text, zone_id="zone_a")
+
+    assert before_flush[0]["payload"]["status"] == "acknowledged"
+    assert after_flush[0]["id"] == incident_id
+    assert after_flush[0]["payload"]["status"] == "acknowledged"
+
+
+def test_status_filter_sees_buffered_status(buffered):
+    """Status-filtered searches match the buffered status, not the stored one."""
+    text = "Gas leak reported near the primary school"
+    incident_id = IncidentIngester().ingest({"text": text, "source_type": "call", "zone_id": "zone_a"})
+    MemoryManager().update_incident_payload(
+        incident_id, {"status": "acknowledged"}, zone_id="zone_a", buffered=True
+    )
+    hybrid = HybridSearcher()
+
+    pending = hybrid.search_incidents(text, zone_id="zone_a", status="pending")
+    acknowledged = hybrid.search_incidents(text, zone_id="zone_a", status="acknowledged")
+
+    assert incident_id not in [r["id"] for r in pending]
+    assert [r["id"] for r in acknowledged] == [incident_id]
+
+
+def test_changes_since_reports_trimmed_journal():
+    """Polling from before the oldest kept change is flagged incomplete."""
+    index = TemporalIndex(max_changes=3)
+    now = time.time()
+    for i in range(5):
+        index.handle_event({
+            "type": INCIDENT_CREATED,
+            "incident_id": f"incident-{i}",
+            "zone_id": "zone_a",
+            "timestamp": now + i,
+            "payload": {"zone_id": "zone_a", "urgency": "high", "timestamp_unix": int(now)},
+        })
+
+    trimmed = index.changes_since(now)
+    kept = index.changes_since(now + 1)
+
+    assert index.stats()["changes"] == 3
+    assert not trimmed["complete"]
+    assert [c["incident_id"] for c in trimmed["changes"]] == ["incident-2", "incident-3", "incident-4"]
+    assert kept["complete"]
+
+
+def _random_geo_index(rng, count=3000):
+    """GeoIndex with a dense city cluster, a cluster on the antimeridian and sparse points."""
+    lats = np.concatenate([
+        rng.uniform(28.4, 28.9, count // 3),
+        rng.uniform(-18.5, -17.5, count // 3),
+        rng.uniform(-80, 80, count - 2 * (count // 3)),
+    ])
+    lons = np.concatenate([
+        rng.uniform(76.9, 77.5, count // 3),
+        (rng.uniform(179.0, 181.0, count // 3) + 180) % 360 - 180,
+        rng.uniform(-180, 180, count - 2 * (count // 3)),
+    ])
+    urgencies = rng.choice(["critical", "high", "medium", "low"], count)
+    index = GeoIndex(cell_deg=0.05)
+    for i, (lat, lon, urgency) in enumerate(zip(lats, lons, urgencies)):
+        index.upsert(f"p{i}", {
+            "location": {"lat": float(lat), "lon": float(lon)},
+            "urgency": str(urgency),
+            "zone_id": "zone_a",
+        })
+    return index, lats, lons, urgencies
+
+
+@pytest.mark.parametrize("lat, lon", [
+    (28.6, 77.2),      # inside the dense cluster
+    (-18.0, 179.99),   # antimeridian, east side
+    (-18.0, -179.99),  # antimeridian, west side
+    (-17.9, 180.0),
+    (5.0, -30.0),      # open ocean, sparse neighbourhood
+    (79.5, 120.0),     # high latitude
+])
+def test_geo_nearest_matches_brute_force(lat, lon):
+    """Ring search returns the same k nearest as a scan of every point."""
+    rng = np.random.default_rng(11)
+    index, lats, lons, urgencies = _random_geo_index(rng)
+    distances = _haversine_np(lat, lon, lats, lons)
+
+    for k, urgency in [(1, None), (25, None), (10, "critical")]:
+        mask = np.ones(len(lats), bool) if urgency is None else urgencies == urgency
+        expected = np.sort(distances[mask])[:k]
+
+        results = index.nearest(lat, lon, k=k, urgency=urgency)
+
+        assert np.allclose([r["distance_km"] for r in results], expected, atol=1e-3)
+        if urgency is not None:
+            assert {r["urgency"] for r in results} == {urgency}
+
+
+def test_geo_nearest_crosses_antimeridian():
+    """A point just across ±180° beats a farther one on the same side."""
+    index = GeoIndex(cell_deg=0.05)
+    index.upsert("west", {"location": {"lat": 0.0, "lon": -179.99}})
+    index.upsert("east", {"location": {"lat": 0.0, "lon": 179.5}})
+
+    results = index.nearest(0.0, 179.99, k=2)
+
+    assert [r["id"] for r in results] == ["west", "east"]
+    assert results[0]["distance_km"] < 3
+
+
+def test_geo_nearest_respects_max_radius():
+    """Points beyond max_radius_km are left out even when fewer than k remain."""
+    rng = np.random.default_rng(3)
+    index, lats, lons, _ = _random_geo_index(rng, count=900)
+    distances = _haversine_np(28.6, 77.2, lats, lons)
+
+    results = index.nearest(28.6, 77.2, k=500, max_radius_km=5.0)
+
+    assert len(results) == int((distances <= 5.0).sum())
+    assert all(r["distance_km"] <= 5.0 for r in results)
+
+
+def test_equivalent_filters_share_one_plan():
+    """Argument order, duplicates and single values vs lists compile to one Filter."""
+    first = build_search_filter(zone_id=["zone_b", "zone_a"], urgency="high", status=["pending"])
+    before = get_filter_plan_stats()
+    second = build_search_filter(status="pending", urgency=["high", "high"], zone_id=["zone_a", "zone_b"])
+    after = get_filter_plan_stats()
+
+    assert second is first
+    assert after["plan_hits"] == before["plan_hits"] + 1
+    assert after["plan_misses"] == before["plan_misses"]
+    zone = next(c for c in first.must if c.key == "zone_id")
+    assert zone.match.any == ["zone_a", "zone_b"]
+
+
+def test_filter_without_conditions_is_none():
+    """No filter arguments (or empty lists) means no Filter at all."""
+    assert build_search_filter() is None
+    assert build_search_filter(zone_id=[]) is None
+
+
+def test_time_cutoff_is_quantized(monkeypatch):
+    """Cutoffs round down to the quantum, so plans are reused within it."""
+    monkeypatch.setattr(settings, "FILTER_TIME_QUANTUM_SECONDS", 60)
+    base = 1_700_000_040  # a multiple of 60
+
+    assert time_cutoff(2, base + 7200) == base
+    assert time_cutoff(2, base + 7200 + 59) == base
+    assert time_cutoff(2, base + 7200 + 60) == base + 60
+    assert time_cutoff(None) is None
+
+    first = build_search_filter(zone_id="zone_a", last_hours=2, now_unix=base + 7200 + 5)
+    second = build_search_filter(zone_id="zone_a", last_hours=2, now_unix=base + 7200 + 50)
+    third = build_search_filter(zone_id="zone_a", last_hours=2, now_unix=base + 7200 + 65)
+    assert second is first
+    assert third is not first
+    window = next(c for c in first.must if c.key == "timestamp_unix")
+    assert window.range.gte == base